@@ -0,0 +1,80 @@
+"""Measures the overhead of `FishBowl.dispatch()`.
+
+Each event is dispatched repeatedly to handlers doing nothing, with its
+hooks either merged from the local and global hooks on every dispatch,
+or read from the fish bowl's cached dispatch table. The fastest of
+several repeats is reported to reduce noise from the rest of the system.
+
+Usage::
+
+    python benchmarks/bench_dispatch.py --dispatches 100000
+"""
+
+import argparse
+import timeit
+
+import rich
+from rich.table import Table
+
+from sardine_core import BaseHandler, FishBowl
+
+
+class _NullHandler(BaseHandler):
+    def __init__(self, event):
+        super().__init__()
+        self.event = event
+
+    def setup(self):
+        self.register(self.event)
+
+    def hook(self, event: str, *args):
+        pass
+
+
+def _merged_dispatch(bowl: FishBowl, event: str, *args):
+    """Dispatches an event by merging its hooks on every call."""
+    empty_dict = {}
+    local_hooks = bowl._event_hooks.get(event, empty_dict)
+    global_hooks = bowl._event_hooks.get(None, empty_dict)
+    bowl._run_hooks(local_hooks | global_hooks, event, *args)
+
+
+def bench(n_local: int, n_global: int, dispatches: int) -> tuple[str, str]:
+    bowl = FishBowl()
+    for _ in range(n_local):
+        bowl.add_handler(_NullHandler("bench"))
+    for _ in range(n_global):
+        bowl.add_handler(_NullHandler(None))
+
+    results = []
+    for dispatch in (
+        lambda: _merged_dispatch(bowl, "bench", 1.0),
+        lambda: bowl.dispatch("bench", 1.0),
+    ):
+        elapsed = min(timeit.repeat(dispatch, number=dispatches, repeat=5))
+        results.append(elapsed / dispatches)
+
+    return tuple(f"{r * 1e9:,.0f} ns" for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dispatches", type=int, default=100_000)
+    args = parser.parse_args()
+
+    table = Table(
+        "Local hooks",
+        "Global hooks",
+        "Merged per dispatch",
+        "Dispatch table",
+        title=f"{args.dispatches:,} dispatches",
+    )
+    for n_local, n_global in ((0, 0), (1, 0), (1, 1), (5, 2), (20, 2)):
+        table.add_row(
+            str(n_local), str(n_global), *bench(n_local, n_global, args.dispatches)
+        )
+    rich.print(table)
+
+
+if __name__ == "__main__":
+    main()
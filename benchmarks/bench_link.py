@@ -0,0 +1,117 @@
+"""Measures how much the `LinkClock` capture thread costs the event loop.
+
+The capture thread holds the GIL while it captures the Link session,
+which the event loop has to wait for. This runs a CPU-bound workload on
+the event loop for a fixed duration and reports how much work it got
+done, along with the CPU time spent by the capture thread. Each clock is
+measured while idle, and while runners repeatedly sleep on it.
+
+Usage::
+
+    python benchmarks/bench_link.py --duration 3 --sleepers 20
+"""
+
+import argparse
+import asyncio
+import time
+
+import rich
+from rich.table import Table
+
+from sardine_core import FishBowl, LinkClock
+from sardine_core.logger import logger
+
+
+class _MeasuredLinkClock(LinkClock):
+    """A Link clock recording the CPU time and captures of its thread."""
+
+    captures = 0
+    thread_cpu = 0.0
+
+    def before_loop(self):
+        self._thread_start = time.thread_time()
+        super().before_loop()
+
+    def loop(self):
+        self.captures += 1
+        super().loop()
+
+    def after_loop(self):
+        super().after_loop()
+        self.thread_cpu = time.thread_time() - self._thread_start
+
+
+async def _work(end: float) -> int:
+    """Does small chunks of pure Python work until the given time."""
+    chunks = 0
+    while time.perf_counter() < end:
+        sum(range(2000))
+        chunks += 1
+        if chunks % 100 == 0:
+            await asyncio.sleep(0)
+    return chunks
+
+
+async def _sleep_loop(bowl: FishBowl, end: float):
+    while time.perf_counter() < end:
+        await bowl.sleep(0.005)
+
+
+async def bench(clock: _MeasuredLinkClock, n_sleepers: int, duration: float):
+    bowl = FishBowl(clock=clock)
+    bowl.start()
+    await asyncio.sleep(0.1)  # Let the Link session start
+
+    end = time.perf_counter() + duration
+    chunks, *_ = await asyncio.gather(
+        _work(end),
+        *(_sleep_loop(bowl, end) for _ in range(n_sleepers)),
+    )
+    bowl.stop()
+    await asyncio.sleep(0.1)  # Let the capture thread exit
+
+    return (
+        f"{clock.captures / duration:,.0f}",
+        f"{clock.thread_cpu * 1000:.1f} ms",
+        f"{chunks / duration:,.0f}",
+    )
+
+
+async def run(n_sleepers: int, duration: float):
+    # Runners announce themselves on start/stop, which would drown the results
+    logger.terminal_console.quiet = True
+
+    table = Table(
+        "Capture",
+        "Sleepers",
+        "Captures/s",
+        "Thread CPU",
+        "Work/s",
+        title=f"{duration}s per run",
+    )
+    clocks = (
+        ("every 1 ms", lambda: _MeasuredLinkClock(idle_interval=0.001)),
+        ("adaptive", _MeasuredLinkClock),
+    )
+    for sleepers in (0, n_sleepers):
+        for name, factory in clocks:
+            table.add_row(
+                name, str(sleepers), *await bench(factory(), sleepers, duration)
+            )
+        table.add_section()
+
+    logger.terminal_console.quiet = False
+    rich.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sleepers", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sleepers, args.duration))
+
+
+if __name__ == "__main__":
+    main()
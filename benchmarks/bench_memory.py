@@ -0,0 +1,93 @@
+"""Measures the memory held and churned by many concurrent runners.
+
+Every runner swims a trivial function at a fixed period. The retained
+memory is measured once all runners started, and the peak memory while
+they run shows how much is allocated by each iteration on top of that.
+
+Usage::
+
+    python benchmarks/bench_memory.py --runners 500 --period 0.25
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+import rich
+from rich.table import Table
+
+from sardine_core import AsyncRunner, FishBowl, InternalClock
+from sardine_core.logger import logger
+
+
+def _make_function(runner: AsyncRunner, counter: list[int]):
+    def func(p=0.25):
+        counter[0] += 1
+        runner.update_state(p=p)
+        runner.swim()
+
+    return func
+
+
+async def bench(n_runners: int, period: float, tempo: float, duration: float):
+    # Runners announce themselves on start/stop, which would drown the results
+    logger.terminal_console.quiet = True
+
+    bowl = FishBowl(clock=InternalClock(tempo=tempo))
+    bowl.start()
+
+    # Run a first runner so that lazy imports and caches are not measured
+    counter = [0]
+    runner = AsyncRunner("warmup")
+    runner.push(_make_function(runner, counter), p=period)
+    bowl.scheduler.start_runner(runner)
+    await asyncio.sleep(period * bowl.clock.beat_duration * 2)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    for i in range(n_runners):
+        runner = AsyncRunner(f"bench_{i}")
+        runner.push(_make_function(runner, counter), p=period)
+        bowl.scheduler.start_runner(runner)
+
+    # Let every runner settle on its first deadline before measuring
+    await asyncio.sleep(period * bowl.clock.beat_duration * 2)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    counter[0] = 0
+
+    wall_start = time.perf_counter()
+    await asyncio.sleep(duration)
+    wall = time.perf_counter() - wall_start
+    _, peak = tracemalloc.get_traced_memory()
+    iterations = counter[0]
+
+    tracemalloc.stop()
+    bowl.stop()
+    await asyncio.sleep(0.1)
+    logger.terminal_console.quiet = False
+
+    table = Table("Metric", "Value", title=f"{n_runners} runners, p={period}")
+    table.add_row("Iterations/s", f"{iterations / wall:,.0f}")
+    table.add_row("Retained memory", f"{(retained - before) / 1024:,.0f} KiB")
+    table.add_row("Per runner", f"{(retained - before) / n_runners:,.0f} B")
+    table.add_row("Peak while running", f"{(peak - before) / 1024:,.0f} KiB")
+    table.add_row("Transient memory", f"{(peak - retained) / 1024:,.0f} KiB")
+    rich.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runners", type=int, default=500)
+    parser.add_argument("--period", type=float, default=0.25)
+    parser.add_argument("--tempo", type=float, default=120)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args.runners, args.period, args.tempo, args.duration))
+
+
+if __name__ == "__main__":
+    main()
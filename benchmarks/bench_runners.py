@@ -0,0 +1,101 @@
+"""Measures the throughput and wakeup lateness of many concurrent runners.
+
+Every runner swims a trivial function at a fixed period, so the numbers
+reported here are dominated by the scheduler's own per-iteration overhead.
+
+Usage::
+
+    python benchmarks/bench_runners.py --runners 500 --period 0.25
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import rich
+from rich.table import Table
+
+from sardine_core import AsyncRunner, FishBowl, InternalClock
+from sardine_core.logger import logger
+
+
+def _make_function(bowl: FishBowl, runner: AsyncRunner, lateness: list[float]):
+    def func(p=0.25):
+        lateness.append(bowl.clock.time - runner._expected_time)
+        runner.update_state(p=p)
+        runner.swim()
+
+    return func
+
+
+async def bench(
+    n_runners: int,
+    period: float,
+    tempo: float,
+    duration: float,
+    telemetry: bool = True,
+):
+    # Runners announce themselves on start/stop, which would drown the results
+    logger.terminal_console.quiet = True
+
+    bowl = FishBowl(clock=InternalClock(tempo=tempo))
+    bowl.start()
+
+    lateness: list[float] = []
+    for i in range(n_runners):
+        runner = AsyncRunner(f"bench_{i}")
+        if not telemetry:
+            runner.stats = None
+        runner.push(_make_function(bowl, runner, lateness), p=period)
+        bowl.scheduler.start_runner(runner)
+
+    # Let every runner settle on its first deadline before measuring
+    await asyncio.sleep(period * bowl.clock.beat_duration * 2)
+    lateness.clear()
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(duration)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    iterations = len(lateness)
+
+    bowl.stop()
+    await asyncio.sleep(0.1)
+    logger.terminal_console.quiet = False
+
+    lateness_ms = sorted(x * 1000 for x in lateness) or [0.0]
+    p99 = lateness_ms[min(len(lateness_ms) - 1, int(len(lateness_ms) * 0.99))]
+
+    table = Table("Metric", "Value", title=f"{n_runners} runners, p={period}")
+    table.add_row("Iterations/s", f"{iterations / wall:,.0f}")
+    table.add_row("CPU per iteration", f"{cpu / max(iterations, 1) * 1e6:.1f} µs")
+    table.add_row("CPU load", f"{cpu / wall:.0%}")
+    table.add_row("Lateness median", f"{statistics.median(lateness_ms):.3f} ms")
+    table.add_row("Lateness p99", f"{p99:.3f} ms")
+    table.add_row("Lateness max", f"{lateness_ms[-1]:.3f} ms")
+    rich.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runners", type=int, default=500)
+    parser.add_argument("--period", type=float, default=0.25)
+    parser.add_argument("--tempo", type=float, default=120)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--no-telemetry", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(
+        bench(
+            args.runners,
+            args.period,
+            args.tempo,
+            args.duration,
+            telemetry=not args.no_telemetry,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Measures the throughput and added latency of the fish bowl's sleeper.
+
+Each sleeper task repeatedly sleeps until a deadline a short interval
+ahead, and records how late it woke up. This is run with the event loop
+timer used by `InternalClock`, with and without a spinning tail, and
+through the generic path taken by clocks that only provide `sleep()`.
+
+Usage::
+
+    python benchmarks/bench_sleep.py --sleepers 200 --interval 0.005
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import rich
+from rich.table import Table
+
+from sardine_core import FishBowl, InternalClock, SleepHandler
+from sardine_core.logger import logger
+
+
+class _TaskSleepClock(InternalClock):
+    """An internal clock that opts out of the event loop timer path."""
+
+    def uses_loop_time(self) -> bool:
+        return False
+
+
+async def _sleep_loop(
+    bowl: FishBowl,
+    interval: float,
+    end: float,
+    lateness: list[float],
+):
+    clock = bowl.clock
+    deadline = clock.time
+    while clock.time < end:
+        deadline += interval
+        await bowl.sleeper.sleep_until(deadline)
+        lateness.append(clock.time - deadline)
+
+
+async def bench(
+    clock: InternalClock,
+    sleeper: SleepHandler,
+    n_sleepers: int,
+    interval: float,
+    duration: float,
+):
+    bowl = FishBowl(clock=clock, sleeper=sleeper)
+    bowl.start()
+
+    lateness: list[float] = []
+    end = bowl.clock.time + duration
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.gather(
+        *(_sleep_loop(bowl, interval, end, lateness) for _ in range(n_sleepers))
+    )
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    bowl.stop()
+
+    lateness_ms = sorted(x * 1000 for x in lateness) or [0.0]
+    p99 = lateness_ms[min(len(lateness_ms) - 1, int(len(lateness_ms) * 0.99))]
+    return (
+        f"{len(lateness) / wall:,.0f}",
+        f"{cpu / max(len(lateness), 1) * 1e6:.1f} µs",
+        f"{statistics.median(lateness_ms):.3f} ms",
+        f"{p99:.3f} ms",
+        f"{statistics.pstdev(lateness_ms):.3f} ms",
+    )
+
+
+async def run(n_sleepers: int, interval: float, duration: float, spin_guard: float):
+    # Runners announce themselves on start/stop, which would drown the results
+    logger.terminal_console.quiet = True
+
+    table = Table(
+        "Path",
+        "Sleeps/s",
+        "CPU per sleep",
+        "Latency median",
+        "Latency p99",
+        "Jitter (stdev)",
+        title=f"{n_sleepers} sleepers, interval={interval}s",
+    )
+    paths = (
+        ("tasks", _TaskSleepClock(), SleepHandler()),
+        ("loop.call_at", InternalClock(), SleepHandler()),
+        (
+            f"spin tail ({spin_guard * 1000:g} ms)",
+            InternalClock(),
+            SleepHandler(spin_guard=spin_guard),
+        ),
+    )
+    for name, clock, sleeper in paths:
+        table.add_row(
+            name, *await bench(clock, sleeper, n_sleepers, interval, duration)
+        )
+
+    logger.terminal_console.quiet = False
+    rich.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sleepers", type=int, default=200)
+    parser.add_argument("--spin-guard", type=float, default=0.0015)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sleepers, args.interval, args.duration, args.spin_guard))
+
+
+if __name__ == "__main__":
+    main()
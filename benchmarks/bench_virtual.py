@@ -0,0 +1,98 @@
+"""Measures how fast a session runs on virtual time.
+
+Every runner swims a trivial function at a fixed period and every
+player records its messages, with the fish bowl running on a
+`VirtualClock` and a `VirtualEventLoop`. Time only moves when every
+runner is waiting, so the numbers reported here are the scheduler's
+throughput with no time spent sleeping.
+
+Usage::
+
+    python benchmarks/bench_virtual.py --runners 100 --players 20 --duration 3600
+"""
+
+import argparse
+import asyncio
+import time
+
+import rich
+from rich.table import Table
+
+from sardine_core import AsyncRunner, FishBowl, Player, RecordingSender, VirtualClock
+from sardine_core.event_loop import VirtualEventLoop
+from sardine_core.logger import logger
+
+
+def _make_function(runner: AsyncRunner, counter: list[int]):
+    def func(p=0.25):
+        counter[0] += 1
+        runner.swim()
+
+    return func
+
+
+async def bench(n_runners: int, n_players: int, period: float, duration: float):
+    bowl = FishBowl(clock=VirtualClock())
+    recorder = RecordingSender()
+    bowl.add_handler(recorder)
+    bowl.start()
+
+    counter = [0]
+    for i in range(n_runners):
+        runner = AsyncRunner(f"bench_{i}")
+        runner.push(_make_function(runner, counter), p=period)
+        bowl.scheduler.start_runner(runner)
+
+    for i in range(n_players):
+        player = Player(f"player_{i}", bowl=bowl)
+        player * Player._play_factory(
+            recorder, recorder.send, note=[60, 64, 67], p=period
+        )
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.sleep(duration)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    bowl.stop()
+    await asyncio.sleep(1)
+    return counter[0], len(recorder.messages), cpu, wall
+
+
+def run(n_runners: int, n_players: int, period: float, duration: float):
+    # Runners announce themselves on start/stop, which would drown the results
+    logger.terminal_console.quiet = True
+
+    loop = VirtualEventLoop()
+    try:
+        iterations, messages, cpu, wall = loop.run_until_complete(
+            bench(n_runners, n_players, period, duration)
+        )
+    finally:
+        loop.close()
+        logger.terminal_console.quiet = False
+
+    title = f"{n_runners} runners, {n_players} players, {duration:g}s virtual"
+    table = Table("Metric", "Value", title=title)
+    table.add_row("Wall time", f"{wall:.2f} s")
+    table.add_row("Speedup", f"{duration / wall:,.0f}x")
+    table.add_row("Runner iterations/s", f"{iterations / wall:,.0f}")
+    table.add_row("Messages/s", f"{messages / wall:,.0f}")
+    per_call = cpu / max(iterations + messages, 1)
+    table.add_row("CPU per call", f"{per_call * 1e6:.1f} µs")
+    rich.print(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runners", type=int, default=100)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--period", type=float, default=0.25)
+    parser.add_argument("--duration", type=float, default=3600.0)
+    args = parser.parse_args()
+
+    run(args.runners, args.players, args.period, args.duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
+import contextvars
 import math
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import Iterable, NamedTuple, Optional, Union
+
+from sardine_core.utils import get_numpy
 
 from .runner import BaseRunnerHandler
 
-__all__ = ("BaseClock",)
+__all__ = ("BaseClock", "ClockSnapshot")
+
+frozen_snapshot = contextvars.ContextVar("frozen_snapshot", default=None)
+"""
+The snapshot of the clock frozen in the current context by `BaseClock.freeze()`.
+"""
 
 
 def _round_float(n: float, prec: int = 3):
@@ -12,6 +20,26 @@ def _round_float(n: float, prec: int = 3):
     return s.rstrip("0").rstrip(".")
 
 
+class ClockSnapshot(NamedTuple):
+    """The state of a clock at a single point in time.
+
+    Reading several of the clock's properties, like `beat` and `phase`,
+    goes through the fish bowl's time and time shift each time. A snapshot
+    reads them once, and they all agree with each other.
+    """
+
+    clock: "BaseClock"
+    time: float
+    shift: float
+    shifted_time: float
+    tempo: float
+    beat_duration: float
+    beats_per_bar: int
+    beat: int
+    bar: int
+    phase: float
+
+
 class BaseClock(BaseRunnerHandler, ABC):
     """The base for all clocks to inherit from.
 
@@ -181,6 +209,169 @@ class BaseClock(BaseRunnerHandler, ABC):
 
     # Public methods
 
+    def beat_at_time(self, time: float) -> float:
+        """Converts a fish bowl time into a (fractional) beat.
+
+        By default, this assumes the tempo has always been constant.
+        Clocks that keep track of their tempo changes should override
+        this along with `time_at_beat()`, so that beats stay continuous
+        across tempo changes.
+
+        Args:
+            time (float): The time to convert, e.g. `shifted_time`.
+
+        Returns:
+            float: The beat reached at the given time.
+        """
+        return time / self.beat_duration
+
+    def time_at_beat(self, beat: float) -> float:
+        """Converts a (fractional) beat into a fish bowl time.
+
+        This is the inverse of `beat_at_time()`.
+
+        Args:
+            beat (float): The beat to convert.
+
+        Returns:
+            float: The time at which the given beat is reached.
+        """
+        return beat * self.beat_duration
+
+    def beats_at_times(self, times: Iterable[float]):
+        """Converts many fish bowl times into beats at once.
+
+        By default, this calls `beat_at_time()` for each time.
+        Clocks should override this along with `times_at_beats()`
+        when they can convert a whole window of events faster.
+
+        Args:
+            times (Iterable[float]): The times to convert.
+
+        Returns:
+            The beats reached at each time, as a NumPy array
+            if `times` is one, or a list otherwise.
+        """
+        beats = [self.beat_at_time(time) for time in times]
+        numpy = get_numpy(times)
+        return numpy.array(beats) if numpy is not None else beats
+
+    def times_at_beats(self, beats: Iterable[float]):
+        """Converts many beats into fish bowl times at once.
+
+        This is the inverse of `beats_at_times()`.
+
+        Args:
+            beats (Iterable[float]): The beats to convert.
+
+        Returns:
+            The times at which each beat is reached, as a NumPy array
+            if `beats` is one, or a list otherwise.
+        """
+        times = [self.time_at_beat(beat) for beat in beats]
+        numpy = get_numpy(beats)
+        return numpy.array(times) if numpy is not None else times
+
+    def get_beat_deadline(
+        self,
+        n_beats: Union[int, float],
+        *,
+        time: Optional[float] = None,
+        beat_shift: float = 0.0,
+    ) -> float:
+        """Determines the time of the next multiple of N beats.
+
+        This is calculated in beats rather than seconds, meaning the
+        result stays exact for clocks that keep track of tempo changes.
+
+        Args:
+            n_beats (Union[int, float]): The number of beats in each interval.
+            time (Optional[float]):
+                The exact time to use for calculations.
+                If not provided, this defaults to `shifted_time`.
+            beat_shift (float):
+                The number of beats to offset intervals by.
+
+        Returns:
+            float: The absolute time of the next interval.
+        """
+        if time is None:
+            time = self.shifted_time
+
+        if n_beats <= 0:
+            return time
+
+        beat = self.beat_at_time(time) + beat_shift
+        remaining = n_beats - beat % n_beats
+
+        # Due to potential rounding errors, we might get a remainder
+        # that should be, but isn't actually equal to the interval.
+        # To mitigate this, we will replace any remainders below 10
+        # nanobeats.
+        # Rounding errors will worsen over time, but it is unlikely
+        # we'll get to a point where this is too little
+        # (but possible if sardine goes on for 5-6 years).
+        if math.isclose(remaining, 0.0, rel_tol=0.0, abs_tol=1e-8):
+            remaining = n_beats
+
+        return self.time_at_beat(beat - beat_shift + remaining)
+
+    def snapshot(self) -> ClockSnapshot:
+        """Returns the state of the clock at the current time.
+
+        If the time was frozen in the current context with `freeze()`,
+        this returns the frozen state instead. When the time shift changed
+        since then, e.g. after a call to `sleep()`, the frozen state is
+        moved forward by the new shift.
+
+        Returns:
+            ClockSnapshot: The current state of the clock.
+        """
+        snapshot: Optional[ClockSnapshot] = frozen_snapshot.get()
+        if snapshot is None or snapshot.clock is not self:
+            return self._take_snapshot(self.time)
+
+        if snapshot.shift != self.env.time.shift:
+            snapshot = self._take_snapshot(snapshot.time)
+            frozen_snapshot.set(snapshot)
+        return snapshot
+
+    def freeze(self) -> ClockSnapshot:
+        """Freezes the state of the clock in the current context.
+
+        Until the context ends, `snapshot()` keeps returning this state,
+        giving one consistent view of time to everything reading it.
+        Since this sets a context variable, it should only be called
+        from a copied context, like the ones runners call functions in.
+
+        Returns:
+            ClockSnapshot: The frozen state of the clock.
+        """
+        snapshot = self._take_snapshot(self.time)
+        frozen_snapshot.set(snapshot)
+        return snapshot
+
+    def _take_snapshot(self, time: float) -> ClockSnapshot:
+        shift = self.env.time.shift
+        shifted_time = time + shift
+        tempo = self.tempo
+        beat_duration = self.beat_duration
+        beats_per_bar = self.beats_per_bar
+        beat = self.beat_at_time(shifted_time)
+
+        return ClockSnapshot(
+            clock=self,
+            time=time,
+            shift=shift,
+            shifted_time=shifted_time,
+            tempo=tempo,
+            beat_duration=beat_duration,
+            beats_per_bar=beats_per_bar,
+            beat=int(beat),
+            bar=int(beat) // beats_per_bar,
+            phase=beat % 1 * beat_duration,
+        )
+
     def can_sleep(self) -> bool:
         """Checks if the clock supports sleeping."""
         # Get the sleep attribute and if it is a bound method, unwrap it
@@ -189,6 +380,15 @@ class BaseClock(BaseRunnerHandler, ABC):
         method = getattr(method, "__func__", method)
         return method is not BaseClock.sleep
 
+    def uses_loop_time(self) -> bool:
+        """Checks if the clock's time advances with the event loop's time.
+
+        When True, the fish bowl's sleeper maps deadlines directly onto
+        `loop.time()` and schedules them with `loop.call_at()`, instead
+        of going through `sleep()` or polling.
+        """
+        return False
+
     def get_beat_time(
         self,
         n_beats: Union[int, float],
@@ -215,25 +415,12 @@ class BaseClock(BaseRunnerHandler, ABC):
         if time is None:
             time = self.shifted_time
 
-        interval = self.beat_duration * n_beats
-        if interval <= 0.0:
+        if n_beats <= 0:
             return 0.0
         elif not sync:
-            return interval
-
-        duration = interval - time % interval
-
-        # Due to potential rounding errors, we might get a duration
-        # that should be, but isn't actually equal to the interval.
-        # To mitigate this, we will replace any durations below 10
-        # nanoseconds.
-        # Rounding errors will worsen over time, but it is unlikely
-        # we'll get to a point where 10 nanoseconds is too little
-        # (but possible if sardine goes on for 5-6 years).
-        if math.isclose(duration, 0.0, rel_tol=0.0, abs_tol=1e-8):
-            return interval
+            return self.time_at_beat(self.beat_at_time(time) + n_beats) - time
 
-        return duration
+        return self.get_beat_deadline(n_beats, time=time) - time
 
     def get_bar_time(
         self,
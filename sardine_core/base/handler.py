@@ -205,17 +205,18 @@ class BaseHandler:
         if teardown and handler.env is not None:
             handler.env.remove_handler(handler)
 
-    def register(self, event: Optional[str]):
+    def register(self, event: Optional[str], *, deferred: bool = False):
         """Registers the handler for the given event.
 
-        This is a shorthand for doing `self.env.register_hook(event, self)`.
+        This is a shorthand for doing
+        `self.env.register_hook(event, self, deferred=deferred)`.
         """
         if self.env is None:
             raise ValueError(
                 "handler cannot register hooks until it is added to a FishBowl"
             )
 
-        self.env.register_hook(event, self)
+        self.env.register_hook(event, self, deferred=deferred)
 
     def unregister(self, event: Optional[str]):
         """Unregisters the handler for the given event.
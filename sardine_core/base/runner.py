@@ -58,6 +58,7 @@ class BaseThreadedLoopMixin(BaseRunnerMixin, ABC):
     Args:
         loop_interval (float):
             The amount of time to sleep between each iteration.
+            Subclasses can vary this by overriding `get_loop_interval()`.
     """
 
     def __init__(self, *args, loop_interval: float, **kwargs):
@@ -78,6 +79,10 @@ class BaseThreadedLoopMixin(BaseRunnerMixin, ABC):
     def after_loop(self):
         """Called after the loop has stopped."""
 
+    def get_loop_interval(self) -> float:
+        """Returns the amount of time to sleep before the next iteration."""
+        return self.loop_interval
+
     def _run(self):
         try:
             self.before_loop()
@@ -91,7 +96,7 @@ class BaseThreadedLoopMixin(BaseRunnerMixin, ABC):
                     self.loop()
 
                     try:
-                        fut.result(timeout=self.loop_interval)
+                        fut.result(timeout=self.get_loop_interval())
                     except concurrent.futures.CancelledError:
                         break
                     except concurrent.futures.TimeoutError:
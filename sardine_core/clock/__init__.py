@@ -1,3 +1,5 @@
 from .internal_clock import *
 from .link_clock import *
+from .midi_clock import *
 from .time import *
+from .virtual_clock import *
@@ -1,22 +1,38 @@
 import asyncio
 import math
 import time
-from typing import Union
+from typing import Iterable, Optional, Union
 
 from sardine_core.base import BaseClock
 
+from .tempo_map import TempoMap
+
 NUMBER = Union[int, float]
 
 __all__ = ("InternalClock",)
 
 
+def _check_tempo(tempo: NUMBER) -> float:
+    tempo = float(tempo)
+    if not 1 <= tempo <= 999:
+        raise ValueError("new tempo must be within 1 and 999")
+    return tempo
+
+
 class InternalClock(BaseClock):
+    """A clock running on the system's performance counter.
+
+    Tempo changes are recorded in a `TempoMap`, keeping beats continuous
+    across tempo changes and allowing gradual changes with `ramp_tempo()`.
+    """
+
     def __init__(
         self,
         tempo: NUMBER = 120,
         bpb: int = 4,
     ):
         super().__init__()
+        self._ramp_end: Optional[float] = None
         self.tempo = tempo
         self._tick: int = 0
         self.beats_per_bar = bpb
@@ -61,11 +77,11 @@ class InternalClock(BaseClock):
 
     def beatAtTime(self, time: int | float) -> float:
         """Equivalent to Ableton Link beatAtTime method"""
-        return (time - self.internal_origin) * self.bps
+        return self.beat_at_time(time - self.internal_origin + self.env.time.origin)
 
     def timeAtBeat(self, beat: float) -> float:
         """Equivalent to Ableton Link timeAtBeat method"""
-        return self.internal_origin + (self.beat / self.bps)
+        return self.time_at_beat(beat) - self.env.time.origin + self.internal_origin
 
     #### GETTERS  ############################################################
 
@@ -75,15 +91,13 @@ class InternalClock(BaseClock):
 
     @property
     def beat(self) -> int:
-        # FIXME: Internal clock beat will abruptly change with tempo
-        try:
-            return int(self.shifted_time // self.beat_duration)
-        except ZeroDivisionError:
-            return 0
+        return int(self.beat_at_time(self.shifted_time))
 
     @property
     def beat_duration(self) -> float:
-        return self._beat_duration
+        if self._ramp_end is None:
+            return self._beat_duration
+        return 60 / self.tempo
 
     @property
     def beats_per_bar(self) -> int:
@@ -99,15 +113,22 @@ class InternalClock(BaseClock):
 
     @property
     def phase(self) -> float:
-        try:
-            return self.shifted_time % self.beat_duration
-        except ZeroDivisionError:
-            return 0
+        return self.beat_at_time(self.shifted_time) % 1 * self.beat_duration
 
     @property
     def tempo(self) -> float:
+        if self._ramp_end is not None:
+            time = self.time
+            if time < self._ramp_end:
+                return self._tempo_map.tempo_at(time)
+            self._ramp_end = None
         return self._tempo
 
+    @property
+    def tempo_map(self) -> TempoMap:
+        """The tempo changes of the clock, used for beat/time conversions."""
+        return self._tempo_map
+
     #### SETTERS ############################################################
 
     @beats_per_bar.setter
@@ -120,21 +141,72 @@ class InternalClock(BaseClock):
 
     @tempo.setter
     def tempo(self, new_tempo: NUMBER):
-        # TODO: why is there no dispatch for this clock?
-        # self.env.dispatch('tempo_change', self.tempo, new_tempo)
-        new_tempo = float(new_tempo)
+        new_tempo = _check_tempo(new_tempo)
+
+        if self.env is None:
+            # Without a fish bowl, there is no time to change the tempo at
+            self._tempo_map = TempoMap(new_tempo)
+            self._set_final_tempo(new_tempo)
+            return
 
-        if not 1 <= new_tempo <= 999:
-            raise ValueError("new tempo must be within 1 and 999")
+        old_tempo = self.tempo
+        self._tempo_map.set_tempo(self.time, new_tempo)
+        self._ramp_end = None
+        self._set_final_tempo(new_tempo)
+        self.env.dispatch("tempo_change", old_tempo, new_tempo)
 
-        self._tempo = new_tempo
-        self._beat_duration = 60 / new_tempo
+    def _set_final_tempo(self, tempo: float):
+        self._tempo = tempo
+        self._beat_duration = 60 / tempo
 
     ## METHODS  ##############################################################
 
+    def beat_at_time(self, time: float) -> float:
+        return self._tempo_map.beat_at(time)
+
+    def time_at_beat(self, beat: float) -> float:
+        return self._tempo_map.time_at(beat)
+
+    def beats_at_times(self, times: Iterable[float]):
+        return self._tempo_map.beats_at(times)
+
+    def times_at_beats(self, beats: Iterable[float]):
+        return self._tempo_map.times_at(beats)
+
+    def ramp_tempo(self, new_tempo: NUMBER, n_beats: NUMBER):
+        """Gradually changes the tempo over the next N beats.
+
+        The tempo changes linearly over time, starting now.
+        Runners keep their deadlines on the beat grid during the ramp.
+
+        Args:
+            new_tempo (NUMBER): The tempo to reach at the end of the ramp.
+            n_beats (NUMBER): The number of beats the ramp should last.
+
+        Raises:
+            RuntimeError: The clock has not been added to a fish bowl.
+        """
+        if self.env is None:
+            raise RuntimeError("cannot ramp the tempo without a fish bowl")
+
+        new_tempo = _check_tempo(new_tempo)
+        old_tempo = self.tempo
+        time = self.time
+
+        # Beats covered by a linear ramp: (old + new) / 2 * duration / 60
+        duration = 120 * n_beats / (old_tempo + new_tempo)
+        self._tempo_map.ramp(time, new_tempo, duration)
+        self._ramp_end = time + duration if duration > 0 else None
+        self._set_final_tempo(new_tempo)
+        self.env.dispatch("tempo_change", old_tempo, new_tempo)
+
     async def sleep(self, duration: Union[float, int]) -> None:
         return await asyncio.sleep(duration)
 
+    def uses_loop_time(self) -> bool:
+        # perf_counter() and loop.time() are both monotonic clocks
+        return True
+
     async def run(self):
         # The internal clock simply uses the system's time
         # so we don't need to do any polling loop here
@@ -1,39 +1,85 @@
-from typing import Optional, Union
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Iterable, NamedTuple, Optional, Union
 
 import link
 
 from sardine_core.base import BaseClock, BaseThreadedLoopMixin
+from sardine_core.utils import get_numpy
 
 NUMBER = Union[int, float]
 
-__all__ = ("LinkClock",)
+__all__ = ("LinkClock", "LinkSnapshot")
+
+
+class LinkSnapshot(NamedTuple):
+    """The state of a Link session captured at a single point in time."""
+
+    session: Optional[link.SessionState]
+    link_time: int
+    """The time of the capture on Link's clock, in microseconds."""
+    beat: float
+    phase: float
+    """The phase of the current beat, in seconds."""
+    playing: bool
+    tempo: float
 
 
 class LinkClock(BaseThreadedLoopMixin, BaseClock):
+    """A clock following an Ableton Link session.
+
+    The session is captured from a background thread, and each capture is
+    published as one immutable `LinkSnapshot`, so readers on the event
+    loop never see a mix of two captures.
+
+    Changes made by any peer of the session are noticed by the capture
+    thread and handed over to the event loop, where they are dispatched
+    as the following events:
+        - `tempo_change` with the old and new tempo
+        - `playing_change` with whether the session is playing
+        - `peers_change` with the number of peers in the session
+
+    Args:
+        tempo (NUMBER): The tempo to start the session with.
+        bpb (int): The number of beats per bar.
+        loop_interval (float):
+            The time between captures while sleeps are pending.
+        idle_interval (float):
+            The time between captures while nothing is sleeping
+            on the clock, reducing contention for the GIL.
+    """
+
     def __init__(
         self,
         tempo: NUMBER = 120,
         bpb: int = 4,
         loop_interval: float = 0.001,
+        idle_interval: float = 0.02,
     ):
         super().__init__(loop_interval=loop_interval)
+        self.idle_interval = idle_interval
 
         self._link: Optional[link.Link] = None
+        self._link_clock: Optional[link.Clock] = None
         self._tick: int = 0
-        self._beat: int = 0
-        self._beat_duration: float = 0.0
         self._beats_per_bar: int = bpb
         self._internal_origin: float = 0.0
-        self._internal_time: float = 0.0
-        self._last_capture: Optional[link.SessionState] = None
-        self._phase: float = 0.0
-        self._playing: bool = False
-        self._tempo: float = float(tempo)
+        self._snapshot = LinkSnapshot(None, 0, 0.0, 0.0, False, float(tempo))
+        self._publish_lock = threading.Lock()
         self._tidal_nudge: int = 0
-        self._link_time: int = 0
         self._beats_per_cycle: int = 4
+        self._dispatched_tempo: float = float(tempo)
+        self._peers: int = 0
+        # The session as last seen by the capture thread
+        self._seen_session: tuple[float, bool, int] = (float(tempo), False, 0)
         self._framerate: float = 1 / 20
 
+        # Sleeps waiting on the event loop's timer, resolved early
+        # when the Link timeline jumps so that they can be re-armed
+        self._sleeps: set[asyncio.Future] = set()
+        self._host_offset: Optional[float] = None
+
     ## VORTEX   ################################################
 
     def get_cps(self) -> int | float:
@@ -70,7 +116,7 @@ class LinkClock(BaseThreadedLoopMixin, BaseClock):
 
     def timeAtBeat(self, beat: float) -> float:
         """Equivalent to Ableton Link timeAtBeat method"""
-        return self.internal_origin + (self.beat / self.bps)
+        return self.internal_origin + (beat / self.bps)
 
     ## GETTERS  ################################################
 
@@ -83,11 +129,12 @@ class LinkClock(BaseThreadedLoopMixin, BaseClock):
 
     @property
     def beat(self) -> int:
-        return self._beat + int(self.beat_shift)
+        beat, _ = self._get_beat_and_phase()
+        return int(beat) + int(self.beat_shift)
 
     @property
     def beat_duration(self) -> float:
-        return self._beat_duration
+        return 60 / self._snapshot.tempo
 
     @property
     def beat_shift(self) -> float:
@@ -107,18 +154,39 @@ class LinkClock(BaseThreadedLoopMixin, BaseClock):
 
     @property
     def internal_time(self) -> float:
-        return self._internal_time
+        # Link's clock is cheap to read, which keeps the time exact
+        # regardless of how long ago the last capture happened
+        link_clock = self._link_clock
+        if link_clock is None:
+            return self._snapshot.link_time / 1_000_000
+        return link_clock.micros() / 1_000_000
 
     @property
     def phase(self) -> float:
+        _, phase = self._get_beat_and_phase()
         try:
-            return (self._phase + self.beat_shift) % self.beat_duration
+            return (phase + self.beat_shift) % self.beat_duration
         except ZeroDivisionError:
             return 0.0
 
+    @property
+    def peers(self) -> int:
+        """The number of other peers in the Link session."""
+        return self._peers
+
+    @property
+    def playing(self) -> bool:
+        """Whether the Link session is playing, as of the latest capture."""
+        return self._snapshot.playing
+
+    @property
+    def session_snapshot(self) -> LinkSnapshot:
+        """The latest capture of the Link session."""
+        return self._snapshot
+
     @property
     def tempo(self) -> float:
-        return self._tempo
+        return self._snapshot.tempo
 
     ## SETTERS  ##############################################################
 
@@ -132,43 +200,248 @@ class LinkClock(BaseThreadedLoopMixin, BaseClock):
 
     @tempo.setter
     def tempo(self, new_tempo: float) -> None:
-        self.env.dispatch("tempo_change", self.tempo, new_tempo)
+        old_tempo = self.tempo
         if self._link is not None:
             session = self._link.captureSessionState()
-            session.setTempo(new_tempo, self._link_time)
+            session.setTempo(new_tempo, self._snapshot.link_time)
             self._link.commitSessionState(session)
+            # Make the change visible to beat conversions right away,
+            # rather than on the next capture
+            self._publish(self._make_snapshot(session))
+            # The capture thread notices this change as well,
+            # which must not dispatch it a second time
+            self._dispatched_tempo = session.tempo()
+        self.env.dispatch("tempo_change", old_tempo, new_tempo)
 
     ## METHODS  ##############################################################
 
-    def _capture_link_info(self):
-        s: link.SessionState = self._link.captureSessionState()
-        self._last_capture = s
-        self._link_time: int = self._link.clock().micros()
-        beat: float = s.beatAtTime(self._link_time, self.beats_per_bar)
-        phase: float = s.phaseAtTime(self._link_time, self.beats_per_bar)
-        playing: bool = s.isPlaying()
+    def beat_at_time(self, time: float) -> float:
+        session, _, _, _, _, tempo = self._snapshot
+        if session is None:
+            return time * tempo / 60
+
+        micros = (time - self.env.time.origin + self.internal_origin) * 1_000_000
+        return session.beatAtTime(round(micros), self.beats_per_bar)
+
+    def time_at_beat(self, beat: float) -> float:
+        session, _, _, _, _, tempo = self._snapshot
+        if session is None:
+            return beat * 60 / tempo
+
+        # Link times are in whole microseconds, round up so that converting
+        # the result back never gives a beat earlier than the one requested
+        micros = session.timeAtBeat(beat, self.beats_per_bar) + 1
+        return micros / 1_000_000 - self.internal_origin + self.env.time.origin
+
+    def beats_at_times(self, times: Iterable[float]):
+        """Converts many fish bowl times into beats at once.
+
+        A Link session's beats are linear in time until the tempo changes,
+        so this only asks Link for the beat at the latest capture and
+        extrapolates from there. Unlike `beat_at_time()`, times are not
+        rounded to Link's microseconds.
+        """
+        ref_time, ref_beat, tempo = self._get_reference()
+        numpy = get_numpy(times)
+        if numpy is not None:
+            return ref_beat + (times - ref_time) * tempo / 60
+        return [ref_beat + (time - ref_time) * tempo / 60 for time in times]
+
+    def times_at_beats(self, beats: Iterable[float]):
+        """Converts many beats into fish bowl times at once.
+
+        This is the inverse of `beats_at_times()`.
+        """
+        ref_time, ref_beat, tempo = self._get_reference()
+        numpy = get_numpy(beats)
+        if numpy is not None:
+            return ref_time + (beats - ref_beat) * 60 / tempo
+        return [ref_time + (beat - ref_beat) * 60 / tempo for beat in beats]
+
+    def _get_reference(self) -> tuple[float, float, float]:
+        """Returns a fish bowl time, the beat at that time and the tempo,
+        all from the latest capture.
+        """
+        session, link_time, _, _, _, tempo = self._snapshot
+        if session is None:
+            return 0.0, 0.0, tempo
+
+        time = link_time / 1_000_000 - self.internal_origin + self.env.time.origin
+        return time, session.beatAtTime(link_time, self.beats_per_bar), tempo
+
+    def sleep(self, duration: Union[float, int]) -> Awaitable[None]:
+        """Sleeps for the given duration on Link's host clock.
+
+        The duration is added to the current time of Link's clock, and the
+        resulting deadline is mapped onto the event loop's timer. Link's
+        clock and the event loop's clock can drift apart, so the sleep is
+        re-armed whenever it wakes up before the deadline or the Link
+        timeline jumps.
+
+        The time is read when this method is called rather than when
+        the sleep starts, so that the duration is relative to the same
+        time as the caller's.
+        """
+        link_clock = self._link_clock
+        if link_clock is None:
+            return asyncio.sleep(duration)
+
+        deadline = link_clock.micros() + round(duration * 1_000_000)
+        return self._sleep_until(link_clock, deadline)
+
+    async def _sleep_until(self, link_clock: link.Clock, deadline: int):
+        loop = asyncio.get_running_loop()
+        while (remaining := deadline - link_clock.micros()) > 0:
+            future = loop.create_future()
+            handle = loop.call_later(remaining / 1_000_000, _resolve_future, future)
+            self._sleeps.add(future)
+            try:
+                await future
+            finally:
+                handle.cancel()
+                self._sleeps.discard(future)
+
+    def _rearm_sleeps(self):
+        for future in self._sleeps:
+            _resolve_future(future)
+
+    def _get_beat_and_phase(self) -> tuple[float, float]:
+        """Returns the beat and phase at the current time.
+
+        Captures can be up to `idle_interval` old, so rather than reading
+        the snapshot's beat and phase, they are extrapolated from its
+        session at Link's current time. This keeps them in agreement with
+        `time`, which is read from Link's clock as well.
+        """
+        snapshot = self._snapshot
+        link_clock = self._link_clock
+        if snapshot.session is None or link_clock is None:
+            return snapshot.beat, snapshot.phase
+
+        link_time = link_clock.micros()
+        session, quantum = snapshot.session, self.beats_per_bar
+        phase = session.phaseAtTime(link_time, quantum)
+        return session.beatAtTime(link_time, quantum), phase % 1 * 60 / snapshot.tempo
+
+    def _make_snapshot(self, s: link.SessionState) -> LinkSnapshot:
+        link_time: int = self._link_clock.micros()
         tempo: float = s.tempo()
+        phase: float = s.phaseAtTime(link_time, self.beats_per_bar)
+
+        return LinkSnapshot(
+            session=s,
+            link_time=link_time,
+            beat=s.beatAtTime(link_time, self.beats_per_bar),
+            # Sardine phase is typically defined from 0.0 to the beat duration.
+            # Conversions are needed for the phase coming from the LinkClock.
+            phase=phase % 1 * 60 / tempo,
+            playing=s.isPlaying(),
+            tempo=tempo,
+        )
+
+    def _publish(self, snapshot: LinkSnapshot):
+        """Replaces the current snapshot, unless it is newer than the given one.
+
+        Both the capture thread and the event loop publish snapshots,
+        so the lock only keeps the time from going backwards. Readers
+        never need it as they only read the `_snapshot` reference once.
+        """
+        host_offset = time.monotonic() - snapshot.link_time / 1_000_000
+
+        with self._publish_lock:
+            previous = self._snapshot
+            if snapshot.link_time < previous.link_time:
+                return
+            self._snapshot = snapshot
+
+            # Tempo changes and jumps between Link's clock and the event loop's
+            # clock (e.g. after a suspend) invalidate the timers of sleeps
+            jumped = (
+                self._host_offset is not None
+                and abs(host_offset - self._host_offset) > 0.001
+            )
+            self._host_offset = host_offset
+
+        if self._sleeps and (jumped or snapshot.tempo != previous.tempo):
+            self._call_soon(self._rearm_sleeps)
 
-        self._internal_time = self._link_time / 1_000_000
-        self._beat = int(beat)
-        self._beat_duration = 60 / tempo
-        # Sardine phase is typically defined from 0.0 to the beat duration.
-        # Conversions are needed for the phase coming from the LinkClock.
-        self._phase = phase % 1 * self.beat_duration
-        self._playing = playing
-        self._tempo = tempo
+    def _capture_link_info(self):
+        self._publish(self._make_snapshot(self._link.captureSessionState()))
+
+    def _check_session(self):
+        """Hands changes of the session over to the event loop.
+
+        Link's own callbacks are not used, as they acquire the GIL on
+        Link's thread while holding Link's locks, which deadlocks with
+        any call into Link made while holding the GIL.
+        """
+        snapshot = self._snapshot
+        session = (snapshot.tempo, snapshot.playing, self._link.numPeers())
+        seen, self._seen_session = self._seen_session, session
+
+        for callback, old, new in zip(
+            (self._on_tempo, self._on_playing, self._on_peers), seen, session
+        ):
+            if new != old:
+                self._call_soon(callback, new)
+
+    def _call_soon(self, callback: Callable, *args):
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # The event loop has been closed
+
+    def _on_tempo(self, tempo: float):
+        old_tempo = self._dispatched_tempo
+        if self.env is None or self._link is None or tempo == old_tempo:
+            return
+
+        # Runners reacting to the change must see the new tempo
+        self._dispatched_tempo = tempo
+        self._capture_link_info()
+        self.env.dispatch("tempo_change", old_tempo, tempo)
+
+    def _on_playing(self, playing: bool):
+        if self.env is None or self._link is None:
+            return
+
+        self._capture_link_info()
+        self.env.dispatch("playing_change", playing)
+
+    def _on_peers(self, peers: int):
+        self._peers = peers
+        if self.env is not None:
+            self.env.dispatch("peers_change", peers)
+
+    def get_loop_interval(self) -> float:
+        # Only sleeps need the capture to follow Link closely
+        if self._sleeps:
+            return self.loop_interval
+        return self.idle_interval
 
     def before_loop(self):
-        self._link = link.Link(self._tempo)
+        self._link = link.Link(self._snapshot.tempo)
         self._link.enabled = True
         self._link.startStopSyncEnabled = True
+        self._link_clock = self._link.clock()
 
         # Set the origin at the start
         self._capture_link_info()
         self._internal_origin = self.internal_time
+        self._dispatched_tempo = self._snapshot.tempo
+        self._seen_session = (self._snapshot.tempo, self._snapshot.playing, 0)
 
     def loop(self):
         self._capture_link_info()
+        self._check_session()
 
     def after_loop(self):
+        self._link_clock = None
         self._link = None
+        self._peers = 0
+        self._host_offset = None
+
+
+def _resolve_future(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
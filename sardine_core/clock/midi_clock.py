@@ -0,0 +1,319 @@
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Union
+
+import mido
+
+from sardine_core.base import BaseClock
+from sardine_core.utils import get_numpy
+
+if TYPE_CHECKING:
+    from sardine_core.handlers import MidiInHandler
+
+NUMBER = Union[int, float]
+
+__all__ = ("MidiClock",)
+
+PPQN = 24
+"""The number of MIDI clock messages received per beat."""
+
+MIN_TEMPO = 20
+"""The slowest tempo followed. Longer gaps between ticks cause a relock."""
+
+
+class _TickState(NamedTuple):
+    """The filtered estimate of the latest MIDI clock tick."""
+
+    time: float
+    """The estimated `time.perf_counter()` of the tick."""
+    tick: int
+    period: float
+    """The estimated time between ticks, in seconds."""
+    count: int
+    """The number of ticks filtered since the last relock."""
+
+
+class MidiClock(BaseClock):
+    """A clock following the MIDI clock messages of an external device.
+
+    Clock messages are 24 ticks per beat, and their arrival times carry
+    the jitter of the device, the cable and the driver. Each tick goes
+    through an alpha-beta filter (the steady state of a Kalman filter
+    tracking phase and tempo) before updating the clock, so that the
+    jitter is averaged out of beat conversions and runner deadlines.
+    The filter starts out with high gains that shrink down to `gain`,
+    converging within a few ticks after locking on.
+
+    Between ticks, beats are extrapolated from the latest estimate.
+    Before the first tick arrives, the clock runs at its initial tempo.
+    When ticks stop for too long (e.g. the device stopped sending clock),
+    the next tick relocks the filter without moving beats backwards.
+
+    MIDI transport messages are followed too. Start and song position
+    pointers align the next tick with the position of the device, moving
+    beats forward to the same position within the bar. Start, Continue
+    and Stop are dispatched as the following events:
+        - `playing_change` with whether the device is playing
+
+    Tempo estimates are dispatched as `tempo_change` events, but only
+    once they differ by at least `tempo_tolerance` from the last one.
+
+    Args:
+        midi_in (MidiInHandler): The MIDI input receiving clock messages.
+        tempo (NUMBER): The tempo to run at until the first ticks arrive.
+        bpb (int): The number of beats per bar.
+        gain (float):
+            The phase gain of the filter, between 0 and 1. Lower values
+            reject more jitter but follow tempo changes more slowly.
+        tempo_tolerance (float):
+            The smallest change in the tempo estimate to dispatch.
+    """
+
+    def __init__(
+        self,
+        midi_in: "MidiInHandler",
+        tempo: NUMBER = 120,
+        bpb: int = 4,
+        *,
+        gain: float = 0.05,
+        tempo_tolerance: float = 0.1,
+    ):
+        super().__init__()
+        self.midi_in = midi_in
+        self.gain = gain
+        self.tempo_tolerance = tempo_tolerance
+        self._tick: int = 0
+        self._beats_per_bar: int = bpb
+        self._internal_origin: float = 0.0
+        self._tidal_nudge: int = 0
+        self._framerate: float = 1 / 20
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._state = _TickState(time.perf_counter(), 0, 60 / (tempo * PPQN), 0)
+        self._dispatched_tempo: float = float(tempo)
+        self._playing = False
+        self._song_position: Optional[int] = None
+
+    ## VORTEX   ################################################
+
+    def get_cps(self) -> int | float:
+        """Get the BPM in cycles per second (Tidal approach to time)"""
+        return self.tempo / self._beats_per_bar / 60.0
+
+    @property
+    def cps(self) -> int | float:
+        """Return the current cps"""
+        return self.get_cps()
+
+    @property
+    def tick(self) -> int | float:
+        """Return the current clock tick"""
+        return self._tick
+
+    @tick.setter
+    def tick(self, value: int) -> None:
+        """Set the current clock tick"""
+        self._tick = value
+
+    @property
+    def bps(self) -> int | float:
+        """Return the number of beats that can fit into a second"""
+        return 1.0 / self.beat_duration
+
+    def beatAtTime(self, time: int | float) -> float:
+        """Equivalent to Ableton Link beatAtTime method"""
+        return self.beat_at_time(time - self.internal_origin + self.env.time.origin)
+
+    def timeAtBeat(self, beat: float) -> float:
+        """Equivalent to Ableton Link timeAtBeat method"""
+        return self.time_at_beat(beat) - self.env.time.origin + self.internal_origin
+
+    ## GETTERS  ################################################
+
+    @property
+    def bar(self) -> int:
+        return self.beat // self.beats_per_bar
+
+    @property
+    def beat(self) -> int:
+        return int(self.beat_at_time(self.shifted_time))
+
+    @property
+    def beat_duration(self) -> float:
+        return self._state.period * PPQN
+
+    @property
+    def beats_per_bar(self) -> int:
+        return self._beats_per_bar
+
+    @property
+    def internal_origin(self) -> float:
+        return self._internal_origin
+
+    @property
+    def internal_time(self) -> float:
+        return time.perf_counter()
+
+    @property
+    def phase(self) -> float:
+        return self.beat_at_time(self.shifted_time) % 1 * self.beat_duration
+
+    @property
+    def playing(self) -> bool:
+        """Whether the device is playing, as of its latest transport message."""
+        return self._playing
+
+    @property
+    def tempo(self) -> float:
+        return 60 / self.beat_duration
+
+    ## SETTERS  ##############################################################
+
+    @beats_per_bar.setter
+    def beats_per_bar(self, bpb: int):
+        self._beats_per_bar = bpb
+
+    @internal_origin.setter
+    def internal_origin(self, origin: float):
+        self._internal_origin = origin
+
+    @tempo.setter
+    def tempo(self, new_tempo: NUMBER):
+        raise RuntimeError("the tempo of a MIDI clock is set by its device")
+
+    ## METHODS  ##############################################################
+
+    def beat_at_time(self, time: float) -> float:
+        state = self._state
+        perf_time = time - self.env.time.origin + self.internal_origin
+        return (state.tick + (perf_time - state.time) / state.period) / PPQN
+
+    def time_at_beat(self, beat: float) -> float:
+        state = self._state
+        perf_time = state.time + (beat * PPQN - state.tick) * state.period
+        return perf_time - self.internal_origin + self.env.time.origin
+
+    def beats_at_times(self, times: Iterable[float]):
+        ref_time, ref_beat, beat_duration = self._get_reference()
+        numpy = get_numpy(times)
+        if numpy is not None:
+            return ref_beat + (times - ref_time) / beat_duration
+        return [ref_beat + (time - ref_time) / beat_duration for time in times]
+
+    def times_at_beats(self, beats: Iterable[float]):
+        ref_time, ref_beat, beat_duration = self._get_reference()
+        numpy = get_numpy(beats)
+        if numpy is not None:
+            return ref_time + (beats - ref_beat) * beat_duration
+        return [ref_time + (beat - ref_beat) * beat_duration for beat in beats]
+
+    def _get_reference(self) -> tuple[float, float, float]:
+        """Returns the fish bowl time of the latest tick, its beat,
+        and the beat duration, all from the same estimate.
+        """
+        state = self._state
+        time = state.time - self.internal_origin + self.env.time.origin
+        return time, state.tick / PPQN, state.period * PPQN
+
+    async def sleep(self, duration: Union[float, int]) -> None:
+        return await asyncio.sleep(duration)
+
+    def uses_loop_time(self) -> bool:
+        # Ticks are timestamped with perf_counter(), which is monotonic
+        # like loop.time(), so deadlines can go straight to the loop's timer
+        return True
+
+    def _on_message(self, message: mido.Message, timestamp: float):
+        """Receives a MIDI clock or transport message from the MIDI input.
+
+        This is called on the MIDI input's thread. Only that thread
+        updates the tick estimate, which is published as one immutable
+        `_TickState` so that readers never see a partial update.
+        """
+        if message.type == "clock":
+            self._on_tick(timestamp)
+        elif message.type == "songpos":
+            # Song positions are counted in sixteenth notes
+            self._song_position = message.pos * PPQN // 4
+        elif message.type == "start":
+            self._song_position = 0
+            self._set_playing(True)
+        elif message.type == "continue":
+            self._set_playing(True)
+        elif message.type == "stop":
+            self._set_playing(False)
+
+    def _on_tick(self, timestamp: float):
+        state = self._state
+        predicted = state.time + state.period
+        residual = timestamp - predicted
+        max_period = 60 / (MIN_TEMPO * PPQN)
+
+        if (
+            state.count == 0
+            or timestamp - state.time > max_period
+            or (state.count > 1 and abs(residual) > state.period / 2)
+        ):
+            # Lock onto this tick, continuing from the beat extrapolated
+            # so far and keeping the current tempo estimate
+            extrapolated = state.tick + (timestamp - state.time) / state.period
+            tick = max(round(extrapolated), state.tick + 1)
+            state = _TickState(timestamp, tick, state.period, 1)
+        else:
+            # The gains start from a least squares fit of the first ticks
+            # and settle on a critically damped filter
+            n = state.count + 1
+            alpha = max(self.gain, 2 * (2 * n - 1) / (n * (n + 1)))
+            beta = max(self.gain**2 / (2 - self.gain), 6 / (n * (n + 1)))
+            period = state.period + beta * residual
+            period = min(max(period, 60 / (999 * PPQN)), max_period)
+            state = _TickState(predicted + alpha * residual, state.tick + 1, period, n)
+
+        position = self._song_position
+        if position is not None:
+            self._song_position = None
+
+            # Move forward to the device's position within the bar
+            ticks_per_bar = PPQN * self.beats_per_bar
+            tick = state.tick + (position - state.tick) % ticks_per_bar
+            state = state._replace(tick=tick)
+
+        self._state = state
+
+        tempo = 60 / (state.period * PPQN)
+        if abs(tempo - self._dispatched_tempo) >= self.tempo_tolerance:
+            old_tempo, self._dispatched_tempo = self._dispatched_tempo, tempo
+            self._call_soon(self._dispatch, "tempo_change", old_tempo, tempo)
+
+    def _set_playing(self, playing: bool):
+        self._playing = playing
+        self._call_soon(self._dispatch, "playing_change", playing)
+
+    def _call_soon(self, callback, *args):
+        # The MIDI input invokes its callback on its own thread
+        if self._loop is None:
+            return
+
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # The event loop has been closed
+
+    def _dispatch(self, event: str, *args):
+        if self.env is not None:
+            self.env.dispatch(event, *args)
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        self._internal_origin = self.internal_time
+        if self._state.count == 0:
+            # Start counting beats from now until the first tick arrives
+            self._state = self._state._replace(time=self._internal_origin)
+
+        self.midi_in.add_clock_listener(self._on_message)
+        try:
+            await asyncio.sleep(math.inf)
+        finally:
+            self.midi_in.remove_clock_listener(self._on_message)
+            self._loop = None
@@ -0,0 +1,239 @@
+import math
+from bisect import bisect_left, bisect_right
+from typing import Iterable, NamedTuple
+
+from sardine_core.utils import get_numpy
+
+__all__ = ("TempoMap", "TempoSegment")
+
+
+class TempoSegment(NamedTuple):
+    """A section of a tempo map where the tempo changes linearly.
+
+    Attributes:
+        time (float): The time at which the segment starts.
+        beat (float): The beat at which the segment starts.
+        tempo (float): The tempo at the start of the segment.
+        slope (float):
+            The change in tempo per second. A slope of 0 means
+            the tempo stays constant during the segment.
+    """
+
+    time: float
+    beat: float
+    tempo: float
+    slope: float
+
+    def tempo_at(self, time: float) -> float:
+        return self.tempo + self.slope * (time - self.time)
+
+    def beat_at(self, time: float) -> float:
+        elapsed = time - self.time
+        return self.beat + (self.tempo + self.slope * elapsed / 2) * elapsed / 60
+
+    def time_at(self, beat: float) -> float:
+        beats = beat - self.beat
+        if not self.slope:
+            return self.time + beats * 60 / self.tempo
+
+        # Solving `slope / 2 * t^2 + tempo * t - beats * 60 = 0` for t,
+        # in a form that avoids cancellation when the slope is small
+        discriminant = self.tempo * self.tempo + 2 * self.slope * beats * 60
+        return self.time + 2 * beats * 60 / (self.tempo + math.sqrt(discriminant))
+
+
+class TempoMap:
+    """A piecewise mapping between time and beats.
+
+    The map is made of segments with either a constant tempo or a linear
+    tempo ramp, which allows converting between times and beats exactly
+    (no matter how many tempo changes happened before) with a binary search.
+
+    Only the latest tempo changes are kept, as determined by `max_segments`.
+    Conversions of times earlier than the first kept segment are
+    extrapolated from that segment.
+
+    The segments are stored as immutable tuples which each modification
+    replaces at once, so any thread (like the MIDI clock output) can
+    safely convert times and beats while the event loop, the only place
+    where the map should be modified, changes the tempo.
+
+    Args:
+        tempo (float): The initial tempo of the map.
+        max_segments (int): The maximum number of segments to keep.
+    """
+
+    def __init__(self, tempo: float, *, max_segments: int = 1024):
+        self.max_segments = max_segments
+        self._state: tuple[
+            tuple[TempoSegment, ...], tuple[float, ...], tuple[float, ...]
+        ] = ((), (), ())
+        self._replace(0.0, TempoSegment(0.0, 0.0, float(tempo), 0.0))
+
+    def __repr__(self) -> str:
+        segments = self._state[0]
+        return "<{} segments={} tempo={}>".format(
+            type(self).__name__,
+            len(segments),
+            segments[-1].tempo,
+        )
+
+    @property
+    def segments(self) -> list[TempoSegment]:
+        """A list of the segments in the tempo map."""
+        return list(self._state[0])
+
+    # Conversions
+
+    def segment_at_time(self, time: float) -> TempoSegment:
+        """Returns the segment active at the given time."""
+        segments, times, _ = self._state
+        if time >= times[-1]:
+            return segments[-1]
+        index = bisect_right(times, time) - 1
+        return segments[max(index, 0)]
+
+    def segment_at_beat(self, beat: float) -> TempoSegment:
+        """Returns the segment active at the given beat."""
+        segments, _, beats = self._state
+        if beat >= beats[-1]:
+            return segments[-1]
+        index = bisect_right(beats, beat) - 1
+        return segments[max(index, 0)]
+
+    def tempo_at(self, time: float) -> float:
+        """Returns the tempo at the given time."""
+        return self.segment_at_time(time).tempo_at(time)
+
+    def beat_at(self, time: float) -> float:
+        """Returns the (fractional) beat reached at the given time."""
+        return self.segment_at_time(time).beat_at(time)
+
+    def time_at(self, beat: float) -> float:
+        """Returns the time at which the given beat is reached."""
+        return self.segment_at_beat(beat).time_at(beat)
+
+    def beats_at(self, times: Iterable[float]):
+        """Converts many times into beats at once.
+
+        NumPy arrays are converted with a single vectorized search.
+        For other iterables, consecutive times in the same segment
+        (as in a sorted window of events) skip the search entirely.
+
+        Args:
+            times (Iterable[float]): The times to convert.
+
+        Returns:
+            The beats reached at each time, as a NumPy array
+            if `times` is one, or a list otherwise.
+        """
+        segments, bounds, _ = self._state
+        numpy = get_numpy(times)
+        if numpy is not None:
+            time, beat, tempo, slope = self._gather(numpy, segments, bounds, times)
+            elapsed = times - time
+            return beat + (tempo + slope * elapsed / 2) * elapsed / 60
+
+        beats = []
+        for segment, time in self._walk(segments, bounds, times):
+            beats.append(segment.beat_at(time))
+        return beats
+
+    def times_at(self, beats: Iterable[float]):
+        """Converts many beats into times at once.
+
+        This is the inverse of `beats_at()`.
+
+        Args:
+            beats (Iterable[float]): The beats to convert.
+
+        Returns:
+            The times at which each beat is reached, as a NumPy array
+            if `beats` is one, or a list otherwise.
+        """
+        segments, _, bounds = self._state
+        numpy = get_numpy(beats)
+        if numpy is not None:
+            time, beat, tempo, slope = self._gather(numpy, segments, bounds, beats)
+            # Same as `TempoSegment.time_at()`, which for a slope of 0
+            # reduces to `beats * 60 / tempo`
+            beats = (beats - beat) * 60
+            discriminant = tempo * tempo + 2 * slope * beats
+            return time + 2 * beats / (tempo + numpy.sqrt(discriminant))
+
+        times = []
+        for segment, beat in self._walk(segments, bounds, beats):
+            times.append(segment.time_at(beat))
+        return times
+
+    def _gather(self, numpy, segments, bounds, values):
+        """Returns the fields of the segments active at each value
+        as separate arrays.
+        """
+        indices = numpy.searchsorted(bounds, values, side="right") - 1
+        numpy.clip(indices, 0, None, out=indices)
+        fields = numpy.array(segments, dtype=float)[indices]
+        return fields.T
+
+    def _walk(self, segments, bounds, values: Iterable[float]):
+        """Yields each value along with the segment it falls into."""
+        start = end = math.nan
+        for value in values:
+            if not start <= value < end:
+                index = max(bisect_right(bounds, value) - 1, 0)
+                segment = segments[index]
+                start = bounds[index] if index else -math.inf
+                end = bounds[index + 1] if index + 1 < len(bounds) else math.inf
+            yield segment, value
+
+    # Modifications
+
+    def set_tempo(self, time: float, tempo: float):
+        """Changes the tempo instantly at the given time.
+
+        Any tempo changes that were planned after this time are discarded.
+
+        Args:
+            time (float): The time of the tempo change.
+            tempo (float): The new tempo.
+        """
+        beat = self.beat_at(time)
+        self._replace(time, TempoSegment(time, beat, float(tempo), 0.0))
+
+    def ramp(self, time: float, tempo: float, duration: float):
+        """Changes the tempo linearly, starting at the given time.
+
+        Any tempo changes that were planned after this time are discarded.
+
+        Args:
+            time (float): The time when the ramp starts.
+            tempo (float): The tempo to reach at the end of the ramp.
+            duration (float): The duration of the ramp in seconds.
+        """
+        if duration <= 0:
+            return self.set_tempo(time, tempo)
+
+        start_tempo = self.tempo_at(time)
+        slope = (tempo - start_tempo) / duration
+        ramp = TempoSegment(time, self.beat_at(time), start_tempo, slope)
+
+        end = time + duration
+        self._replace(
+            time, ramp, TempoSegment(end, ramp.beat_at(end), float(tempo), 0.0)
+        )
+
+    def _replace(self, time: float, *new: TempoSegment):
+        """Replaces every segment starting at or after the given time
+        with new segments.
+
+        The new state is built beforehand and published with a single
+        assignment, so readers never see a partial modification.
+        """
+        segments, times, _ = self._state
+        index = bisect_left(times, time)
+        segments = (segments[:index] + new)[-self.max_segments :]
+        self._state = (
+            segments,
+            tuple(segment.time for segment in segments),
+            tuple(segment.beat for segment in segments),
+        )
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Optional
+
+from .internal_clock import InternalClock
+
+__all__ = ("VirtualClock",)
+
+
+class VirtualClock(InternalClock):
+    """A clock running on the event loop's time.
+
+    This behaves like an `InternalClock`, except its time is read from
+    `loop.time()` instead of the system's performance counter. On a
+    `VirtualEventLoop`, the fish bowl's time then only moves forward
+    when every runner and sleep is waiting for its next deadline,
+    making whole sessions run faster than real time with
+    reproducible timing::
+
+        loop = VirtualEventLoop()
+        bowl = FishBowl(clock=VirtualClock())
+
+    On any other event loop, this simply follows real time.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def internal_time(self) -> float:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Read from another thread, or outside of the event loop
+            loop = self._loop
+            if loop is None:
+                return 0.0
+        return loop.time()
+
+    async def run(self):
+        self._loop = asyncio.get_running_loop()
+        try:
+            await super().run()
+        finally:
+            self._loop = None
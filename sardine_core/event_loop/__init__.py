@@ -6,6 +6,7 @@ from .loop import *
 from .mixin import *
 from .policy import *
 from .sansio import *
+from .virtual import *
 
 __all__ = ("install_policy", "new_event_loop")
 
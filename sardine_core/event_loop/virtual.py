@@ -0,0 +1,70 @@
+import asyncio
+import threading
+from typing import Optional
+
+from .sansio import SansIOEventLoop, SansSelector
+
+__all__ = ("VirtualEventLoop", "VirtualSelector")
+
+
+class VirtualSelector(SansSelector):
+    """A selector that skips ahead in time instead of waiting for timers.
+
+    When the event loop has nothing left to run until its next timer,
+    the loop's time jumps straight to that timer. The selector only
+    really waits when there are no timers at all, or when a thread
+    started by `run_in_executor()` has yet to return, as the thread's
+    result must be delivered at the virtual time it was started at.
+    """
+
+    def __init__(self, wake_cond: threading.Condition, loop: "VirtualEventLoop"):
+        super().__init__(wake_cond)
+        self._loop = loop
+
+    def select(self, timeout: Optional[float]):
+        loop = self._loop
+        if timeout is None or loop._executor_calls:
+            with self._wake_cond:
+                self._wake_cond.wait(None if timeout is None else loop.thread_poll)
+        elif timeout > 0:
+            loop._time += timeout
+        return self._event_list
+
+
+class VirtualEventLoop(SansIOEventLoop):
+    """An event loop running on a simulated time, discrete-event style.
+
+    Time only moves forward when every task is waiting on a timer, and
+    then moves directly to the earliest one, so sleeps return instantly
+    in real time. Paired with a `VirtualClock`, an hour of runners and
+    players finishes as fast as their functions can execute, and always
+    sees the same deadlines.
+
+    Like `SansIOEventLoop`, this has no I/O support.
+
+    Args:
+        start (float): The time to start the loop at.
+        thread_poll (float):
+            The real time to wait between checks on threads started
+            by `run_in_executor()` while they have not returned.
+    """
+
+    def __init__(self, start: float = 0.0, *, thread_poll: float = 0.001):
+        super().__init__()
+        self._selector = VirtualSelector(self._wake_cond, self)
+        self._clock_resolution = 1e-9
+        self._time = start
+        self._executor_calls = 0
+        self.thread_poll = thread_poll
+
+    def time(self) -> float:
+        return self._time
+
+    def run_in_executor(self, executor, func, *args) -> asyncio.Future:
+        future = super().run_in_executor(executor, func, *args)
+        self._executor_calls += 1
+        future.add_done_callback(self._on_executor_done)
+        return future
+
+    def _on_executor_done(self, future: asyncio.Future):
+        self._executor_calls -= 1
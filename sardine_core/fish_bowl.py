@@ -1,5 +1,9 @@
 import asyncio
 import collections
+import concurrent.futures
+import threading
+import time
+import traceback
 from typing import Hashable, Iterable, Optional, Protocol, Union
 
 from exceptiongroup import BaseExceptionGroup
@@ -7,6 +11,7 @@ from exceptiongroup import BaseExceptionGroup
 from .base import BaseClock, BaseHandler, BaseParser
 from .clock import InternalClock, Time
 from .handlers import SleepHandler
+from .logger import print
 from .scheduler import Scheduler
 from .sequences import Iterator, ListParser, Variables
 
@@ -19,8 +24,60 @@ class HookProtocol(Hashable, Protocol):
     def __call__(self, event: str, *args): ...
 
 
+class _RateLimit:
+    """A token bucket limiting how often an event can be dispatched."""
+
+    __slots__ = ("rate", "burst", "coalesce", "tokens", "updated", "pending", "handle")
+
+    def __init__(self, rate: float, burst: int, coalesce: bool):
+        self.rate = rate
+        self.burst = burst
+        self.coalesce = coalesce
+        self.tokens = float(burst)
+        self.updated: Optional[float] = None
+        # The latest arguments waiting for a token, when coalescing
+        self.pending: Optional[tuple] = None
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+    def acquire(self, now: float) -> float:
+        """Takes a token from the bucket.
+
+        Returns:
+            float:
+                0 if a token was taken, otherwise the number of seconds
+                until the next token is available.
+        """
+        if self.updated is not None:
+            elapsed = max(now - self.updated, 0.0)
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def cancel(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.pending = None
+
+
 class FishBowl:
-    """Contains all the components necessary to run the Sardine system."""
+    """Contains all the components necessary to run the Sardine system.
+
+    Args:
+        deferred_limit (int):
+            The maximum number of dispatches waiting to call their
+            deferred hooks. Once reached, the oldest dispatches are
+            dropped and counted in `deferred_dropped`.
+        deferred_executor (Optional[concurrent.futures.Executor]):
+            The executor to call deferred hooks on, like a single worker
+            `ThreadPoolExecutor`. If None, deferred hooks are called
+            on a later iteration of the event loop. Either way, deferred
+            hooks are called one at a time, in the order of dispatch.
+    """
 
     def __init__(
         self,
@@ -31,6 +88,9 @@ class FishBowl:
         sleeper: Optional[SleepHandler] = None,
         time: Optional[Time] = None,
         variables: Optional[Variables] = None,
+        *,
+        deferred_limit: int = 1024,
+        deferred_executor: Optional[concurrent.futures.Executor] = None,
     ):
         self.clock = clock or InternalClock()
         self.iterators = iterator or Iterator()
@@ -45,13 +105,33 @@ class FishBowl:
         self._resumed = asyncio.Event()
         self._vortex_subscribers: list = []
 
-        self._event_hooks: dict[Optional[str], dict[HookProtocol, None]] = (
+        # Each hook maps to whether it is deferred
+        self._event_hooks: dict[Optional[str], dict[HookProtocol, bool]] = (
             collections.defaultdict(dict)
         )
         # Reverse mapping for easier removal of hooks
         self._hook_events: dict[HookProtocol, dict[Optional[str], None]] = (
             collections.defaultdict(dict)
         )
+        # The local and global hooks of each dispatched event, merged once
+        # and cleared whenever hooks are registered or unregistered.
+        # Events without local hooks share the global hooks under None
+        self._dispatch_table: dict[Optional[str], tuple[HookProtocol, ...]] = {}
+        self._deferred_table: dict[Optional[str], tuple[HookProtocol, ...]] = {}
+
+        self.deferred_executor = deferred_executor
+        self.deferred_dropped = 0
+        self._deferred_calls: collections.deque[
+            tuple[tuple[HookProtocol, ...], str, tuple]
+        ] = collections.deque(maxlen=deferred_limit)
+        # Guards the queue and the flag, as dispatches can come from
+        # other threads and deferred hooks can run on the executor
+        self._deferred_lock = threading.Lock()
+        self._deferred_scheduled = False
+        self._deferred_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.rate_limited = 0
+        self._rate_limits: dict[str, _RateLimit] = {}
 
         self.add_handler(self.clock)
         self.add_handler(self.parser)
@@ -134,6 +214,10 @@ class FishBowl:
         """
         allowed = not self.is_running()
         if allowed:
+            try:
+                self._deferred_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
             self._alive.set()
             self._resumed.set()
             self.dispatch("start")
@@ -314,7 +398,9 @@ class FishBowl:
 
     # Hook management
 
-    def register_hook(self, event: Optional[str], hook: HookProtocol):
+    def register_hook(
+        self, event: Optional[str], hook: HookProtocol, *, deferred: bool = False
+    ):
         """Registers a hook for a given event.
 
         Whenever the fish bowl dispatches an event, the hooks associated
@@ -323,10 +409,19 @@ class FishBowl:
         Global hooks can also be registered by passing `None` as the event.
         These hooks will be called on every event that is dispatched.
         If a hook is registered both globally and for a specific event,
-        the hook will always be called once regardless.
+        the hook will always be called once regardless, and whether
+        it is deferred follows its global registration.
+
+        Deferred hooks are not called by `dispatch()` itself. The dispatch
+        is queued, and its deferred hooks are called later, either on the
+        next iteration of the event loop or on the `deferred_executor`.
+        This keeps slow hooks, like logging or updating a user interface,
+        from delaying whoever dispatched the event. Exceptions raised by
+        deferred hooks are printed instead of propagated.
 
         This method is idempotent; registering the same hook for
-        the same event will cause nothing to happen.
+        the same event will cause nothing to happen, unless
+        `deferred` changed.
 
         Args:
             event (Optional[str]):
@@ -334,13 +429,17 @@ class FishBowl:
                 If set to `None`, this will be a global hook.
             hook (HookProtocol):
                 The hook to call whenever the event is triggered.
+            deferred (bool):
+                If True, the hook is called after the dispatch
+                instead of during it.
         """
         hook_dict = self._event_hooks[event]
-        if hook in hook_dict:
+        if hook_dict.get(hook) is deferred:
             return
 
-        hook_dict[hook] = None
+        hook_dict[hook] = deferred
         self._hook_events[hook][event] = None
+        self._invalidate_dispatch_table(event)
 
     def unregister_hook(self, event: Optional[str], hook: HookProtocol):
         """Unregisters a hook for a specific event.
@@ -359,6 +458,7 @@ class FishBowl:
             hook_dict.pop(hook, None)
             if not hook_dict:
                 del self._event_hooks[event]
+            self._invalidate_dispatch_table(event)
 
         event_dict = self._hook_events.get(hook)
         if event_dict is not None:
@@ -366,8 +466,187 @@ class FishBowl:
             if not event_dict:
                 del self._hook_events[hook]
 
+    def _invalidate_dispatch_table(self, event: Optional[str]):
+        if event is None:
+            # Global hooks are part of every event's hooks
+            self._dispatch_table.clear()
+            self._deferred_table.clear()
+        else:
+            self._dispatch_table.pop(event, None)
+            self._deferred_table.pop(event, None)
+
+    def _get_hooks(self, event: Optional[str]) -> tuple[HookProtocol, ...]:
+        """Returns the hooks to call for an event, merging them if needed.
+
+        The event's deferred hooks are stored in `_deferred_table`
+        at the same time.
+
+        Only events with local hooks should be given here. Any other
+        event must be passed as None to get the global hooks, so that
+        dispatching arbitrary event names, e.g. from remote OSC messages,
+        does not grow the tables.
+        """
+        hooks = self._dispatch_table.get(event)
+        if hooks is None:
+            empty_dict: dict[HookProtocol, bool] = {}
+            local_hooks = self._event_hooks.get(event, empty_dict)
+            global_hooks = self._event_hooks.get(None, empty_dict)
+
+            all_hooks = local_hooks | global_hooks
+            hooks = tuple(h for h, deferred in all_hooks.items() if not deferred)
+            self._dispatch_table[event] = hooks
+            self._deferred_table[event] = tuple(
+                h for h, deferred in all_hooks.items() if deferred
+            )
+        return hooks
+
+    def _defer_hooks(self, hooks: tuple[HookProtocol, ...], event: str, args: tuple):
+        with self._deferred_lock:
+            calls = self._deferred_calls
+            if len(calls) == calls.maxlen:
+                self.deferred_dropped += 1  # The deque drops the oldest call
+
+            calls.append((hooks, event, args))
+            if self._deferred_scheduled:
+                return
+            # Only one drain is scheduled at a time, which keeps
+            # deferred hooks in order even on a multi-worker executor
+            self._deferred_scheduled = True
+
+        self._schedule_deferred_hooks()
+
+    def _schedule_deferred_hooks(self):
+        if self.deferred_executor is not None:
+            self.deferred_executor.submit(self._run_deferred_hooks)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Dispatched from another thread, so hand the calls over
+            # to the fish bowl's event loop
+            loop = self._deferred_loop
+            if loop is None or loop.is_closed():
+                # Without an event loop, there is no later iteration to wait for
+                return self._run_deferred_hooks()
+            loop.call_soon_threadsafe(self._run_deferred_hooks)
+            return
+
+        self._deferred_loop = loop
+        loop.call_soon(self._run_deferred_hooks)
+
+    def _run_deferred_hooks(self):
+        calls = self._deferred_calls
+        try:
+            while True:
+                with self._deferred_lock:
+                    if not calls:
+                        self._deferred_scheduled = False
+                        return
+                    hooks, event, args = calls.popleft()
+
+                try:
+                    self._run_hooks(hooks, event, *args)
+                except Exception as exc:  # pylint: disable=broad-except
+                    print(f"[red][Deferred hook exception | ({event})]")
+                    traceback.print_exception(type(exc), exc, exc.__traceback__)
+        except BaseException:
+            with self._deferred_lock:
+                self._deferred_scheduled = False
+            raise
+
+    # Rate limiting
+
+    def set_rate_limit(
+        self,
+        event: str,
+        rate: Optional[float],
+        burst: int = 1,
+        *,
+        coalesce: bool = False,
+    ):
+        """Limits how often an event can be dispatched.
+
+        Events triggered from outside of Sardine, like remote OSC messages,
+        can be dispatched as fast as they arrive. A rate limit keeps such
+        a flood from starving the scheduler: each dispatch of the event
+        takes a token from a bucket refilled at `rate` tokens per second,
+        holding at most `burst` tokens. Dispatches finding the bucket
+        empty are skipped without calling any hook, and counted in
+        `rate_limited`.
+
+        With `coalesce` enabled, the latest skipped dispatch is kept and
+        dispatched again once a token is available, so hooks always end
+        up seeing the most recent arguments. This requires the event to
+        be dispatched from a running event loop. Exceptions raised by the
+        hooks of a coalesced dispatch are printed instead of propagated.
+
+        Tokens are refilled according to the event loop's time, or the
+        performance counter when no event loop is running.
+
+        Args:
+            event (str): The event to limit.
+            rate (Optional[float]):
+                The number of dispatches allowed per second on average.
+                If None, the event's rate limit is removed.
+            burst (int):
+                The number of dispatches allowed in quick succession.
+            coalesce (bool):
+                If True, the latest skipped dispatch is delayed until
+                a token is available instead of being dropped.
+
+        Raises:
+            ValueError: The rate is not positive or the burst is below 1.
+        """
+        old_limit = self._rate_limits.pop(event, None)
+        if old_limit is not None:
+            old_limit.cancel()
+
+        if rate is None:
+            return
+        elif rate <= 0:
+            raise ValueError(f"rate must be positive, not {rate!r}")
+        elif burst < 1:
+            raise ValueError(f"burst must be at least 1, not {burst!r}")
+
+        self._rate_limits[event] = _RateLimit(rate, burst, coalesce)
+
+    def _acquire_rate_limit(self, event: str, limit: _RateLimit, args: tuple) -> bool:
+        """Takes a token for the event, returning whether it can be dispatched."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        now = time.perf_counter() if loop is None else loop.time()
+        wait = limit.acquire(now)
+        if not wait:
+            # A newer dispatch supersedes the one waiting for a token
+            limit.cancel()
+            return True
+
+        self.rate_limited += 1
+        if limit.coalesce and loop is not None:
+            limit.pending = args
+            if limit.handle is None:
+                limit.handle = loop.call_later(
+                    wait, self._flush_rate_limit, event, limit
+                )
+        return False
+
+    def _flush_rate_limit(self, event: str, limit: _RateLimit):
+        args, limit.pending = limit.pending, None
+        limit.handle = None
+        if args is None or self._rate_limits.get(event) is not limit:
+            return
+
+        try:
+            self.dispatch(event, *args)
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"[red][Coalesced hook exception | ({event})]")
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
     def _run_hooks(self, hooks: Iterable[HookProtocol], event: str, *args):
-        # TODO add hook ratelimiting
         exceptions: list[BaseException] = []
         for func in hooks:
             try:
@@ -387,13 +666,22 @@ class FishBowl:
     def dispatch(self, event: str, *args):
         """Dispatches an event to it associated hooks with the given arguments.
 
+        If the event is rate limited and has no token left, the dispatch
+        is skipped or coalesced, see `set_rate_limit()`.
+
         Args:
             event (str): The name of the event being dispatched.
             *args: The arguments to pass to the event.
         """
-        empty_dict: dict[HookProtocol, None] = {}
-        local_hooks = self._event_hooks.get(event, empty_dict)
-        global_hooks = self._event_hooks.get(None, empty_dict)
+        if self._rate_limits:
+            limit = self._rate_limits.get(event)
+            if limit is not None and not self._acquire_rate_limit(event, limit, args):
+                return
+
+        key = event if event in self._event_hooks else None
+        hooks = self._get_hooks(key)
+        deferred = self._deferred_table[key]
+        if deferred:
+            self._defer_hooks(deferred, event, args)
 
-        all_hooks = local_hooks | global_hooks
-        self._run_hooks(all_hooks, event, *args)
+        self._run_hooks(hooks, event, *args)
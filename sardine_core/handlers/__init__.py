@@ -1,10 +1,12 @@
 from .midi import *
+from .midi_clock import *
 from .midi_in import *
 from .missile import *
 from .osc import *
 from .osc_in import *
 from .osc_loop import *
 from .player import *
+from .recorder import *
 from .sender import *
 from .sleep_handler import *
 from .superdirt import *
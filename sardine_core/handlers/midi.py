@@ -7,6 +7,7 @@ import mido
 from sardine_core.logger import print
 from sardine_core.utils import alias_param
 
+from .midi_clock import MidiClockOutput
 from .sender import (
     Number,
     NumericElement,
@@ -32,9 +33,15 @@ def find_midi_out_port(name: str) -> Optional[str]:
 class MidiHandler(Sender):
     """
     MidiHandler: a class capable of reacting to most MIDI Messages.
+
+    If `clock` is True, MIDI clock is sent on the same port by a
+    `MidiClockOutput` child handler, available as `clock_output`,
+    which also takes over sending Start and Stop.
     """
 
-    def __init__(self, port_name: Optional[str] = None, nudge: float = 0.0):
+    def __init__(
+        self, port_name: Optional[str] = None, nudge: float = 0.0, clock: bool = False
+    ):
         super().__init__()
         self.active_notes: dict[tuple[int, int], asyncio.Task] = {}
 
@@ -90,6 +97,11 @@ class MidiHandler(Sender):
             "pitchwheel": self._pitch_wheel,
         }
 
+        self.clock_output: Optional[MidiClockOutput] = None
+        if clock:
+            self.clock_output = MidiClockOutput(self._midi)
+            self.add_child(self.clock_output)
+
         # Reference to the ziffers parser if needed!
         self._ziffers_parser = None
 
@@ -123,6 +135,8 @@ class MidiHandler(Sender):
 
     def setup(self):
         for event in self.events:
+            if self.clock_output is not None and event in ("start", "stop"):
+                continue
             self.register(event)
 
     def hook(self, event: str, *args):
@@ -284,7 +298,7 @@ class MidiHandler(Sender):
             pattern[key] = _resolve_if_callable(value)
 
         pattern = {**self._defaults, **pattern}
-        deadline = self.env.clock.shifted_time
+        deadline = self.env.clock.snapshot().shifted_time
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -329,7 +343,7 @@ class MidiHandler(Sender):
             pattern[key] = _resolve_if_callable(value)
 
         pattern = {**self._defaults, **pattern}
-        deadline = self.env.clock.shifted_time
+        deadline = self.env.clock.snapshot().shifted_time
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -369,7 +383,7 @@ class MidiHandler(Sender):
 
         # NOTE: No need to resolve any more callables for such a simple message...
 
-        deadline = self.env.clock.shifted_time
+        deadline = self.env.clock.snapshot().shifted_time
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -443,7 +457,7 @@ class MidiHandler(Sender):
             pattern[key] = _resolve_if_callable(value)
 
         pattern = {**self._defaults, **pattern}
-        deadline = self.env.clock.shifted_time
+        deadline = self.env.clock.snapshot().shifted_time
 
         for message in self.pattern_reduce(
             pattern,
@@ -514,7 +528,7 @@ class MidiHandler(Sender):
                 pattern[key] = _resolve_if_callable(value)
 
             pattern = {**self._defaults, **pattern}
-            deadline = self.env.clock.shifted_time
+            deadline = self.env.clock.snapshot().shifted_time
             for message in self.pattern_reduce(
                 pattern,
                 _resolve_if_callable(iterator),
@@ -533,7 +547,7 @@ class MidiHandler(Sender):
                 self.call_timed_with_nudge(deadline, self.send_midi_note, **message)
 
         def send_controls(pattern: dict) -> None:
-            deadline = self.env.clock.shifted_time
+            deadline = self.env.clock.snapshot().shifted_time
             for message in self.pattern_reduce(
                 pattern,
                 _resolve_if_callable(iterator),
@@ -581,7 +595,7 @@ class MidiHandler(Sender):
                 control_messages.append(control)
 
         def send_controls(pattern: dict) -> None:
-            deadline = self.env.clock.shifted_time
+            deadline = self.env.clock.snapshot().shifted_time
             for message in self.pattern_reduce(
                 pattern,
                 _resolve_if_callable(iterator),
@@ -644,7 +658,7 @@ class MidiHandler(Sender):
             pattern[key] = _resolve_if_callable(value)
 
         pattern = {**self._defaults, **pattern}
-        deadline = self.env.clock.shifted_time
+        deadline = self.env.clock.snapshot().shifted_time
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -0,0 +1,214 @@
+import collections
+import math
+import os
+import threading
+import time
+import traceback
+from typing import Optional
+
+import mido
+from rich import print
+
+from sardine_core.base import BaseRunnerHandler, BaseThreadedLoopMixin
+from sardine_core.scheduler.telemetry import Histogram
+
+__all__ = ("MidiClockOutput",)
+
+PPQN = 24
+"""The number of MIDI clock messages sent per beat."""
+
+_CLOCK = mido.Message("clock")
+
+
+class MidiClockOutput(BaseThreadedLoopMixin, BaseRunnerHandler):
+    """Sends MIDI clock to an output port from a dedicated thread.
+
+    Clock messages are sent 24 times per beat. Each tick is due at the
+    fish bowl time of its beat, so the output stays phase-locked to the
+    fish bowl's clock through tempo changes instead of accumulating
+    drift. The thread sleeps until shortly before each tick and spins
+    for the remainder.
+
+    Transport events are translated into MIDI transport messages:
+        - `start` sends Start, or a song position pointer followed by
+          Continue if the fish bowl is already past its first tick
+        - `resume` sends a song position pointer followed by Continue
+        - `pause` and `stop` send Stop
+
+    Song positions are rounded up to the next sixteenth note, and
+    ticks resume from there.
+
+    Exceptions raised by the port or the clock are printed and the
+    thread carries on after `idle_interval`, so an error never
+    silently ends it.
+
+    Args:
+        port (mido.ports.BaseOutput): The port to send messages to.
+        spin (float):
+            How long before each tick the thread stops sleeping and
+            starts spinning, in seconds.
+        idle_interval (float):
+            The time between checks for transport changes while
+            no clock is being sent.
+        nice (Optional[int]):
+            The niceness to give the thread. Lowering the niceness
+            usually requires elevated privileges, and is skipped
+            when not permitted. If None, the niceness is left as is.
+
+    Attributes:
+        jitter (Histogram):
+            How late each clock message was sent compared to its tick.
+        ticks (int): The number of clock messages sent.
+        resyncs (int):
+            The number of times ticks were realigned to the clock's
+            current beat, dropping or repeating ticks. This happens
+            when the thread stalls for longer than a tick, or when
+            the clock's beat jumps.
+        errors (int): The number of exceptions raised in the thread.
+    """
+
+    def __init__(
+        self,
+        port: mido.ports.BaseOutput,
+        *,
+        spin: float = 0.001,
+        idle_interval: float = 0.005,
+        nice: Optional[int] = -10,
+    ):
+        super().__init__(loop_interval=idle_interval)
+        self.port = port
+        self.spin = spin
+        self.nice = nice
+        self.jitter = Histogram()
+        self.ticks = 0
+        self.resyncs = 0
+        self.errors = 0
+
+        # Transport changes are handed to the thread so they are always
+        # ordered with the clock messages around them
+        self._transport: collections.deque[str] = collections.deque()
+        self._tick: Optional[int] = None
+        self._deadline = 0.0
+
+    def __repr__(self) -> str:
+        return "<{} port={!r} playing={} ticks={} resyncs={}>".format(
+            type(self).__name__, self.port, self.playing, self.ticks, self.resyncs
+        )
+
+    @property
+    def playing(self) -> bool:
+        """Indicates if clock messages are currently being sent."""
+        return self._tick is not None
+
+    # Handler methods
+
+    def setup(self):
+        super().setup()
+        if self.env.is_running() and not self.env.is_paused():
+            self._transport.append("start")
+
+    def hook(self, event: str, *args):
+        super().hook(event, *args)
+        if event in ("start", "resume"):
+            self._transport.append(event)
+        else:
+            self._transport.append("stop")
+
+    # Thread methods
+
+    def before_loop(self):
+        self._tick = None
+        if self.nice is not None:
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.nice)
+            except (AttributeError, OSError):
+                # Not supported by the platform, or not permitted
+                pass
+
+    def loop(self):
+        try:
+            self._step()
+        except Exception as exc:
+            self.errors += 1
+            print(f"[red][MIDI clock exception | ({self.port})]")
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+            time.sleep(self.loop_interval)
+
+    def after_loop(self):
+        self._stop_clock()
+
+    def get_loop_interval(self) -> float:
+        if self._transport:
+            return 0.0
+        elif self._tick is None:
+            return self.loop_interval
+        return max(0.0, self._deadline - self.env.clock.time - self.spin)
+
+    # Internal methods
+
+    def _step(self):
+        while self._transport:
+            self._handle_transport(self._transport.popleft())
+
+        if self._tick is None:
+            return
+
+        clock = self.env.clock
+        now = clock.time
+        if self._deadline - now > self.spin:
+            return
+
+        while now < self._deadline:
+            # Pausing or stopping freezes the clock before the deadline
+            if self._transport:
+                return
+
+            time.sleep(0)  # Let the event loop have the GIL while spinning
+            now = clock.time
+
+        self.port.send(_CLOCK)
+        self.jitter.record(now - self._deadline)
+        self.ticks += 1
+        self._advance(self._tick + 1)
+
+    def _advance(self, tick: int):
+        clock = self.env.clock
+        ticks_ahead = tick - clock.beat_at_time(clock.time) * PPQN
+
+        # The next tick is normally at most one tick ahead of the clock.
+        # Falling a tick behind is caught up on, anything more is realigned.
+        if not -1 < ticks_ahead <= 2:
+            tick = math.ceil(clock.beat_at_time(clock.time) * PPQN)
+            self.resyncs += 1
+
+        self._tick = tick
+        self._deadline = clock.time_at_beat(tick / PPQN)
+
+    def _handle_transport(self, event: str):
+        if event == "stop":
+            self._stop_clock()
+            return
+        elif self._tick is not None:
+            return
+
+        clock = self.env.clock
+        beat = clock.beat_at_time(clock.time)
+
+        # Song positions are counted in sixteenth notes
+        position = math.ceil(beat * 4)
+        if event == "start" and beat * PPQN < 1:
+            position = 0
+
+        if position == 0:
+            self.port.send(mido.Message("start"))
+        else:
+            self.port.send(mido.Message("songpos", pos=position % 16384))
+            self.port.send(mido.Message("continue"))
+
+        self._tick = position * PPQN // 4
+        self._deadline = clock.time_at_beat(position / 4)
+
+    def _stop_clock(self):
+        if self._tick is not None:
+            self.port.send(mido.Message("stop"))
+            self._tick = None
@@ -1,7 +1,8 @@
 import sys
+import time
 from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import mido
 from mido import Message, get_input_names, open_input, parse_string_stream
@@ -11,6 +12,9 @@ from sardine_core.logger import print
 
 __all__ = ("MidiInHandler",)
 
+CLOCK_MESSAGES = frozenset(("clock", "start", "continue", "stop", "songpos"))
+"""The types of messages sent to clock listeners."""
+
 
 def find_midi_in_port(name: str) -> Optional[str]:
     """Find the port name of a MIDI-In port by name."""
@@ -29,10 +33,13 @@ class MidiInHandler(BaseHandler):
     Useful for mapping controllers to control / interact with Sardine.
 
     The incoming messages are stored in a queue and retrieved in FIFO order.
+    MIDI clock and transport messages are instead passed on to the clock
+    listeners added with `add_clock_listener()`, like a `MidiClock`.
     """
 
     def __init__(self, port_name: Optional[str] = None):
         super().__init__()
+        self._clock_listeners: list[Callable[[mido.Message, float], None]] = []
         self.queues = {}
         self._last_item = {}
         self._last_value = 0
@@ -57,6 +64,21 @@ class MidiInHandler(BaseHandler):
         """String representation of the MIDI Listener"""
         return f"<MidiListener: {self._input}>"
 
+    def add_clock_listener(self, listener: Callable[[mido.Message, float], None]):
+        """Adds a function to call for each MIDI clock or transport message.
+
+        Listeners are called on the MIDI input's thread with the message
+        and the `time.perf_counter()` at which it was received.
+        """
+        self._clock_listeners.append(listener)
+
+    def remove_clock_listener(self, listener: Callable[[mido.Message, float], None]):
+        """Removes a function added with `add_clock_listener()`, if present."""
+        try:
+            self._clock_listeners.remove(listener)
+        except ValueError:
+            pass
+
     def _get_index_for_control_change(self, control: int, channel: int):
         """Generate a new dictionnary key for each control change route"""
         return f"ctrl:{control},{channel}"
@@ -75,6 +97,12 @@ class MidiInHandler(BaseHandler):
                 self.queues[index] = deque(maxlen=20)
                 self.queues[index].appendleft(message)
 
+        if message and message.type in CLOCK_MESSAGES:
+            timestamp = time.perf_counter()
+            for listener in self._clock_listeners:
+                listener(message, timestamp)
+            return
+
         if message:
             # Case where the message is a control change
             if hasattr(message, "control"):
@@ -23,9 +23,11 @@ class OSCHandler(Sender):
         name: str = "OSCSender",
         ahead_amount: float = 0.0,
         nudge: float = 0.0,
+        timetags: bool = False,
     ):
         super().__init__()
         self.loop = loop
+        self.timetags = timetags
 
         # Setting up OSC Connexion
         self._ip, self._port, self._name = (ip, port, name)
@@ -53,8 +55,10 @@ class OSCHandler(Sender):
     def defaults(self):
         return self._defaults
 
-    def _send(self, address: str, message: list) -> None:
-        bun = self._make_bundle([[address, message]])
+    def _send(
+        self, address: str, message: list, timestamp: Optional[float] = None
+    ) -> None:
+        bun = self._make_bundle([[address, message]], timestamp)
         osc_send(bun, self._name)
 
     def _send_bundle(self, messages: list) -> None:
@@ -69,7 +73,7 @@ class OSCHandler(Sender):
         """
         if nudge:
             self.call_timed_with_nudge(
-                self.env.clock.shifted_time, self._send, address, message
+                self.env.clock.snapshot().shifted_time, self._send, address, message
             )
         else:
             self._send(address, message)
@@ -77,14 +81,18 @@ class OSCHandler(Sender):
     def send_raw_bundle(self, messages: list, nudge=False) -> None:
         if nudge:
             self.call_timed_with_nudge(
-                self.env.clock.shifted_time, self._send_bundle, messages
+                self.env.clock.snapshot().shifted_time, self._send_bundle, messages
             )
         else:
             self._send_bundle(messages)
 
-    def _make_bundle(self, messages: list) -> oscbuildparse.OSCBundle:
+    def _make_bundle(
+        self, messages: list, timestamp: Optional[float] = None
+    ) -> oscbuildparse.OSCBundle:
+        if timestamp is None:
+            timestamp = time.time()
         return oscbuildparse.OSCBundle(
-            oscbuildparse.unixtime2timetag(time.time() + self._ahead_amount),
+            oscbuildparse.unixtime2timetag(timestamp + self._ahead_amount),
             [
                 oscbuildparse.OSCMessage(message[0], None, message[1])
                 for message in messages
@@ -118,7 +126,8 @@ class OSCHandler(Sender):
         for key, value in rest_of_pattern.items():
             pattern[key] = _resolve_if_callable(value)
 
-        deadline = self.env.clock.shifted_time
+        now = self.env.clock.snapshot()
+        deadline = now.shifted_time + now.beat_duration * self.nudge
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -132,7 +141,7 @@ class OSCHandler(Sender):
                 serialized = list(chain(*sorted(message.items())))
             else:
                 serialized = list(chain(*message.items()))
-            self.call_timed_with_nudge(deadline, self._send, f"/{address}", serialized)
+            self.call_timetagged(deadline, self._send, f"/{address}", serialized)
 
     @alias_param(name="iterator", alias="i")
     @alias_param(name="divisor", alias="d")
@@ -168,7 +177,8 @@ class OSCHandler(Sender):
         for key, value in rest_of_pattern.items():
             pattern[key] = _resolve_if_callable(value)
 
-        deadline = self.env.clock.shifted_time
+        now = self.env.clock.snapshot()
+        deadline = now.shifted_time + now.beat_duration * self.nudge
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -191,4 +201,4 @@ class OSCHandler(Sender):
                 serialized = list(
                     chain(*[_util_flatten(value) for value in message.values()])
                 )
-            self.call_timed_with_nudge(deadline, self._send, f"/{address}", serialized)
+            self.call_timetagged(deadline, self._send, f"/{address}", serialized)
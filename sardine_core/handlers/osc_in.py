@@ -92,7 +92,7 @@ class OSCInHandler(BaseHandler):
         if watch:
             self.watch(address)
 
-    def remote(self, address: str):
+    def remote(self, address: str, rate: Optional[float] = None, burst: int = 1):
         """
         Remote for controlling Sardine from an external client by talking directly to
         the fish_bowl dispatch system. If the address matches an internal function de-
@@ -100,14 +100,18 @@ class OSCInHandler(BaseHandler):
         forwarded as well.
 
         address: address matching to a dispatch function (like 'pause', 'stop', etc..)
+        rate: maximum number of dispatches per second for this address. Messages
+        arriving faster are coalesced, only the latest one being dispatched.
+        burst: number of messages dispatched in quick succession before limiting.
         """
         print("Attaching address to matching incoming message")
+        if rate is not None:
+            self.env.set_rate_limit(address, rate, burst, coalesce=True)
 
-        def event_dispatcher(address, *args) -> None:
-            print(f"Event Name: {address}")
+        def event_dispatcher(*args) -> None:
             self.env.dispatch(address, *args)
 
-        osc_method(address, event_dispatcher, argscheme=OSCARG_DATA)
+        osc_method(address, event_dispatcher, argscheme=OSCARG_DATAUNPACK)
 
     def get(self, address: str) -> Union[Any, None]:
         """Get a watched value. Return None if not found"""
@@ -1,12 +1,15 @@
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Optional, ParamSpec, Self, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Optional, ParamSpec, Self, TypeVar
 
 from sardine_core.base import BaseHandler
 from sardine_core.handlers.sender import Number, NumericElement, Sender
 from sardine_core.scheduler import AsyncRunner
 from sardine_core.utils import Quant, Span, alias_param, get_deadline_from_quant, lerp
 
+if TYPE_CHECKING:
+    from sardine_core.fish_bowl import FishBowl
+
 __all__ = ("Player",)
 
 P = ParamSpec("P")
@@ -45,6 +48,7 @@ class PatternInformation:
     quant: Quant
     timespan: Optional[float]
     until: Optional[int]
+    lookahead: float
 
 
 class Player(BaseHandler):
@@ -54,18 +58,42 @@ class Player(BaseHandler):
     quick interface for the user to output musical and data patterns. Players are han-
     dling the whole lifetime of a pattern, from its initial entry in the scheduler to
     its death when the silence() or panic() method is called.
+
+    Since most players are never used, they are kept as cheap as possible until
+    then: the runner is only created when first needed, and if a fish bowl is
+    given, the player only adds itself to it once its `env` is first accessed.
+
+    Args:
+        name (str): The name of the player, also given to its runner.
+        bowl (Optional[FishBowl]):
+            The fish bowl to lazily add this player to.
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, *, bowl: "Optional[FishBowl]" = None):
         super().__init__()
         self._name = name
-        self.runner = AsyncRunner(name=name)
+        self._bowl = bowl
+        self._runner: Optional[AsyncRunner] = None
         self._period: int | float = 1.0
 
+    @property
+    def env(self) -> "Optional[FishBowl]":
+        if self._env is None and self._bowl is not None:
+            bowl, self._bowl = self._bowl, None
+            bowl.add_handler(self)
+        return self._env
+
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def runner(self) -> AsyncRunner:
+        """The runner scheduling this player's patterns, created on first access."""
+        if self._runner is None:
+            self._runner = AsyncRunner(name=self._name)
+        return self._runner
+
     def fit_period_to_timespan(self, period: NumericElement, timespan: float):
         """
         Fit a given period to a certain timestamp (forcing a pattern to have a fixed
@@ -101,6 +129,7 @@ class Player(BaseHandler):
         divisor: NumericElement = 1,
         rate: NumericElement = 1,
         quant: Quant = "bar",
+        lookahead: float = 0.0,
         **kwargs: P.kwargs,
     ) -> PatternInformation:
         """Entry point of a pattern into the Player"""
@@ -120,6 +149,7 @@ class Player(BaseHandler):
             quant,
             timespan,
             until,
+            lookahead,
         )
 
     def __rshift__(self, pattern: Optional[PatternInformation]) -> None:
@@ -193,6 +223,8 @@ class Player(BaseHandler):
 
     def stop(self):
         """Stop the player by removing the Player"""
+        if self._runner is None:
+            return
         self.env.scheduler.stop_runner(self.runner)
 
     def push(self, pattern: Optional[PatternInformation]):
@@ -203,15 +235,16 @@ class Player(BaseHandler):
         """
         # This is a local equivalent to the silence() function.
         if pattern is None:
-            return self.env.scheduler.stop_runner(self.runner)
+            return self.stop()
         elif not self.runner.is_running():
             # Assume we are queuing the first state
             self.runner.iter = 0
             self.runner.reset_states()
 
-        # Forcibly reset the interval shift back to 0 to make sure
+        # Forcibly reset the beat shift back to 0 to make sure
         # the new pattern can be synchronized
-        self.runner.interval_shift = 0.0
+        self.runner.beat_shift = 0.0
+        self.runner.lookahead = pattern.lookahead
 
         func = for_(pattern.until)(self.func) if pattern.until else self.func
         deadline = get_deadline_from_quant(self.env.clock, pattern.quant)
@@ -0,0 +1,82 @@
+from typing import Any, Callable, NamedTuple
+
+from sardine_core.utils import alias_param
+
+from .sender import Number, NumericElement, Sender, _resolve_if_callable
+
+__all__ = ("RecordedMessage", "RecordingSender")
+
+
+class RecordedMessage(NamedTuple):
+    """A message captured by a `RecordingSender`."""
+
+    deadline: float
+    """The fish bowl time the message was scheduled for."""
+    time: float
+    """The fish bowl time the message was actually sent at."""
+    beat: float
+    """The beat at which the message was sent."""
+    message: dict[str, Any]
+
+
+class RecordingSender(Sender):
+    """A sender that records its messages instead of sending them anywhere.
+
+    Patterns are reduced and scheduled like any other sender, and each
+    message is recorded at the time it would have been sent. Combined
+    with a `VirtualClock`, this allows running patterns offline and
+    comparing their output exactly::
+
+        recorder = RecordingSender()
+        bowl.add_handler(recorder)
+        player = Player("rec", bowl=bowl)
+        player * Player._play_factory(recorder, recorder.send, note=[60, 62], p=0.5)
+
+    Attributes:
+        messages (list[RecordedMessage]):
+            Every message recorded so far, in the order they were sent.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list[RecordedMessage] = []
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} messages={len(self.messages)}>"
+
+    def clear(self):
+        """Forgets every recorded message."""
+        self.messages.clear()
+
+    @alias_param(name="iterator", alias="i")
+    @alias_param(name="divisor", alias="d")
+    @alias_param(name="rate", alias="r")
+    def send(
+        self,
+        iterator: Number | Callable[[], Number] = 0,
+        divisor: NumericElement | Callable[[], NumericElement] = 1,
+        rate: NumericElement | Callable[[], NumericElement] = 1,
+        **pattern: Any,
+    ) -> None:
+        if self.apply_conditional_mask_to_bars(pattern=pattern):
+            return
+
+        # Evaluate all potential callables
+        for key, value in pattern.items():
+            pattern[key] = _resolve_if_callable(value)
+
+        deadline = self.env.clock.snapshot().shifted_time
+        for message in self.pattern_reduce(
+            pattern,
+            _resolve_if_callable(iterator),
+            _resolve_if_callable(divisor),
+            _resolve_if_callable(rate),
+        ):
+            self.call_timed(deadline, self._record, deadline, message)
+
+    def _record(self, deadline: float, message: dict[str, Any]):
+        clock = self.env.clock
+        time = clock.time
+        self.messages.append(
+            RecordedMessage(deadline, time, clock.beat_at_time(time), message)
+        )
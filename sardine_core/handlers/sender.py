@@ -1,9 +1,14 @@
 import asyncio
+import contextvars
+import functools
+import inspect
+import time
 from math import floor
 from random import random
 from typing import Any, Callable, Generator, Optional, ParamSpec, TypeVar, Union
 
 from sardine_core.base import BaseHandler
+from sardine_core.scheduler.async_runner import executor_loop
 from sardine_core.sequences import euclid
 from sardine_core.utils import maybe_coro
 
@@ -56,11 +61,16 @@ class Sender(BaseHandler):
     reduce_polyphonic_message: turn any dict pattern into a list of patterns.
     pattern_reduce: reduce a pattern to a dictionary of values corresponding to iterator
                     index.
+
+    Senders that are able to timestamp their messages (e.g. with OSC bundles) can
+    enable `timetags` to send messages as soon as they are rendered, leaving the
+    receiving end in charge of playing them on time.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._timed_tasks: set[asyncio.Task] = set()
+        self.timetags = False
 
     def call_timed(
         self,
@@ -72,7 +82,28 @@ class Sender(BaseHandler):
         """Schedules the given (a)synchronous function to be called.
 
         Senders should always use this method to properly account for time shift.
+
+        This can also be called from a runner offloaded to a thread executor,
+        in which case the call is handed back to the event loop.
+
+        Calls made while the fish bowl is stopped are dropped.
         """
+        loop = executor_loop.get()
+        if loop is not None:
+            callback = functools.partial(
+                self.call_timed, deadline, func, *args, **kwargs
+            )
+            # Run in an empty context to not recurse back into this branch
+            loop.call_soon_threadsafe(callback, context=contextvars.Context())
+            return
+        elif not self.env.is_running():
+            return
+
+        if not inspect.iscoroutinefunction(func):
+            # Synchronous functions can be called straight from a timer
+            if kwargs:
+                func = functools.partial(func, **kwargs)
+            return self.env.sleeper.call_at(deadline, func, *args)
 
         async def scheduled_func():
             await self.env.sleeper.sleep_until(deadline)
@@ -82,10 +113,45 @@ class Sender(BaseHandler):
         self._timed_tasks.add(task)
         task.add_done_callback(self._timed_tasks.discard)
 
+    def call_timetagged(
+        self,
+        deadline: float,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> None:
+        """Schedules the given function to be called with a timestamp.
+
+        If `timetags` is enabled, the function is called immediately with
+        the UNIX timestamp of the deadline passed as `timestamp=`.
+        Otherwise, this falls back to `call_timed()` and the function
+        is expected to timestamp the message by itself.
+
+        Like `call_timed()`, calls made from a runner offloaded to
+        a thread executor are handed back to the event loop.
+        """
+        loop = executor_loop.get()
+        if loop is not None:
+            callback = functools.partial(
+                self.call_timetagged, deadline, func, *args, **kwargs
+            )
+            loop.call_soon_threadsafe(callback, context=contextvars.Context())
+            return
+
+        if self.timetags:
+            timestamp = self.deadline_to_timestamp(deadline)
+            func(*args, timestamp=timestamp, **kwargs)
+        else:
+            self.call_timed(deadline, func, *args, **kwargs)
+
+    def deadline_to_timestamp(self, deadline: float) -> float:
+        """Converts a deadline in fish bowl time into a UNIX timestamp."""
+        return time.time() + (deadline - self.env.clock.time)
+
     def call_timed_with_nudge(self, deadline, method, *args, **kwargs):
         """Applying nudge to call_timed method"""
         return self.call_timed(
-            deadline + (self.env.clock.beat_duration * self.nudge),
+            deadline + (self.env.clock.snapshot().beat_duration * self.nudge),
             method,
             *args,
             **kwargs,
@@ -204,7 +270,7 @@ class Sender(BaseHandler):
             """
 
             on = on[0] if isinstance(on, tuple) else on
-            return self.env.clock.bar % on == 0
+            return self.env.clock.snapshot().bar % on == 0
 
         if loaf is None and on is None:
             return True
@@ -212,7 +278,7 @@ class Sender(BaseHandler):
         if loaf is None:
             return mod_cycles(on=on)
 
-        measure = self.env.clock.bar
+        measure = self.env.clock.snapshot().bar
         elapsed_bars = measure // loaf
         bar_in_current_group = measure - (elapsed_bars * loaf)
 
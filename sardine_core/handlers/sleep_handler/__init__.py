@@ -1,15 +1,17 @@
 import asyncio
 import heapq
-from collections import deque
-from typing import Optional, Union
+import time
+from typing import Callable, Optional, Union
 
 from exceptiongroup import BaseExceptionGroup
 
 from sardine_core.base import BaseHandler
 
+from .jitter import *
 from .time_handle import *
+from .time_handle import TimedCall
 
-__all__ = ("SleepHandler", "TimeHandle")
+__all__ = ("JitterEstimator", "SleepHandler", "TimeHandle")
 
 NUMBER = Union[float, int]
 
@@ -19,29 +21,79 @@ class SleepHandler(BaseHandler):
 
     Args:
         delta_record_size (int):
-            The maximum number of recordings to store when averaging the
-            delta for anti-drift. Set to 0 to disable drift correction.
-            WARNING: this is an experimental setting and may severely degrade
-            sleep accuracy when enabled.
+            The number of recent wakeup errors used to estimate how early
+            sleeps should be armed, which is calibrated when the fish bowl
+            starts. Set to 0 to disable this correction, in which case
+            wakeup errors are still measured in `jitter`.
         poll_interval (float):
-            The polling interval to use when the current clock does not
-            support its own method of sleep.
+            The shortest polling interval to use when the current clock
+            does not support its own method of sleep. The poller waits
+            longer when the next deadline is further away.
+        spin_guard (float):
+            If greater than 0, sleeps on clocks following the event loop's
+            time wake up this many seconds early, then busy-wait on the
+            performance counter for the rest of the sleep. This trades
+            CPU time for sub-millisecond accuracy, and blocks the event
+            loop while spinning, and replaces the lead estimated from
+            `delta_record_size`. Set to 0 to disable spinning.
+        spin_budget (float):
+            The maximum number of seconds that can be spent spinning
+            in each second. Once exhausted, sleeps wait for the event
+            loop's timer until the next second begins.
+        lead_percentile (float):
+            The percentile of recent wakeup errors to arm sleeps early by.
+            Lower values make early wakeups rarer.
+        calibration_size (int):
+            The number of short sleeps to measure when the fish bowl
+            starts or the clock is swapped, so that the lead is known
+            before the first real sleep. Only used when the correction
+            is enabled.
+
+    Attributes:
+        jitter (JitterEstimator):
+            The wakeup error statistics for the current clock and event
+            loop, including the lead currently in use.
     """
 
     def __init__(
         self,
-        delta_record_size: int = 0,
+        delta_record_size: int = 64,
         poll_interval: float = 0.001,
+        *,
+        spin_guard: float = 0.0,
+        spin_budget: float = 0.05,
+        lead_percentile: float = 25.0,
+        calibration_size: int = 16,
     ):
         super().__init__()
 
         self.poll_interval = poll_interval
+        self.spin_guard = spin_guard
+        self.spin_budget = spin_budget
+        self.calibration_size = calibration_size
+        self.correct_lead = delta_record_size > 0
+        self.jitter = JitterEstimator(
+            delta_record_size or 64, lead_percentile=lead_percentile
+        )
 
         self._poll_task: Optional[asyncio.Task] = None
+        self._poll_wake: Optional[asyncio.Future] = None
         self._interrupt_event = asyncio.Event()
         self._wake_event = asyncio.Event()
         self._time_handles: list[TimeHandle] = []
-        self._previous_deltas: deque[float] = deque(maxlen=delta_record_size)
+        self._calibrate_task: Optional[asyncio.Task] = None
+        self._jitter_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Futures of sleeps parked on the event loop's timer, resolved
+        # with True when interrupted by a pause or stop
+        self._loop_sleeps: set[asyncio.Future] = set()
+        self._timed_calls: set[TimedCall] = set()
+        # Tasks of timed calls for clocks that do not follow loop time
+        self._call_tasks: set[asyncio.Task] = set()
+
+        # Spin time accounting for the current one-second window
+        self._spin_window: float = 0.0
+        self._spin_spent: float = 0.0
 
     def __repr__(self) -> str:
         return f"<{type(self).__name__} interval={self.poll_interval}>"
@@ -69,6 +121,8 @@ class SleepHandler(BaseHandler):
             return
 
         clock = self.env.clock
+        if clock.uses_loop_time():
+            return await self._sleep_on_loop(deadline)
 
         while True:
             # Handle stop/pauses before proceeding
@@ -76,7 +130,7 @@ class SleepHandler(BaseHandler):
                 asyncio.current_task().cancel()
             await self._wake_event.wait()
 
-            corrected_deadline = deadline - self._get_avg_delta()
+            corrected_deadline = deadline - self._get_lead()
 
             # Use clock sleep if available, else polling implementation
             if clock.can_sleep():
@@ -106,15 +160,192 @@ class SleepHandler(BaseHandler):
                 )
 
             if sleep_task in done:
-                self._previous_deltas.append(delta)
+                self.jitter.record(delta)
                 return
 
+    def call_at(self, deadline: NUMBER, callback: Callable[..., object], *args):
+        """Schedules a synchronous callback for the given time.
+
+        The deadline is based on the fish bowl clock's time, and the callback
+        follows the same rules as `sleep_until()`: it is postponed while the
+        fish bowl is paused and discarded when the fish bowl stops.
+
+        When the clock's time follows the event loop's time, this schedules
+        the callback directly on the loop instead of creating a task.
+
+        Args:
+            deadline (NUMBER): The time at which the callback should be called.
+            callback (Callable[..., object]): The function to call.
+            *args: The positional arguments to pass to the callback.
+
+        Raises:
+            RuntimeError: The fish bowl has not started.
+        """
+        if self.env is None:
+            raise ValueError("SleepHandler must be added to a fish bowl")
+        elif not self.env.is_running():
+            raise RuntimeError("cannot use call_at until fish bowl has started")
+        elif not self.env.clock.uses_loop_time():
+            return self._call_at_in_task(deadline, callback, args)
+
+        call = TimedCall(deadline, callback, args)
+        self._timed_calls.add(call)
+        if not self.env.is_paused():
+            self._schedule_call(call)
+
     # Internal methods
 
-    def _get_avg_delta(self) -> float:
-        if self._previous_deltas:
-            return sum(self._previous_deltas) / len(self._previous_deltas)
-        return 0.0
+    def _call_at_in_task(self, deadline: NUMBER, callback: Callable, args: tuple):
+        async def scheduled_call():
+            await self.sleep_until(deadline)
+            callback(*args)
+
+        task = asyncio.create_task(scheduled_call())
+        self._call_tasks.add(task)
+        task.add_done_callback(self._call_tasks.discard)
+
+    def _schedule_call(self, call: TimedCall):
+        loop = asyncio.get_running_loop()
+        delay = call.when - self._get_lead() - self.env.clock.time
+        call.handle = loop.call_at(loop.time() + delay, self._run_call, call)
+
+    def _run_call(self, call: TimedCall):
+        if self.env.clock.time < call.when - self._get_lead():
+            return self._schedule_call(call)  # Fired early, see _sleep_on_loop()
+
+        self._timed_calls.discard(call)
+        call.callback(*call.args)
+
+    def _interrupt_loop_sleeps(self):
+        for future in self._loop_sleeps:
+            if not future.done():
+                future.set_result(True)
+
+        for call in self._timed_calls:
+            if call.handle is not None:
+                call.handle.cancel()
+                call.handle = None
+
+    def _get_spin_guard(self) -> float:
+        """Returns the guard band to spin through for the next sleep,
+        or 0 if spinning is disabled or the budget is exhausted.
+        """
+        if self.spin_guard <= 0:
+            return 0.0
+
+        now = time.perf_counter()
+        if now - self._spin_window >= 1:
+            self._spin_window = now
+            self._spin_spent = 0.0
+
+        if self._spin_spent >= self.spin_budget:
+            return 0.0
+        return self.spin_guard
+
+    def _spin_until(self, deadline: NUMBER):
+        """Busy-waits until the clock reaches the given deadline."""
+        clock = self.env.clock
+        start = time.perf_counter()
+        limit = start + self.spin_guard
+
+        # The limit bounds the spin in case the clock's time stops
+        now = start
+        while clock.time < deadline and now < limit:
+            now = time.perf_counter()
+
+        self._spin_spent += now - start
+
+    async def _sleep_on_loop(self, deadline: NUMBER) -> None:
+        """Sleeps with a single timer on the event loop.
+
+        This maps the deadline onto `loop.time()` and parks on a future set
+        by `loop.call_at()`, which is much cheaper than creating tasks for
+        sleeping and interrupting. A pause or stop resolves the future early.
+
+        If `spin_guard` is set, the timer fires early and the remaining
+        time is spent spinning, as asyncio timers commonly wake up late.
+        """
+        loop = asyncio.get_running_loop()
+        clock = self.env.clock
+
+        while True:
+            # Handle stop/pauses before proceeding
+            if self._is_terminated():
+                asyncio.current_task().cancel()
+            if not self._wake_event.is_set():
+                await self._wake_event.wait()
+
+            # Spinning through the guard band already makes up for late
+            # timers, so the lead is only applied when not spinning
+            guard = self._get_spin_guard()
+            lead = 0.0 if guard > 0 else self._get_lead()
+            wakeup = deadline - lead - guard
+
+            # Read the clock before the loop so that any delay in between
+            # makes the timer late rather than early
+            delay = wakeup - clock.time
+            future = loop.create_future()
+            handle = loop.call_at(loop.time() + delay, _resolve_future, future)
+            self._loop_sleeps.add(future)
+            try:
+                interrupted = await future
+            finally:
+                handle.cancel()
+                self._loop_sleeps.discard(future)
+
+            # Event loops that cache their time, like uvloop, can also fire
+            # timers slightly early, in which case the sleep is re-armed
+            if interrupted or clock.time < wakeup:
+                continue
+
+            self.jitter.record(clock.time - wakeup)
+            if guard > 0:
+                self._spin_until(deadline)
+            return
+
+    def _get_lead(self) -> float:
+        return self.jitter.lead if self.correct_lead else 0.0
+
+    def _start_calibration(self):
+        """Resets the wakeup error statistics if the event loop changed,
+        and starts measuring them if the lead has not been estimated yet.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._jitter_loop:
+            self._jitter_loop = loop
+            self.jitter.reset()
+
+        if (
+            self.correct_lead
+            and self.calibration_size > 0
+            and self.jitter.count < self.calibration_size
+            and not self._is_calibrating()
+        ):
+            self._calibrate_task = asyncio.create_task(self._calibrate())
+
+    def _is_calibrating(self) -> bool:
+        return self._calibrate_task is not None and not self._calibrate_task.done()
+
+    async def _calibrate(self, interval: float = 0.001):
+        """Measures the wakeup error of a burst of short event loop timers.
+
+        Real sleeps feed the same estimator, so this stops early
+        once enough wakeups have been recorded.
+        """
+        loop = asyncio.get_running_loop()
+        clock = self.env.clock
+
+        while self.jitter.count < self.calibration_size:
+            expected = clock.time + interval
+            future = loop.create_future()
+            handle = loop.call_later(interval, _resolve_future, future)
+            try:
+                await future
+            finally:
+                handle.cancel()
+            self.jitter.record(clock.time - expected)
+
+        self.jitter.update()
 
     def _check_running(self):
         if self._time_handles and not self._is_polling():
@@ -132,6 +363,11 @@ class SleepHandler(BaseHandler):
             heapq.heappush(self._time_handles, handle)
             self._check_running()
 
+            # Wake up the poller if it is waiting past this deadline
+            wake = self._poll_wake
+            if self._time_handles[0] is handle and wake is not None:
+                _resolve_future(wake)
+
         return handle
 
     def _is_terminated(self) -> bool:
@@ -141,11 +377,27 @@ class SleepHandler(BaseHandler):
     def _is_polling(self) -> bool:
         return self._poll_task is not None and not self._poll_task.done()
 
+    def _get_poll_delay(self) -> float:
+        """Returns how long the poller should wait before its next poll.
+
+        Far from the earliest deadline, this waits half of the remaining
+        time so that the poller catches up with any drift between the
+        clock and the event loop. Close to the deadline, it polls at
+        `poll_interval`, as some event loops like uvloop truncate
+        shorter timers to zero.
+        """
+        remaining = self._time_handles[0].when - self.env.clock.time
+        if remaining > 4 * self.poll_interval:
+            return remaining / 2
+        return self.poll_interval
+
     async def _run_poll(self):
         """Continuously polls the clock's time until all TimeHandles resolve.
 
         TimeHandles will resolve when their deadline is reached,
-        or they are cancelled.
+        or they are cancelled. Between polls, the poller waits according
+        to `_get_poll_delay()`, and is woken up early when a handle with
+        an earlier deadline is created.
 
         Note that when a pause/stop occurs, all `sleep_until()` calls
         cancel the `_sleep_until()` task, which should indirectly
@@ -163,7 +415,17 @@ class SleepHandler(BaseHandler):
                 else:
                     # all handles afterwards are either still waiting or cancelled
                     break
-            await asyncio.sleep(self.poll_interval)
+            if not self._time_handles:
+                break
+
+            loop = asyncio.get_running_loop()
+            self._poll_wake = wake = loop.create_future()
+            timer = loop.call_later(self._get_poll_delay(), _resolve_future, wake)
+            try:
+                await wake
+            finally:
+                timer.cancel()
+                self._poll_wake = None
 
     async def _sleep_until(self, deadline: NUMBER):
         await self._create_handle(deadline)
@@ -171,19 +433,47 @@ class SleepHandler(BaseHandler):
     # Handler hooks
 
     def setup(self):
-        for event in ("start", "pause", "resume", "stop"):
+        for event in ("start", "pause", "resume", "stop", "clock_swap"):
             self.register(event)
 
     def teardown(self):
         self._interrupt_event.set()
         self._wake_event.set()  # just in case
+        self._interrupt_loop_sleeps()
+
+        if self._is_calibrating():
+            self._calibrate_task.cancel()
+
+        for task in self._call_tasks:
+            task.cancel()
+        self._call_tasks.clear()
+        self._timed_calls.clear()
 
     def hook(self, event: str, *args):
+        if event == "start":
+            self._start_calibration()
+        elif event == "clock_swap":
+            # The new clock may wake up differently, so measure it again
+            self._jitter_loop = None
+            if self._is_calibrating():
+                self._calibrate_task.cancel()
+            if self.env.is_running():
+                self._start_calibration()
+
         if event in ("start", "resume"):
             self._wake_event.set()
             self._interrupt_event.clear()
+            for call in self._timed_calls:
+                if call.handle is None:
+                    self._schedule_call(call)
         if event == "pause":
             self._interrupt_event.set()
             self._wake_event.clear()
+            self._interrupt_loop_sleeps()
         elif event == "stop":
             self.teardown()
+
+
+def _resolve_future(future: asyncio.Future):
+    if not future.done():
+        future.set_result(False)
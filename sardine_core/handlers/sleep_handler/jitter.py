@@ -0,0 +1,136 @@
+import math
+from collections import deque
+
+__all__ = ("JitterEstimator",)
+
+
+class JitterEstimator:
+    """An online estimate of how late sleeps wake up.
+
+    Every wakeup error is folded into exponentially weighted averages of
+    its mean and absolute deviation, and stored in a fixed-size window.
+    The wakeup lead, i.e. how early sleeps should be armed, is a low
+    percentile of that window. Unlike a plain average, a few very late
+    wakeups (like a garbage collection pause) barely move the lead,
+    and most sleeps still end after their deadline.
+
+    Args:
+        window (int):
+            The number of recent wakeup errors to compute percentiles from.
+        lead_percentile (float):
+            The percentile of wakeup errors to use as the lead,
+            between 0 and 100.
+        max_lead (float):
+            The largest lead that can be returned, in seconds.
+        alpha (float):
+            The smoothing factor of the mean and deviation.
+
+    Attributes:
+        lead (float):
+            How many seconds early sleeps should be armed.
+            This is 0 until the first update.
+        mean (float): The smoothed mean of wakeup errors.
+        deviation (float): The smoothed absolute deviation of wakeup errors.
+        count (int): The number of wakeup errors recorded.
+        minimum (float): The earliest recorded wakeup error.
+        maximum (float): The latest recorded wakeup error.
+    """
+
+    __slots__ = (
+        "lead_percentile",
+        "max_lead",
+        "alpha",
+        "lead",
+        "mean",
+        "deviation",
+        "count",
+        "minimum",
+        "maximum",
+        "_window",
+        "_pending",
+    )
+
+    def __init__(
+        self,
+        window: int = 64,
+        *,
+        lead_percentile: float = 25.0,
+        max_lead: float = 0.01,
+        alpha: float = 0.05,
+    ):
+        self.lead_percentile = lead_percentile
+        self.max_lead = max_lead
+        self.alpha = alpha
+        self._window: deque[float] = deque(maxlen=window)
+        self.reset()
+
+    def __repr__(self) -> str:
+        return "<{} count={} lead={:.6f} mean={:.6f} deviation={:.6f}>".format(
+            type(self).__name__, self.count, self.lead, self.mean, self.deviation
+        )
+
+    @property
+    def window(self) -> int:
+        """The number of recent wakeup errors kept for percentiles."""
+        return self._window.maxlen
+
+    def record(self, error: float):
+        """Adds a wakeup error to the estimate.
+
+        Args:
+            error (float):
+                How many seconds after its armed time a sleep woke up.
+                Negative values mean the sleep woke up early.
+        """
+        if self.count:
+            diff = error - self.mean
+            self.mean += self.alpha * diff
+            self.deviation += self.alpha * (abs(diff) - self.deviation)
+        else:
+            self.mean = error
+
+        self.count += 1
+        self.minimum = min(self.minimum, error)
+        self.maximum = max(self.maximum, error)
+
+        window = self._window
+        window.append(error)
+
+        # Sorting the window on every wakeup would be wasteful, so the
+        # lead is only refreshed once a quarter of the window is new
+        self._pending += 1
+        if self._pending >= max(1, len(window) // 4):
+            self.update()
+
+    def percentile(self, q: float) -> float:
+        """Returns the given percentile of the recent wakeup errors.
+
+        Args:
+            q (float): The percentile to compute, between 0 and 100.
+
+        Returns:
+            float: The nearest recorded error, or 0 if nothing was recorded.
+        """
+        if not self._window:
+            return 0.0
+
+        values = sorted(self._window)
+        index = math.ceil(len(values) * q / 100) - 1
+        return values[min(max(index, 0), len(values) - 1)]
+
+    def update(self):
+        """Recomputes the lead from the current window."""
+        self._pending = 0
+        lead = self.percentile(self.lead_percentile)
+        self.lead = min(max(lead, 0.0), self.max_lead)
+
+    def reset(self):
+        """Clears every recorded wakeup error and the current lead."""
+        self._window.clear()
+        self._pending = 0
+        self.lead = 0.0
+        self.mean = 0.0
+        self.deviation = 0.0
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
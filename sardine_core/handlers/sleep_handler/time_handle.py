@@ -51,3 +51,26 @@ class TimeHandle:
 
     def done(self) -> bool:
         return self.fut.done()
+
+
+class TimedCall:
+    """A callback scheduled on the event loop for a time on the fish bowl's clock.
+
+    While the fish bowl is paused, the underlying timer is cancelled and
+    `handle` is set to None until it is rescheduled on resume.
+    """
+
+    __slots__ = ("when", "callback", "args", "handle")
+
+    def __init__(self, deadline: float, callback, args: tuple):
+        self.when = deadline
+        self.callback = callback
+        self.args = args
+        self.handle: "asyncio.TimerHandle | None" = None
+
+    def __repr__(self):
+        return "<{} when={} callback={!r}>".format(
+            type(self).__name__,
+            self.when,
+            self.callback,
+        )
@@ -27,10 +27,12 @@ class SuperDirtHandler(Sender):
         loop: OSCLoop,
         name: str = "SuperDirt",
         ahead_amount: float = 0.3,
+        timetags: bool = False,
     ):
         super().__init__()
         self._name = name
         self.loop = loop
+        self.timetags = timetags
 
         # Opening a new OSC Client to talk with it
         self._osc_client = osc_udp_client(
@@ -106,9 +108,13 @@ class SuperDirtHandler(Sender):
     def _send(self, address, message):
         self.__send(address=address, message=message)
 
-    def _dirt_play(self, message: list):
+    def _dirt_play(self, message: list, timestamp: Optional[float] = None):
         # TODO: custom logic here?
-        self._send_timed_message(address="/dirt/play", message=message)
+        if timestamp is not None:
+            timestamp += self._ahead_amount
+        self._send_timed_message(
+            address="/dirt/play", message=message, timestamp=timestamp
+        )
 
     def _dirt_panic(self):
         self._dirt_play(message=["sound", "superpanic"])
@@ -187,12 +193,11 @@ class SuperDirtHandler(Sender):
 
         pattern["sound"] = _resolve_if_callable(sound)
         pattern["orbit"] = _resolve_if_callable(orbit)
-        pattern["cps"] = round(self.env.clock.phase, 1)
-        pattern["cycle"] = (
-            self.env.clock.bar * self.env.clock.beats_per_bar
-        ) + self.env.clock.beat
+        now = self.env.clock.snapshot()
+        pattern["cps"] = round(now.phase, 1)
+        pattern["cycle"] = (now.bar * now.beats_per_bar) + now.beat
 
-        deadline = self.env.clock.shifted_time
+        deadline = now.shifted_time
         for message in self.pattern_reduce(
             pattern,
             _resolve_if_callable(iterator),
@@ -204,7 +209,7 @@ class SuperDirtHandler(Sender):
             if "n" in message and message["sound"] is not None:
                 message = self._handle_sample_number(message)
             serialized = list(chain(*sorted(message.items())))
-            self.call_timed(deadline, self._dirt_play, serialized)
+            self.call_timetagged(deadline, self._dirt_play, serialized)
 
     @alias_param(name="iterator", alias="i")
     @alias_param(name="divisor", alias="d")
@@ -271,11 +276,10 @@ class SuperDirtHandler(Sender):
             pattern["freq"] = _resolve_if_callable(freq)
             pattern["sound"] = _resolve_if_callable(sound)
             pattern["orbit"] = _resolve_if_callable(orbit)
-            pattern["cps"] = round(self.env.clock.phase, 4)
-            pattern["cycle"] = (
-                self.env.clock.bar * self.env.clock.beats_per_bar
-            ) + self.env.clock.beat
-            deadline = self.env.clock.shifted_time
+            now = self.env.clock.snapshot()
+            pattern["cps"] = round(now.phase, 4)
+            pattern["cycle"] = (now.bar * now.beats_per_bar) + now.beat
+            deadline = now.shifted_time
             for message in self.pattern_reduce(
                 pattern,
                 _resolve_if_callable(iterator),
@@ -285,7 +289,7 @@ class SuperDirtHandler(Sender):
                 if message["sound"] is None:
                     continue
                 serialized = list(chain(*sorted(message.items())))
-                self.call_timed(deadline, self._dirt_play, serialized)
+                self.call_timetagged(deadline, self._dirt_play, serialized)
 
         try:
             if isinstance(ziffer.duration, (int, float)):
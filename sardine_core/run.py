@@ -105,11 +105,10 @@ player_names = [
 player_names.remove("SC")  # NOTE: used by SuperCollider command
 player_names.remove("PC")  # NOTE: used by MIDI Program Change
 # player_names += [''.join(tup) for tup in list(product(ascii_lowercase, repeat=3))]
+# Players are bound eagerly so that star imports and tab completion can see them,
+# but each one only creates its runner and joins the bowl once it is first used
 for player in player_names:
-    p = Player(name=player)
-    globals()[player] = p
-    bowl.add_handler(p)
-    del p
+    globals()[player] = Player(name=player, bowl=bowl)
 
 # Extensions
 # An extension configuration file contains the following fields:
@@ -164,6 +163,9 @@ def swim(
     *args: ParamSpec.args,
     quant: Quant = "bar",
     until: Optional[int] = None,
+    lookahead: Optional[float] = None,
+    executor: Optional[str] = None,
+    priority: Optional[str] = None,
     **kwargs: ParamSpec.kwargs,
 ) -> AsyncRunner: ...
 
@@ -173,6 +175,9 @@ def swim(
     *args,
     quant: Quant = "bar",
     until: Optional[int] = None,
+    lookahead: Optional[float] = None,
+    executor: Optional[str] = None,
+    priority: Optional[str] = None,
     **kwargs,
 ) -> Callable[[Union[Callable, AsyncRunner]], AsyncRunner]: ...
 
@@ -185,6 +190,9 @@ def swim(
     *args,
     quant: Quant = "bar",
     until: Optional[int] = None,
+    lookahead: Optional[float] = None,
+    executor: Optional[str] = None,
+    priority: Optional[str] = None,
     background_job: bool = False,
     **kwargs,
 ):
@@ -206,6 +214,19 @@ def swim(
         until (Optional[int]):
             Specifies the number of iterations this function should run for.
             This is a shorthand for using the `@for_()` decorator.
+        lookahead (Optional[float]):
+            If set, the number of beats ahead of time that the function
+            will be called at. Messages are still sent on time, but the
+            function is less likely to be late under heavy load.
+            See `AsyncRunner.lookahead` for more details.
+        executor (Optional[str]):
+            If set to "thread" or "process", the function will be called
+            in a pool instead of blocking the other runners while it computes.
+            See `AsyncRunner.executor` for the limitations of each.
+        priority (Optional[str]):
+            If set to "critical", "normal" or "best-effort", the priority
+            class of the runner. Best-effort functions are the first to be
+            skipped when running late. See `AsyncRunner.priority`.
         background_job (bool):
             Determines if the asyncrunner is a background job or not. Being a
             background job isolates the asyncrunner from any interruption by
@@ -217,6 +238,12 @@ def swim(
 
         # This is true when the function is already running on the scheduler
         if isinstance(func, AsyncRunner):
+            if lookahead is not None:
+                func.lookahead = lookahead
+            if executor is not None:
+                func.executor = executor
+            if priority is not None:
+                func.priority = priority
             func.update_state(*args, **kwargs)
             bowl.scheduler.start_runner(func)
             return func
@@ -238,6 +265,13 @@ def swim(
             # when it's pushed
             runner.reset_states()
 
+        if lookahead is not None:
+            runner.lookahead = lookahead
+        if executor is not None:
+            runner.executor = executor
+        if priority is not None:
+            runner.priority = priority
+
         # Runners normally allow the same functions to appear in the stack,
         # but we will treat repeat functions as just reloading the runner
         if runner.states and runner.states[-1].func is func:
@@ -388,8 +422,16 @@ def solo(*args):
             silence(runner)
 
 
-def runners():
-    """Return all currently active AsyncRunners"""
+def runners(table: bool = False):
+    """Return all currently active AsyncRunners
+
+    Args:
+        table (bool):
+            If True, print a table of each runner's timing telemetry instead,
+            starting with the runners waking up the latest.
+    """
+    if table:
+        return print(stats_table(bowl.scheduler.stats()))
     condition = lambda x: x.name if x.name != "tidal_loop" else "internal"
     return list(map(condition, bowl.scheduler.runners))
 
@@ -650,7 +692,8 @@ if config.superdirt_handler:
     )
 
     # Background asyncrunner for running tidal patterns
-    @swim(background_job=True, quant=dirt.nudge)
+    # Tidal streams rely on this loop to keep time, so it runs before anything else
+    @swim(background_job=True, priority="critical", quant=dirt.nudge)
     def tidal_loop(p=0.05):
         """Background Tidal/Vortex AsyncRunner:
         Notify Tidal Streams of the current passage of time.
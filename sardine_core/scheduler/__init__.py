@@ -1,2 +1,4 @@
 from .async_runner import *
 from .scheduler import *
+from .telemetry import *
+from .timeline import *
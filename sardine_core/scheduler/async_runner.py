@@ -1,11 +1,14 @@
 import asyncio
+import contextvars
+import functools
 import heapq
 import inspect
 import math
 import os
 import traceback
-from collections import deque
-from dataclasses import dataclass
+import warnings
+from dataclasses import dataclass, field
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, MutableSequence, NamedTuple, Optional, Union
 
 from rich.panel import Panel
@@ -13,17 +16,29 @@ from rich.panel import Panel
 from sardine_core.base import BaseClock
 from sardine_core.clock import Time
 from sardine_core.logger import print
-from sardine_core.utils import MISSING, Span, maybe_coro
+from sardine_core.utils import MISSING, Span
 
 from .constants import MaybeCoroFunc
 from .errors import *
+from .telemetry import RunnerStats
 
 if TYPE_CHECKING:
     from sardine_core.fish_bowl import FishBowl
 
     from .scheduler import Scheduler
 
-__all__ = ("AsyncRunner", "FunctionState")
+__all__ = ("AsyncRunner", "CallPlan", "FunctionState", "executor_loop")
+
+EXECUTORS = ("thread", "process")
+PRIORITIES = ("critical", "normal", "best-effort")
+
+executor_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]]
+executor_loop = contextvars.ContextVar("executor_loop", default=None)
+"""
+The event loop that the current function was offloaded from, if it is
+running in a thread executor. Code that needs to interact with the loop
+(such as scheduling messages) must hand their calls back to this loop.
+"""
 
 
 def _assert_function_signature(sig: inspect.Signature, args, kwargs):
@@ -36,27 +51,16 @@ def _assert_function_signature(sig: inspect.Signature, args, kwargs):
         raise BadArgumentError(message)
 
 
-def _discard_kwargs(sig: inspect.Signature, kwargs: dict[str, Any]) -> dict[str, Any]:
-    """Discards any kwargs not present in the given signature."""
-    pass_through = kwargs.copy()
-
-    for param in sig.parameters.values():
-        value = kwargs.get(param.name, MISSING)
-        if value is not MISSING:
-            pass_through[param.name] = value
-
-    return pass_through
-
-
 def _extract_new_period(
-    sig: inspect.Signature, kwargs: dict[str, Any], default_period: int | float
+    plan: "CallPlan", kwargs: dict[str, Any], default_period: int | float
 ) -> Union[float, int]:
     period = kwargs.get("p")
 
     # Assign a default period if necessary
     if period is None:
-        param = sig.parameters.get("p")
-        period = getattr(param, "default", default_period)
+        period = plan.default_period
+        if period is MISSING:
+            period = default_period
 
     # Resolve any callable period
     if callable(period):
@@ -96,11 +100,59 @@ def _missing_kwargs(
     return guessed_mapping
 
 
-@dataclass
+class CallPlan(NamedTuple):
+    """Everything the runner needs to know about a function to call it.
+
+    Introspecting a function is relatively expensive, so this is computed
+    once when a function state is created instead of on every iteration.
+    """
+
+    func: "MaybeCoroFunc"
+    signature: inspect.Signature
+    parameters: frozenset[str]
+    default_period: Any
+    """The default value of the `p` parameter, or `MISSING` if not present."""
+    is_coroutine: bool
+
+    @classmethod
+    def from_function(cls, func: "MaybeCoroFunc") -> "CallPlan":
+        signature = inspect.signature(func)
+        param = signature.parameters.get("p")
+        return cls(
+            func=func,
+            signature=signature,
+            parameters=frozenset(signature.parameters),
+            default_period=getattr(param, "default", MISSING),
+            is_coroutine=inspect.iscoroutinefunction(func),
+        )
+
+    def filter_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Discards any kwargs not present in the function's signature.
+
+        This prevents any TypeErrors when the user reduces the signature.
+        """
+        return {k: v for k, v in kwargs.items() if k in self.parameters}
+
+
+@dataclass(slots=True)
 class FunctionState:
     func: "MaybeCoroFunc"
     args: tuple
     kwargs: dict
+    _plan: Optional[CallPlan] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._plan = CallPlan.from_function(self.func)
+
+    @property
+    def plan(self) -> CallPlan:
+        """The call plan of the current function.
+
+        The plan is rebuilt only if a different function was assigned.
+        """
+        if self._plan is None or self._plan.func is not self.func:
+            self._plan = CallPlan.from_function(self.func)
+        return self._plan
 
 
 class DeferredState(NamedTuple):
@@ -126,10 +178,52 @@ class AsyncRunner:
     In either case, if the function takes too long to execute, it will miss
     its scheduling deadline and cause an unexpected gap between function calls.
     Functions must complete within the time span to avoid this issue.
+
+    CPU-heavy functions can be offloaded to a pool with the `executor`
+    attribute so that they don't block the event loop shared by every
+    other runner.
+
+    The `lookahead` attribute goes one step further by waking up the runner
+    a number of beats before each deadline, while still shifting time so
+    that senders schedule their messages on the deadline itself. Late wake
+    ups then delay the rendering of events rather than the events themselves.
     """
 
     MAX_FUNCTION_STATES = 3
 
+    # Runners are created in large numbers (every player has one), so avoid
+    # giving each of them an instance dictionary
+    __slots__ = (
+        "name",
+        "scheduler",
+        "states",
+        "deferred_states",
+        "beat_shift",
+        "snap",
+        "lookahead",
+        "stats",
+        "background_job",
+        "_iter",
+        "_iter_step",
+        "_iter_limit",
+        "_default_period",
+        "_executor",
+        "_priority",
+        "_swimming",
+        "_stop",
+        "_task",
+        "_reloaded",
+        "_wake_future",
+        "_has_reverted",
+        "_jump_start",
+        "_deferred_state_index",
+        "_can_correct_interval",
+        "_expected_time",
+        "_last_period",
+        "_last_expected_time",
+        "_last_state",
+    )
+
     name: str
     """Uniquely identifies a runner when it is added to a scheduler."""
 
@@ -145,6 +239,20 @@ class AsyncRunner:
     _default_period: int | float
     """Default recursion period"""
 
+    lookahead: Union[float, int]
+    """The number of beats ahead of each deadline that the function is called.
+
+    When this is longer than the runner's period, several iterations are
+    rendered in advance. Note that updating the function does not affect
+    iterations that were already rendered.
+    """
+
+    stats: Optional[RunnerStats]
+    """Timing telemetry recorded on each iteration.
+
+    This can be set to None to disable recording entirely.
+    """
+
     background_job: bool
     """Determines if the asyncrunner should be running the background
     and never be interrupted by silence(), panic() or any manual stop
@@ -157,8 +265,8 @@ class AsyncRunner:
     """
     The function stack, used for auto-restoring functions.
 
-    This is implemented with a deque to ensure a limit on how many functions
-    are stored in the cache.
+    Only the last `MAX_FUNCTION_STATES` functions are kept. This is a plain
+    list trimmed on each push, which is much smaller than a bounded deque.
     """
     deferred_states: list[DeferredState]
     """
@@ -168,24 +276,25 @@ class AsyncRunner:
     their time arrives, at which point they are moved to the `states` sequence
     and will take over the next iteration.
     """
-    interval_shift: float
+    beat_shift: float
     """
-    The amount of time to offset the runner's interval.
+    The number of beats to offset the runner's interval.
 
-    An interval defines the amount of time between each execution
-    of the current function. For example, a clock with a beat duration
-    of 0.5s and a period of 2 beats means each interval is 1 second.
+    An interval defines the number of beats between each execution
+    of the current function, i.e. its period. Deadlines are computed
+    in beats using the clock's `beat_at_time()` and `time_at_beat()`
+    methods, so intervals stay on the beat grid when the tempo changes.
 
     Through interval shifting, a function can switch between different
-    periods/tempos and then compensate for the clock's current time to
+    periods and then compensate for the clock's current beat to
     avoid the next immediate beat being shorter than expected.
 
-    Initially, functions have an interval shift of 0. The runner
-    will automatically change its interval shift when the function
-    schedules itself with a new period or a change in the clock's beat
-    duration occurs. This can lead to functions with the same period
-    running at different phases. To synchronize these functions together,
-    their interval shifts should be set to the same value (usually 0).
+    Initially, functions have a beat shift of 0. The runner
+    will automatically change its beat shift when the function
+    schedules itself with a new period. This can lead to functions
+    with the same period running at different phases. To synchronize
+    these functions together, their beat shifts should be set to the
+    same value (usually 0).
     """
     snap: Optional[Union[float, int]]
     """
@@ -209,7 +318,8 @@ class AsyncRunner:
     _swimming: bool
     _stop: bool
     _task: Optional[asyncio.Task]
-    _reload_event: asyncio.Event
+    _reloaded: bool
+    _wake_future: Optional[asyncio.Future]
     _has_reverted: bool
     _jump_start: bool
 
@@ -217,27 +327,32 @@ class AsyncRunner:
 
     _can_correct_interval: bool
     _expected_time: float
-    _last_interval: float
+    _last_period: Union[float, int]
     _last_expected_time: float
     _last_state: Optional[FunctionState]
 
     def __init__(self, name: str):
         self.name = name
         self.scheduler = None
-        self.states = deque(maxlen=self.MAX_FUNCTION_STATES)
+        self.states = []
         self.deferred_states = []
-        self.interval_shift = 0.0
+        self.beat_shift = 0.0
         self.snap = None
         self._iter = 0
         self._iter_step = 1
         self._iter_limit = "inf"
         self._default_period = 1
+        self.lookahead = 0.0
+        self._executor = None
+        self._priority = PRIORITIES.index("normal")
+        self.stats = RunnerStats()
         self.background_job = False
 
         self._swimming = False
         self._stop = False
         self._task = None
-        self._reload_event = asyncio.Event()
+        self._reloaded = False
+        self._wake_future = None
         self._has_reverted = False
         self._jump_start = False
 
@@ -245,7 +360,7 @@ class AsyncRunner:
 
         self._can_correct_interval = False
         self._expected_time = 0.0
-        self._last_interval = 0.0
+        self._last_period = 0.0
         self._last_expected_time = -math.inf
         self._last_state = None
 
@@ -278,6 +393,81 @@ class AsyncRunner:
         """The amount of time to defer function calls."""
         return self.defer_beats * self.clock.beat_duration
 
+    @property
+    def interval_shift(self) -> float:
+        """The amount of time to offset the runner's interval.
+
+        Deprecated: intervals are now offset in beats with `beat_shift`.
+        This converts to and from it using the current tempo.
+        """
+        warnings.warn(
+            "interval_shift is deprecated, use beat_shift instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.beat_shift * self.clock.beat_duration
+
+    @interval_shift.setter
+    def interval_shift(self, value: float):
+        warnings.warn(
+            "interval_shift is deprecated, use beat_shift instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self.beat_shift = value / self.clock.beat_duration
+
+    @property
+    def executor(self) -> Optional[str]:
+        """The kind of executor the function is called in, if any.
+
+        With `"thread"`, the function runs in a thread pool with the same
+        time shift it would normally have, and any messages it sends are
+        handed back to the event loop with their original deadline.
+
+        With `"process"`, the function runs in a process pool and must be
+        picklable, i.e. defined at the top level of a module. As it runs
+        outside of the fish bowl, it cannot send messages or depend on
+        time shifts, and its return value is discarded. Calling `swim()`
+        in another process has no effect either, so the runner swims on
+        the function's behalf after every successful call until it is
+        stopped.
+
+        Coroutine functions cannot be offloaded to an executor.
+        """
+        return self._executor
+
+    @executor.setter
+    def executor(self, value: Optional[str]):
+        if value is not None and value not in EXECUTORS:
+            raise ValueError(
+                f"executor must be one of {EXECUTORS} or None, not {value!r}"
+            )
+        self._executor = value
+
+    @property
+    def priority(self) -> str:
+        """The priority class of the runner.
+
+        Runners waking up at the same time are resumed in order of priority,
+        from `"critical"` to `"normal"` to `"best-effort"`.
+
+        Best-effort runners waking up later than `Scheduler.shed_threshold`
+        skip their iteration, leaving more time for the other runners
+        when the event loop is overloaded.
+        """
+        return PRIORITIES[self._priority]
+
+    @priority.setter
+    def priority(self, value: str):
+        if value not in PRIORITIES:
+            raise ValueError(f"priority must be one of {PRIORITIES}, not {value!r}")
+        self._priority = PRIORITIES.index(value)
+
+    @property
+    def lookahead_duration(self) -> float:
+        """The amount of time ahead of each deadline that functions are called."""
+        return self.lookahead * self.clock.beat_duration
+
     @property
     def env(self) -> "FishBowl":
         """A shorthand for the scheduler's fish bowl."""
@@ -351,18 +541,18 @@ class AsyncRunner:
             raise BadFunctionError(f"Expected a callable, got {func!r}")
         elif not self.states:
             state = FunctionState(func, args, kwargs)
-            return self.states.append(state)
+            return self._append_states(state)
 
         last_state = self.states[-1]
 
         new_state = FunctionState(func, args, kwargs)
         self._merge_states(last_state, new_state)
 
-        self.states.append(new_state)
+        self._append_states(new_state)
 
     def push_deferred(
         self, deadline: Union[float, int], func: "MaybeCoroFunc", *args, **kwargs
-    ):
+    ) -> DeferredState:
         """Adds a function to a queue to eventually be run.
 
         It is recommended to reload the runner after this in case the
@@ -379,6 +569,10 @@ class AsyncRunner:
             *args: The positional arguments being passed to `func`.
             **kwargs: The keyword arguments being passed to `func`.
 
+        Returns:
+            DeferredState:
+                The deferred state, which can be given to `cancel_deferred()`.
+
         Raises:
             BadFunctionError: The value given for `func` must be callable.
         """
@@ -393,7 +587,28 @@ class AsyncRunner:
 
         # Create a new function state and push it to the heap queue
         state = FunctionState(func, args, kwargs)
-        heapq.heappush(self.deferred_states, DeferredState(deadline, index, state))
+        entry = DeferredState(deadline, index, state)
+        heapq.heappush(self.deferred_states, entry)
+        return entry
+
+    def cancel_deferred(self, entry: DeferredState) -> bool:
+        """Removes a deferred state before it arrives.
+
+        Args:
+            entry (DeferredState): The value returned by `push_deferred()`.
+
+        Returns:
+            bool: True if the state was removed, False if it already arrived.
+        """
+        for i, other in enumerate(self.deferred_states):
+            if other is entry:
+                break
+        else:
+            return False
+
+        del self.deferred_states[i]
+        heapq.heapify(self.deferred_states)
+        return True
 
     def update_state(self, *args, **kwargs):
         """Updates the top-most function state with new arguments.
@@ -415,7 +630,21 @@ class AsyncRunner:
         This method is useful when changes to the clock occur,
         or when a new function is pushed to the runner.
         """
-        self._reload_event.set()
+        self._reloaded = True
+
+        # Wake up the runner if it is waiting on the scheduler
+        future = self._wake_future
+        if future is not None and not future.done():
+            future.set_result(True)
+
+    def _append_states(self, *states: FunctionState) -> None:
+        """Adds function states to the stack, discarding the oldest ones
+        beyond `MAX_FUNCTION_STATES`.
+        """
+        self.states.extend(states)
+        excess = len(self.states) - self.MAX_FUNCTION_STATES
+        if excess > 0:
+            del self.states[:excess]
 
     def _merge_states(self, old: FunctionState, new: FunctionState) -> None:
         """
@@ -503,11 +732,15 @@ class AsyncRunner:
             RuntimeError: A function must be pushed before this can be used.
         """
         self.snap = deadline
-        # TODO: explain this line and what it does exactly
-        self.interval_shift = self.clock.get_beat_time(period, time=deadline)
+        # Align the runner's beat grid so the deadline falls on an interval
+        self.beat_shift = self._get_beat_shift(period, deadline)
 
     def _check_snap(self, time: float) -> None:
-        if self.snap is not None and time + self._last_interval >= self.snap:
+        if self.snap is None:
+            return
+
+        interval = self._last_period * self.clock.beat_duration
+        if time + interval >= self.snap:
             self.snap = None
 
     def _correct_interval(self, period: Union[float, int]) -> None:
@@ -522,20 +755,24 @@ class AsyncRunner:
             period (Union[float, int]):
                 The period being used in the current iteration.
         """
-        # NOTE: this should account for tempo change, weird...
-        interval = period * self.clock.beat_duration
-        if self._can_correct_interval and interval != self._last_interval:
-            time = self._expected_time
-            self.interval_shift = self.clock.get_beat_time(period, time=time)
+        # Tempo changes don't need correcting since intervals are in beats
+        if self._can_correct_interval and period != self._last_period:
+            self.beat_shift = self._get_beat_shift(period, self._expected_time)
 
-        self._last_interval = interval
+        self._last_period = period
         self._can_correct_interval = False
 
+    def _get_beat_shift(self, period: Union[float, int], time: float) -> float:
+        """Returns the beat shift needed for an interval to start at the given time."""
+        if period <= 0:
+            return 0.0
+        return -self.clock.beat_at_time(time) % period
+
     def _get_next_deadline(self, period: Union[float, int]) -> float:
         """Returns the amount of time until the next interval.
 
         The base interval is determined by the `period` argument,
-        and then offsetted by the `interval_shift` attribute.
+        and then offsetted by the `beat_shift` attribute.
 
         If the `snap` attribute is set to an absolute time
         and the current clock time has not passed the snap,
@@ -573,12 +810,10 @@ class AsyncRunner:
         if self.snap is not None:
             return self.snap
 
-        shifted_time = time + self.interval_shift
-
-        # If the interval was corrected, this should equal to:
-        #    `period * beat_duration`
-        expected_duration = self.clock.get_beat_time(period, time=shifted_time)
-        return time + expected_duration
+        # If the interval was corrected, this should be `period` beats after `time`
+        return self.clock.get_beat_deadline(
+            period, time=time, beat_shift=self.beat_shift
+        )
 
     # Runner loop
 
@@ -631,7 +866,7 @@ class AsyncRunner:
         # Extract period from state
         period = self._get_period(self._last_state)
 
-        self._last_interval = period * self.clock.beat_duration
+        self._last_period = period
 
     async def _run_once(self) -> None:
         """
@@ -641,25 +876,28 @@ class AsyncRunner:
         # TODO: documentation needed for this very complex function
 
         self._swimming = False
-        self._reload_event.clear()
+        self._reloaded = False
 
         # 1) Get the last state
         state = self._get_state()
         if state is not None:
             self._maybe_print_new_state(state)
             self._last_state = state
-            signature = inspect.signature(state.func)
+            plan = state.plan
 
-            _assert_function_signature(signature, state.args, state.kwargs)
+            _assert_function_signature(plan.signature, state.args, state.kwargs)
             args = state.args
-            # Prevent any TypeErrors when the user reduces the signature
-            kwargs = _discard_kwargs(signature, state.kwargs)
-            period = _extract_new_period(signature, state.kwargs, self._default_period)
+            kwargs = plan.filter_kwargs(state.kwargs)
+            period = _extract_new_period(plan, state.kwargs, self._default_period)
 
             self._correct_interval(period)
             deadline = self._get_next_deadline(period)
 
         # 2) Push any deferred states that have arrived or will arrive onto the stack
+        # (a jump-started iteration runs right away, not on its deadline)
+        if state is not None and self._jump_start:
+            deadline = min(deadline, self.clock.time)
+
         arriving_states: list[DeferredState] = []
         while self.deferred_states:
             entry = self.deferred_states[0]
@@ -682,7 +920,7 @@ class AsyncRunner:
         # 3) Run the function or skip to the next iteration
         if arriving_states:
             latest_entry = arriving_states[-1]
-            self.states.extend(e.state for e in arriving_states)
+            self._append_states(*(e.state for e in arriving_states))
             # In case the new state has a faster interval than before, delay it so it doesn't run too early
             self.delay_interval(
                 latest_entry.deadline,
@@ -703,17 +941,43 @@ class AsyncRunner:
         interrupted = await self._sleep_unless_jump_started(deadline)
         if interrupted:
             return self._skip_iteration()
+        elif self._should_shed():
+            return self._shed_iteration()
+
+        stats = self.stats
+        if stats is not None:
+            clock = self.clock
+            started_at = clock.time
+            lateness = started_at - self._expected_time
+            if self.lookahead:
+                lateness += self.lookahead * clock.beat_duration
+            stats.lateness.record(lateness)
+            start = perf_counter()
 
         try:
-            # Use copied context in function by creating it as a task
-            await asyncio.create_task(
-                self._call_func(state.func, args, kwargs),
-                name=f"asyncrunner-func-{self.name}",
-            )
+            # Use copied context in function so time shifts don't leak
+            if self._executor is not None:
+                await self._call_func_in_executor(plan, args, kwargs)
+            elif plan.is_coroutine:
+                await asyncio.create_task(
+                    self._call_func(plan, args, kwargs),
+                    name=f"asyncrunner-func-{self.name}",
+                )
+            else:
+                contextvars.copy_context().run(self._call_func_sync, plan, args, kwargs)
         finally:
             self._last_expected_time = self._expected_time
             self._update_iter()
 
+            if stats is not None:
+                elapsed = perf_counter() - start
+                stats.duration.record(elapsed)
+                stats.iterations += 1
+                # Finishing past the next deadline means the next iteration is late
+                next_deadline = self._expected_time + period * clock.beat_duration
+                if started_at + elapsed > next_deadline:
+                    stats.missed += 1
+
     def _update_iter(self) -> None:
         """Updates the iteration number"""
         self._iter += self._iter_step
@@ -721,20 +985,54 @@ class AsyncRunner:
             if self._iter >= self._iter_limit:
                 self._iter = 0
 
-    async def _call_func(self, func, args, kwargs):
-        """Calls the given function and optionally applies time shift
-        according to the `defer_beats` attribute.
+    async def _call_func(self, plan: CallPlan, args, kwargs):
+        """Calls the given coroutine function and optionally applies time shift
+        according to the `defer_beats` and `lookahead` attributes.
         """
-        signature = inspect.signature(func)
-        valid_kwargs = {k: v for k, v in kwargs.items() if k in signature.parameters}
+        self._apply_defer_shift()
+        return await plan.func(*args, **kwargs)
+
+    def _call_func_sync(self, plan: CallPlan, args, kwargs):
+        """The synchronous counterpart of `_call_func()`.
 
-        if self.defer_beats:
+        Unlike coroutine functions, this does not need a task of its own and
+        is expected to be run inside a copied context. The clock is frozen
+        for the duration of the call, so everything the function schedules
+        shares one view of time.
+        """
+        self._apply_defer_shift()
+        self.clock.freeze()
+        return plan.func(*args, **kwargs)
+
+    async def _call_func_in_executor(self, plan: CallPlan, args, kwargs):
+        """Calls the given function in the scheduler's executor,
+        waiting for it to complete without blocking the event loop.
+        """
+        if plan.is_coroutine:
+            raise BadFunctionError(
+                f"Coroutine function {plan.func!r} cannot be run in an executor"
+            )
+
+        loop = asyncio.get_running_loop()
+        executor = self.scheduler.get_executor(self._executor)
+        if self._executor == "process":
+            func = functools.partial(plan.func, *args, **kwargs)
+            await loop.run_in_executor(executor, func)
+            self.swim()
+            return
+
+        context = contextvars.copy_context()
+        context.run(executor_loop.set, loop)
+        return await loop.run_in_executor(
+            executor, context.run, self._call_func_sync, plan, args, kwargs
+        )
+
+    def _apply_defer_shift(self):
+        if self.defer_beats or self.lookahead:
             delta = self.clock.time - self._expected_time
             shift = self.defer_duration - delta
             self.time.shift += shift
 
-        return await maybe_coro(func, *args, **valid_kwargs)
-
     def _get_period(self, state: Optional[FunctionState]) -> Union[float, int]:
         """
         TODO: ???
@@ -751,11 +1049,7 @@ class AsyncRunner:
             return 0.0
 
         # Extract the period from the state or assign default period if missing
-        return _extract_new_period(
-            inspect.signature(state.func),
-            state.kwargs,
-            self.period,
-        )
+        return _extract_new_period(state.plan, state.kwargs, self.period)
 
     def _get_state(self) -> Optional[FunctionState]:
         """
@@ -785,10 +1079,6 @@ class AsyncRunner:
         a new state has been pushed. It will print a message to the console indicating
         how well the runner is doing (update or saved from crash).
         """
-        current_beat = self.clock.beat % self.clock.beats_per_bar
-        current_bar = self.clock.bar
-        current_phase = self.clock.phase
-
         if self._last_state is not None and state is not self._last_state:
             if not self._has_reverted:
                 print(f"[yellow][Updating [red]{self.name}[/red]]")
@@ -796,38 +1086,30 @@ class AsyncRunner:
                 print(f"[yellow][Saving [red]{self.name}[/red] from crash]")
                 self._has_reverted = False
 
-    async def _sleep_until(self, deadline: Union[float, int]) -> bool:
+    async def _sleep_until(
+        self, deadline: Union[float, int], lead: Union[float, int] = 0.0
+    ) -> bool:
         """Sleeps until the given deadline or until the runner is reloaded.
 
         Args:
-            duration (Union[float, int]): The amount of time to sleep.
+            deadline (Union[float, int]): The time of the next iteration.
+            lead (Union[float, int]):
+                The amount of time to wake up ahead of the deadline.
+                The expected time of the iteration is still the deadline.
 
         Returns:
             bool: True if the runner was reloaded, False otherwise.
         """
         self._expected_time = deadline
-        if self.clock.time >= deadline:
-            return self._reload_event.is_set()
+        wake_time = deadline - lead
+        if self._reloaded or self.clock.time >= wake_time:
+            return self._reloaded
 
-        wait_task = asyncio.create_task(self.env.sleeper.sleep_until(deadline))
-        reload_task = asyncio.create_task(self._reload_event.wait())
+        # The scheduler resolves this future when the deadline arrives,
+        # or reload() resolves it early
+        self._wake_future = self.scheduler._wait_until(wake_time, self._priority)
         try:
-            done, pending = await asyncio.wait(
-                # here, we are waiting for one of the two tasks to finish:
-                # - wait task: a task that sleeps until deadline
-                # - reload task: a task that waits until the runner is reloaded
-                (wait_task, reload_task),
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            # The other task is cancelled, we don't need it anymore
-            for task in pending:
-                task.cancel()
-            # Retrieving the result, helpful for error propagation, etc.
-            for task in done:
-                task.result()
-
-            return reload_task in done
-
+            return await self._wake_future
         except asyncio.CancelledError:
             os.system("cls" if os.name == "nt" else "clear")
             print(
@@ -835,13 +1117,15 @@ class AsyncRunner:
                     "[red]/!\ Exit Pressed: Sardine was interrupted. Press Ctrl-C again to quit![/red]"
                 )
             )
+        finally:
+            self._wake_future = None
 
     async def _sleep_unless_jump_started(self, deadline: Union[float, int]) -> bool:
         if self._jump_start:
             self._jump_start = False
             return False
 
-        return await self._sleep_until(deadline)
+        return await self._sleep_until(deadline, self.lookahead_duration)
 
     def _revert_state(self) -> None:
         """Reverts the runner to the previous state."""
@@ -849,15 +1133,34 @@ class AsyncRunner:
             self.states.pop()
         self._has_reverted = True
 
+        if self.stats is not None:
+            self.stats.reverted += 1
+
     def _skip_iteration(self) -> None:
         """
-        TODO: document
+        Continues to the next iteration without calling the function.
         """
+        if self.stats is not None:
+            self.stats.skipped += 1
+        self.swim()
+
+    def _should_shed(self) -> bool:
+        if self._priority < len(PRIORITIES) - 1:
+            return False
+
+        wake_time = self._expected_time - self.lookahead_duration
+        return self.clock.time - wake_time > self.scheduler.shed_threshold
+
+    def _shed_iteration(self) -> None:
+        """Skips an iteration of a best-effort runner that woke up too late."""
+        if self.stats is not None:
+            self.stats.shed += 1
         self.swim()
 
     def _jump_start_iteration(self) -> None:
+        # Waiting for a deferred state isn't a skipped iteration
         self._jump_start = True
-        self._skip_iteration()
+        self.swim()
 
     def _on_task_done(self, task: asyncio.Task) -> None:
         if task.cancelled():
@@ -1,32 +1,64 @@
-from typing import Optional
+import asyncio
+import concurrent.futures
+import copy
+import heapq
+import itertools
+import math
+from typing import Optional, Union
 
 from sardine_core.base import BaseHandler
 from sardine_core.utils import plural
 
-from .async_runner import AsyncRunner
+from .async_runner import EXECUTORS, PRIORITIES, AsyncRunner
+from .telemetry import RunnerStats
+from .timeline import Timeline
 
 __all__ = ("Scheduler",)
 
 
 class Scheduler(BaseHandler):
+    """Manages the runners of a fish bowl and wakes them up on time.
+
+    Args:
+        deferred_scheduling (bool):
+            If True, runners call their functions ahead of time
+            with an equivalent time shift.
+        shed_threshold (float):
+            How late, in seconds, a best-effort runner can wake up
+            before skipping its iteration. See `AsyncRunner.priority`.
+    """
+
     def __init__(
         self,
         deferred_scheduling: bool = True,
+        shed_threshold: float = 0.02,
     ):
         super().__init__()
         self._runners: dict[str, AsyncRunner] = {}
         self.deferred = deferred_scheduling
+        self.shed_threshold = shed_threshold
+
+        # A single heap of (deadline, priority, sequence, future) entries
+        # shared by every runner. Entries whose future is already done are
+        # considered cancelled and lazily discarded by the timer.
+        self._deadlines: list[tuple[float, int, int, asyncio.Future]] = []
+        self._deadline_counter = itertools.count()
+        self._timer_task: Optional[asyncio.Task] = None
+        self._timer_sleep: Optional[asyncio.Task] = None
+        self._timer_deadline = math.inf
+
+        self._executors: dict[str, concurrent.futures.Executor] = {}
+
+        self.timeline = Timeline(self)
 
     def _react_to_tempo_change(self, old_tempo: int | float, new_tempo: int | float):
         """
         In reaction to a tempo change, the scheduler should
-        trigger an event for each runner prompting to update
-        their current interval_shift. This prevents runners
-        from desynchronization everytime tempo change happens.
+        reload each runner so they can recompute their deadline.
+        Since runners compute deadlines in beats, they stay on
+        the beat grid without any further adjustment.
         """
-        scale = old_tempo / new_tempo
-        for runner in self._runners.values():
-            runner.interval_shift *= scale
+        self._reload_runners(interval_correction=False)
 
     def __repr__(self) -> str:
         n_runners = len(self._runners)
@@ -48,6 +80,63 @@ class Scheduler(BaseHandler):
         """Retrieves the runner with the given name from the scheduler."""
         return self._runners.get(name)
 
+    def stats(self, *, reset: bool = False) -> dict[str, RunnerStats]:
+        """Returns the timing telemetry of each runner in the scheduler.
+
+        Runners that have their telemetry disabled are omitted.
+        The returned objects are live and will keep being updated.
+        `telemetry.stats_table()` can be used to display them.
+
+        Args:
+            reset (bool):
+                If True, the telemetry of each runner is cleared
+                after being returned. Copies are returned instead.
+
+        Returns:
+            dict[str, RunnerStats]: A mapping of runner names to their telemetry.
+        """
+        stats = {
+            name: runner.stats
+            for name, runner in self._runners.items()
+            if runner.stats is not None
+        }
+        if reset:
+            for name, runner_stats in stats.items():
+                stats[name] = copy.deepcopy(runner_stats)
+                runner_stats.reset()
+        return stats
+
+    def get_executor(self, kind: str) -> concurrent.futures.Executor:
+        """Returns the executor used by runners of the given kind.
+
+        Executors are created the first time they are needed and
+        shut down when the scheduler is removed from its fish bowl.
+
+        Args:
+            kind (str): Either `"thread"` or `"process"`.
+
+        Returns:
+            concurrent.futures.Executor: The executor.
+
+        Raises:
+            ValueError: An unknown kind of executor was given.
+        """
+        executor = self._executors.get(kind)
+        if executor is not None:
+            return executor
+
+        if kind == "thread":
+            executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="sardine-runner"
+            )
+        elif kind == "process":
+            executor = concurrent.futures.ProcessPoolExecutor()
+        else:
+            raise ValueError(f"executor must be one of {EXECUTORS}, not {kind!r}")
+
+        self._executors[kind] = executor
+        return executor
+
     def start_runner(self, runner: AsyncRunner):
         """Adds the runner to the scheduler and starts it.
 
@@ -82,6 +171,8 @@ class Scheduler(BaseHandler):
     def stop_runner(self, runner: AsyncRunner, *, reset_states: bool = True):
         """Removes the runner from the scheduler and stops it.
 
+        Any entries of the runner in the `timeline` are cancelled.
+
         Args:
             runner (AsyncRunner): The runner to remove.
             reset_states (bool):
@@ -97,6 +188,8 @@ class Scheduler(BaseHandler):
         ):
             raise ValueError(f"Runner {runner.name!r} is running on another scheduler")
 
+        self.timeline.clear(runner)
+
         # We don't set `runner.scheduler = None` because it might
         # break the background task in the process
         runner.stop()
@@ -121,6 +214,123 @@ class Scheduler(BaseHandler):
 
     # Internal methods
 
+    def _wait_until(
+        self,
+        deadline: Union[float, int],
+        priority: int = PRIORITIES.index("normal"),
+    ) -> asyncio.Future:
+        """Returns a future that resolves once the given deadline has passed.
+
+        Rather than each runner sleeping on its own, deadlines are pushed
+        onto a single heap and woken up by one timer. The future's result
+        is `False` when the deadline arrives; a runner can resolve it
+        early (typically with `True` when reloaded), which invalidates the
+        heap entry.
+
+        Args:
+            deadline (Union[float, int]): The fish bowl time to wait for.
+            priority (int):
+                The index of the waiter's priority class in `PRIORITIES`.
+                Futures due at the same time are resolved in this order.
+
+        Returns:
+            asyncio.Future: The future to await.
+        """
+        future = asyncio.get_running_loop().create_future()
+        entry = (deadline, priority, next(self._deadline_counter), future)
+        heapq.heappush(self._deadlines, entry)
+
+        if self._timer_task is None or self._timer_task.done():
+            self._start_timer()
+        elif deadline < self._timer_deadline and self._timer_sleep is not None:
+            # The timer is sleeping past the new deadline, re-arm it
+            self._timer_sleep.cancel()
+
+        return future
+
+    def _start_timer(self):
+        if self.env is None or not self.env.is_running():
+            # Waiting entries are kept until the fish bowl starts again
+            return
+
+        self._timer_task = asyncio.create_task(
+            self._run_timer(), name="scheduler-timer"
+        )
+
+    async def _run_timer(self):
+        """Wakes up every waiting runner whose deadline has passed.
+
+        Only the earliest deadline is ever slept on. Since all runners
+        due at the same time are woken up together, the cost of sleeping
+        no longer grows with the number of runners.
+
+        Runners that are due together are woken up in order of priority,
+        which is also the order in which they get to run.
+        """
+        clock = self.env.clock
+        deadlines = self._deadlines
+        due: list[tuple[float, int, int, asyncio.Future]] = []
+        try:
+            now = clock.time
+            while deadlines:
+                deadline, _, _, future = deadlines[0]
+                if future.done():
+                    heapq.heappop(deadlines)
+                    continue
+                elif deadline <= now:
+                    due.append(heapq.heappop(deadlines))
+                    continue
+                elif due:
+                    self._resolve_due(due)
+                    continue
+
+                now = clock.time
+                if deadline <= now:
+                    continue
+
+                self._timer_deadline = deadline
+                self._timer_sleep = asyncio.create_task(
+                    self.env.sleeper.sleep_until(deadline)
+                )
+                await asyncio.wait((self._timer_sleep,))
+
+                if not self._timer_sleep.cancelled():
+                    self._timer_sleep.result()
+                    # The sleeper may wake up marginally early to
+                    # compensate for drift, trust it like runners used to
+                    now = max(clock.time, deadline)
+                elif not self.env.is_running():
+                    # Fish bowl was stopped, resume on the next start
+                    return
+                else:
+                    # Re-armed for an earlier deadline
+                    now = clock.time
+            self._resolve_due(due)
+        except Exception as exc:
+            # Let the waiting runners deal with the error
+            for *_, future in (*due, *deadlines):
+                if not future.done():
+                    future.set_exception(exc)
+            deadlines.clear()
+        finally:
+            if self._timer_sleep is not None:
+                self._timer_sleep.cancel()
+            self._timer_deadline = math.inf
+            self._timer_sleep = None
+
+    @staticmethod
+    def _resolve_due(due: list[tuple[float, int, int, asyncio.Future]]):
+        due.sort(key=lambda entry: entry[1])
+        for *_, future in due:
+            if not future.done():
+                future.set_result(False)
+        due.clear()
+
+    def _cancel_timer(self):
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
+
     def _reload_runners(self, *, interval_correction: bool):
         for runner in self._runners.values():
             runner.reload()
@@ -129,10 +339,25 @@ class Scheduler(BaseHandler):
                 runner.allow_interval_correction()
 
     def setup(self):
+        self.register("start")
         self.register("stop")
         self.register("tempo_change")
 
+    def teardown(self):
+        self.timeline.clear()
+        self._cancel_timer()
+        for *_, future in self._deadlines:
+            future.cancel()
+        self._deadlines.clear()
+
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
     def hook(self, event: str, *args):
+        if event == "start":
+            if self._deadlines:
+                self._start_timer()
         if event == "stop":
             self.reset()
         if event == "tempo_change":
@@ -0,0 +1,231 @@
+import math
+from bisect import bisect_left
+from typing import Mapping
+
+from rich.table import Table
+
+__all__ = ("Histogram", "RunnerStats", "stats_table")
+
+# Upper bounds of each bucket, in seconds.
+# An additional bucket collects any value above the last bound.
+DEFAULT_BOUNDS = (
+    0.0001,
+    0.0002,
+    0.0005,
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+)
+
+
+class Histogram:
+    """A fixed-size histogram of durations.
+
+    Recording a value only increments a bucket, making it cheap enough
+    to be used on every iteration. Summaries like percentiles are only
+    computed when requested, and are approximated by the upper bound
+    of the bucket they fall into.
+
+    Args:
+        bounds (tuple[float, ...]):
+            The sorted upper bounds of each bucket.
+            Negative values are counted in the first bucket.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "maximum")
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BOUNDS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = -math.inf
+
+    def __repr__(self) -> str:
+        return "<{} count={} mean={:.6f} max={:.6f}>".format(
+            type(self).__name__, self.count, self.mean, self.maximum
+        )
+
+    @property
+    def mean(self) -> float:
+        """The mean of all recorded values, or 0 if nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, value: float):
+        """Adds a value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, q: float) -> float:
+        """Approximates the given percentile of the recorded values.
+
+        Args:
+            q (float): The percentile to compute, between 0 and 100.
+
+        Returns:
+            float:
+                The upper bound of the bucket containing the percentile.
+                If the percentile is above the last bound, the maximum
+                recorded value is returned instead.
+        """
+        if not self.count:
+            return 0.0
+
+        target = self.count * q / 100
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            # Empty buckets only match a target of 0, e.g. the 0th percentile
+            if count and cumulative >= target:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def reset(self):
+        """Clears every recorded value."""
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = -math.inf
+
+
+class RunnerStats:
+    """Timing telemetry recorded by an `AsyncRunner`.
+
+    Attributes:
+        lateness (Histogram):
+            How late the runner woke up compared to when it was supposed to.
+        duration (Histogram):
+            How long the runner's function took to execute.
+        iterations (int): The number of times the function was called.
+        skipped (int):
+            The number of iterations skipped without calling the function,
+            usually because the runner was reloaded while sleeping.
+        reverted (int):
+            The number of times the function raised an exception
+            and was reverted to its previous state.
+        missed (int):
+            The number of iterations that finished past the runner's
+            next deadline, delaying the iteration after it.
+        shed (int):
+            The number of iterations dropped because a best-effort
+            runner woke up too late.
+    """
+
+    __slots__ = (
+        "lateness",
+        "duration",
+        "iterations",
+        "skipped",
+        "reverted",
+        "missed",
+        "shed",
+    )
+
+    def __init__(self):
+        self.lateness = Histogram()
+        self.duration = Histogram()
+        self.iterations = 0
+        self.skipped = 0
+        self.reverted = 0
+        self.missed = 0
+        self.shed = 0
+
+    def __repr__(self) -> str:
+        return "<{} iterations={} skipped={} reverted={} missed={} shed={}>".format(
+            type(self).__name__,
+            self.iterations,
+            self.skipped,
+            self.reverted,
+            self.missed,
+            self.shed,
+        )
+
+    def reset(self):
+        """Clears all recorded telemetry."""
+        self.lateness.reset()
+        self.duration.reset()
+        self.iterations = 0
+        self.skipped = 0
+        self.reverted = 0
+        self.missed = 0
+        self.shed = 0
+
+
+def _format_ms(value: float) -> str:
+    return f"{value * 1000:.2f} ms"
+
+
+def stats_table(stats: Mapping[str, RunnerStats]) -> Table:
+    """Creates a rich table summarizing the telemetry of each runner.
+
+    Runners are sorted by their worst lateness so that the runner
+    delaying everything else shows up first.
+
+    Args:
+        stats (Mapping[str, RunnerStats]):
+            A mapping of runner names to their telemetry,
+            as returned by `Scheduler.stats()`.
+
+    Returns:
+        Table: The table to print.
+    """
+    table = Table(
+        "Runner",
+        "Iterations",
+        "Late (p50)",
+        "Late (p99)",
+        "Late (max)",
+        "Exec (mean)",
+        "Exec (max)",
+        "Skipped",
+        "Reverted",
+        "Missed",
+        "Shed",
+        title="Runners",
+    )
+
+    def sort_key(item: tuple[str, RunnerStats]) -> float:
+        return item[1].lateness.maximum
+
+    for name, runner_stats in sorted(stats.items(), key=sort_key, reverse=True):
+        lateness, duration = runner_stats.lateness, runner_stats.duration
+        if lateness.count:
+            late = (
+                _format_ms(lateness.percentile(50)),
+                _format_ms(lateness.percentile(99)),
+                _format_ms(lateness.maximum),
+            )
+        else:
+            late = ("-", "-", "-")
+
+        if duration.count:
+            execution = (_format_ms(duration.mean), _format_ms(duration.maximum))
+        else:
+            execution = ("-", "-")
+
+        table.add_row(
+            name,
+            str(runner_stats.iterations),
+            *late,
+            *execution,
+            str(runner_stats.skipped),
+            str(runner_stats.reverted),
+            (
+                f"[red]{runner_stats.missed}[/red]"
+                if runner_stats.missed
+                else str(runner_stats.missed)
+            ),
+            str(runner_stats.shed),
+        )
+
+    return table
@@ -0,0 +1,322 @@
+import asyncio
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+from .async_runner import AsyncRunner, DeferredState
+from .errors import BadFunctionError
+
+if TYPE_CHECKING:
+    from .constants import MaybeCoroFunc
+    from .scheduler import Scheduler
+
+__all__ = ("Timeline", "TimelineEntry")
+
+
+class TimelineEntry:
+    """A function scheduled on a runner by a `Timeline`.
+
+    Entries are returned by `Timeline.add()` and `Timeline.extend()`,
+    and can be given back to `Timeline.cancel()`.
+    """
+
+    __slots__ = (
+        "deadline",
+        "runner",
+        "func",
+        "kwargs",
+        "arrived",
+        "cancelled",
+    )
+
+    def __init__(
+        self,
+        deadline: Union[float, int],
+        runner: AsyncRunner,
+        func: "MaybeCoroFunc",
+        kwargs: dict[str, Any],
+    ):
+        self.deadline = deadline
+        self.runner = runner
+        self.func = func
+        self.kwargs = kwargs
+        self.arrived = False
+        self.cancelled = False
+
+    def __repr__(self) -> str:
+        status = (
+            "cancelled" if self.cancelled else "arrived" if self.arrived else "pending"
+        )
+        return "<{} {} deadline={} runner={!r}>".format(
+            type(self).__name__,
+            status,
+            self.deadline,
+            self.runner.name,
+        )
+
+
+class _Armed:
+    """The entry of a runner that was pushed as a deferred state."""
+
+    __slots__ = ("entry", "state", "future")
+
+    def __init__(
+        self,
+        entry: TimelineEntry,
+        state: DeferredState,
+        future: asyncio.Future,
+    ):
+        self.entry = entry
+        self.state = state
+        self.future = future
+
+
+class Timeline:
+    """Schedules many functions on runners ahead of time.
+
+    Pushing every section of a pre-composed arrangement with
+    `AsyncRunner.push_deferred()` fills the heap of each runner.
+    Instead, the timeline keeps its entries in a queue per runner
+    and only pushes the next entry of each runner as a deferred state.
+    Once that entry's deadline has passed, the following one is pushed.
+
+    Runners are started by the timeline when their first entry is pushed.
+    Like any other swimming function, entries must keep swimming until
+    the next one takes over. Once a runner stops, either by itself or
+    through `Scheduler.stop_runner()`, its remaining entries are discarded.
+
+    Args:
+        scheduler (Scheduler): The scheduler used to wait for deadlines.
+    """
+
+    def __init__(self, scheduler: "Scheduler"):
+        self.scheduler = scheduler
+        self._queues: dict[AsyncRunner, list[tuple[float, int, TimelineEntry]]] = {}
+        self._armed: dict[AsyncRunner, _Armed] = {}
+        self._counter = itertools.count()
+        self._pending = 0
+
+    def __len__(self) -> int:
+        return self._pending
+
+    def __repr__(self) -> str:
+        return "<{} entries={} runners={}>".format(
+            type(self).__name__,
+            len(self),
+            len(self._queues),
+        )
+
+    # Public methods
+
+    def add(
+        self,
+        deadline: Union[float, int],
+        runner: AsyncRunner,
+        func: "MaybeCoroFunc",
+        **kwargs,
+    ) -> TimelineEntry:
+        """Schedules a function to be pushed onto a runner at the given time.
+
+        Args:
+            deadline (Union[float, int]): The absolute clock time of the entry.
+            runner (AsyncRunner): The runner to push the function onto.
+            func (MaybeCoroFunc): The function to push.
+            **kwargs: The keyword arguments being passed to `func`.
+
+        Returns:
+            TimelineEntry: The new entry.
+
+        Raises:
+            BadFunctionError: The value given for `func` must be callable.
+        """
+        entry = self._create_entry(deadline, runner, func, kwargs)
+        heapq.heappush(self._get_queue(runner), self._make_item(entry))
+        self._pending += 1
+        self._arm(runner)
+        return entry
+
+    def extend(
+        self,
+        entries: Iterable[
+            tuple[Union[float, int], AsyncRunner, "MaybeCoroFunc", dict[str, Any]]
+        ],
+    ) -> list[TimelineEntry]:
+        """Schedules many functions at once.
+
+        This is equivalent to calling `add()` for each entry, but each
+        runner's queue is only sorted once.
+
+        Args:
+            entries (Iterable[tuple]):
+                An iterable of `(deadline, runner, func, kwargs)` tuples.
+
+        Returns:
+            list[TimelineEntry]: The new entries, in the same order.
+
+        Raises:
+            BadFunctionError: One of the functions is not callable.
+        """
+        created = [
+            self._create_entry(deadline, runner, func, kwargs)
+            for deadline, runner, func, kwargs in entries
+        ]
+
+        touched: set[AsyncRunner] = set()
+        for entry in created:
+            self._get_queue(entry.runner).append(self._make_item(entry))
+            touched.add(entry.runner)
+
+        self._pending += len(created)
+        for runner in touched:
+            heapq.heapify(self._queues[runner])
+            self._arm(runner)
+
+        return created
+
+    def cancel(self, entry: TimelineEntry) -> bool:
+        """Cancels an entry that was not pushed onto its runner yet.
+
+        Args:
+            entry (TimelineEntry): The entry to cancel.
+
+        Returns:
+            bool: True if the entry was cancelled, False otherwise.
+        """
+        if entry.arrived or entry.cancelled:
+            return False
+
+        armed = self._armed.get(entry.runner)
+        if armed is not None and armed.entry is entry:
+            if not self._disarm(entry.runner, requeue=False):
+                return False  # The runner already took it
+
+        # Entries still in a queue are discarded lazily
+        entry.cancelled = True
+        self._pending -= 1
+        self._arm(entry.runner)
+        return True
+
+    def clear(self, runner: Optional[AsyncRunner] = None):
+        """Cancels every pending entry, or only those of the given runner.
+
+        Args:
+            runner (Optional[AsyncRunner]): The runner to clear entries of.
+        """
+        runners = {*self._queues, *self._armed} if runner is None else (runner,)
+        for runner in runners:
+            armed = self._armed.get(runner)
+            if armed is not None and self._disarm(runner, requeue=False):
+                armed.entry.cancelled = True
+                self._pending -= 1
+            for _, _, entry in self._queues.pop(runner, ()):
+                if not entry.cancelled:
+                    entry.cancelled = True
+                    self._pending -= 1
+
+    def next_deadline(self, runner: AsyncRunner) -> Optional[Union[float, int]]:
+        """Returns the deadline of the runner's next entry, if any."""
+        armed = self._armed.get(runner)
+        if armed is not None:
+            return armed.entry.deadline
+
+        entry = self._peek(runner)
+        return entry.deadline if entry is not None else None
+
+    # Internal methods
+
+    def _create_entry(
+        self,
+        deadline: Union[float, int],
+        runner: AsyncRunner,
+        func: "MaybeCoroFunc",
+        kwargs: dict[str, Any],
+    ) -> TimelineEntry:
+        if not callable(func):
+            raise BadFunctionError(f"Expected a callable, got {func!r}")
+        return TimelineEntry(deadline, runner, func, kwargs)
+
+    def _make_item(self, entry: TimelineEntry) -> tuple[float, int, TimelineEntry]:
+        return entry.deadline, next(self._counter), entry
+
+    def _get_queue(self, runner: AsyncRunner) -> list:
+        queue = self._queues.get(runner)
+        if queue is None:
+            queue = self._queues[runner] = []
+        return queue
+
+    def _peek(self, runner: AsyncRunner) -> Optional[TimelineEntry]:
+        """Returns the earliest entry of a runner that was not cancelled."""
+        queue = self._queues.get(runner)
+        while queue:
+            entry = queue[0][2]
+            if not entry.cancelled:
+                return entry
+            heapq.heappop(queue)
+
+        self._queues.pop(runner, None)
+        return None
+
+    def _arm(self, runner: AsyncRunner):
+        """Pushes the earliest entry of a runner as a deferred state,
+        replacing the one currently pushed if it comes later.
+        """
+        entry = self._peek(runner)
+        if entry is None:
+            return
+
+        armed = self._armed.get(runner)
+        if armed is not None:
+            if armed.entry.deadline <= entry.deadline:
+                return
+            elif not self._disarm(runner, requeue=True):
+                return  # The armed entry arrived, the next one follows
+
+        heapq.heappop(self._queues[runner])
+        state = runner.push_deferred(entry.deadline, entry.func, **entry.kwargs)
+        future = self.scheduler._wait_until(entry.deadline)
+        future.add_done_callback(lambda fut: self._on_deadline(runner, fut))
+        self._armed[runner] = _Armed(entry, state, future)
+
+        was_running = runner.is_running()
+        self.scheduler.start_runner(runner)
+
+        # Reloading interrupts the current iteration, so only do it when
+        # the runner would otherwise sleep past the entry's deadline
+        if (
+            was_running
+            and runner._expected_time > entry.deadline - runner.defer_duration
+        ):
+            runner.reload()
+
+    def _disarm(self, runner: AsyncRunner, *, requeue: bool) -> bool:
+        """Removes the entry pushed onto a runner.
+
+        Returns:
+            bool: True if it was removed, False if the runner already took it.
+        """
+        armed = self._armed[runner]
+        if not runner.cancel_deferred(armed.state):
+            return False
+
+        del self._armed[runner]
+        armed.future.cancel()
+        if requeue:
+            heapq.heappush(self._get_queue(runner), self._make_item(armed.entry))
+        return True
+
+    def _on_deadline(self, runner: AsyncRunner, future: asyncio.Future):
+        if future.cancelled():
+            return
+
+        armed = self._armed.pop(runner)
+        self._pending -= 1
+        if runner.is_running():
+            armed.entry.arrived = True
+            return self._arm(runner)
+
+        # The runner stopped swimming, ending the rest of its entries
+        if runner.cancel_deferred(armed.state):
+            armed.entry.cancelled = True
+        else:
+            armed.entry.arrived = True
+        self.clear(runner)
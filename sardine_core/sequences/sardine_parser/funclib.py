@@ -191,9 +191,10 @@ class FunctionLibrary:
 
     def beat(self, *args, **kwargs) -> list:
         """Return True if we are on the desired beat. Multiple beats are supported"""
+        now = self.clock.snapshot()
         return (
             [1]
-            if int(self.clock.beat % self.clock.beats_per_bar)
+            if int(now.beat % now.beats_per_bar)
             in list(map(lambda x: int(x), list(chain(*args))))
             else [0]
         )
@@ -201,19 +202,23 @@ class FunctionLibrary:
     def phase(self, x: list, y: list, **kwargs) -> list:
         """Return True if phase is in between x and y else False"""
         tolerance = 0.01
-        return [1] if x[0] + tolerance <= self.clock.phase <= y[0] - tolerance else [0]
+        return (
+            [1]
+            if x[0] + tolerance <= self.clock.snapshot().phase <= y[0] - tolerance
+            else [0]
+        )
 
     def oddbar(self, *args, **kwargs) -> list:
         """Return True if the current bar is odd, false otherwise"""
-        return [1] if self.clock.bar % 2 != 0 else [0]
+        return [1] if self.clock.snapshot().bar % 2 != 0 else [0]
 
     def modbar(self, modulo, *args, **kwargs) -> list:
         """Return True if modulo of bar against current bar is true"""
-        return [1] if self.clock.bar % modulo[0] == 0 else [0]
+        return [1] if self.clock.snapshot().bar % modulo[0] == 0 else [0]
 
     def evenbar(self, *args, **kwargs) -> list:
         """Return True if the current bar is even, false otherwise"""
-        return [1] if self.clock.bar % 2 == 0 else [0]
+        return [1] if self.clock.snapshot().bar % 2 == 0 else [0]
 
     def dice(self, choice: list, faces: list, *args, **kwargs) -> list:
         """Simulation of a dice"""
@@ -227,7 +232,7 @@ class FunctionLibrary:
         """
 
         def inner_function(x) -> list:
-            modulo_operation = (int(self.clock.bar) % x[0]) + 1
+            modulo_operation = (int(self.clock.snapshot().bar) % x[0]) + 1
             return [1] if modulo_operation == x[0] else [0]
 
         results = []
@@ -885,7 +890,7 @@ class FunctionLibrary:
             list: lfo value (-1 -> 1)
         """
         period = float(period[0])
-        return [sin(2 * pi * self.clock.time / period)]
+        return [sin(2 * pi * self.clock.snapshot().time / period)]
 
     def ltri(self, period: int | float, **kwargs) -> list:
         """Basic triangular low frequency oscillator
@@ -895,7 +900,7 @@ class FunctionLibrary:
             list: lfo value (-1 -> 1)
         """
         period = float(period[0])
-        t = self.clock.time % period
+        t = self.clock.snapshot().time % period
 
         def inner_func():
             if t < period / 4:
@@ -915,7 +920,7 @@ class FunctionLibrary:
             list: lfo value (-1 -> 1)
         """
         period = float(period[0])
-        t = self.clock.time % period
+        t = self.clock.snapshot().time % period
         return [2 * (t / period) - 1]
 
     def lrect(self, period: int | float, pwm: int | float = 0.5, **kwargs) -> list:
@@ -926,7 +931,7 @@ class FunctionLibrary:
             list: lfo value (-1 -> 1)
         """
         period, pwm = float(period[0]), float(pwm[0]) * 100
-        t = self.clock.time % period
+        t = self.clock.snapshot().time % period
         return [1 if t < (period * (pwm / 100)) else -1]
 
     def ulsin(self, period: int | float, **kwargs) -> list:
@@ -969,7 +974,7 @@ class FunctionLibrary:
         print(data)
 
         if not data:
-            return [self.clock.time]
+            return [self.clock.snapshot().time]
         elif data == "year":
             return [int(datetime.datetime.now().year)]
         elif data == "month":
@@ -987,11 +992,11 @@ class FunctionLibrary:
 
     def get_bar(self, *args, **kwargs):
         """Return current measure (bar) as integer"""
-        return [self.clock.bar]
+        return [self.clock.snapshot().bar]
 
     def get_phase(self, *args, **kwargs):
         """Return current phase (phase) as integer"""
-        return [self.clock.phase]
+        return [self.clock.snapshot().phase]
 
     def get_unix_time(self, *args, **kwargs):
         """Return current unix time as integer"""
@@ -40,12 +40,23 @@ class BaseStream(ABC):
         # Querying the pattern using time information
         cycle_from, cycle_to = cycle
         es = self.pattern.onsets_only().query(TimeSpan(cycle_from, cycle_to))
+        if not es:
+            return
 
-        # Processing individual events
+        # Converting every onset and offset of the window in one call.
+        # Tidal's `timeAtBeat()` only differs from `time_at_beat()`
+        # by a constant offset, which the first beat is used to find.
+        beats = [0]
         for e in es:
-            cycle_on, cycle_off = e.whole.begin, e.whole.end
-            on = clock.timeAtBeat(cycle_on * beats_per_cycle)
-            off = clock.timeAtBeat(cycle_off * beats_per_cycle)
+            beats.append(e.whole.begin * beats_per_cycle)
+            beats.append(e.whole.end * beats_per_cycle)
+        times = clock.times_at_beats(beats)
+        offset = clock.timeAtBeat(0) - times[0]
+
+        # Processing individual events
+        for i, e in enumerate(es):
+            on = times[2 * i + 1] + offset
+            off = times[2 * i + 2] + offset
             delta_secs = off - on
 
             link_secs = clock.shifted_time + clock._tidal_nudge
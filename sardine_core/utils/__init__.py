@@ -1,5 +1,6 @@
 import functools
 import inspect
+import sys
 from typing import TYPE_CHECKING, Callable, Literal, Optional, ParamSpec, TypeVar, Union
 
 from .Messages import *
@@ -77,6 +78,18 @@ async def maybe_coro(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) ->
     return func(*args, **kwargs)
 
 
+def get_numpy(values: object):
+    """Returns the NumPy module if the given values are a NumPy array, or None.
+
+    NumPy is not a dependency of Sardine, so this never imports it:
+    if the values are an array, NumPy must have already been imported.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy
+    return None
+
+
 def plural(n: int, word: str, suffix: str = "s"):
     return word if n == 1 else word + suffix
 
@@ -1,12 +1,15 @@
 import asyncio
 import math
+import random
+import time
 from typing import Type
 
+import mido
 import pytest
 import rich
 from rich.table import Table
 
-from sardine_core import BaseClock, FishBowl, InternalClock, LinkClock
+from sardine_core import BaseClock, FishBowl, InternalClock, LinkClock, MidiClock
 
 from . import EventLogHandler, Pauser, fish_bowl
 
@@ -71,3 +74,185 @@ async def test_clock_sleeping(
         assert math.isclose(event.clock_time, rt, abs_tol=real_tol)
 
     assert not ALWAYS_FAIL, "ALWAYS_FAIL is enabled"
+
+
+@pytest.mark.asyncio
+async def test_link_clock_sleep():
+    TOLERANCE = 0.005
+
+    fish_bowl = FishBowl(clock=LinkClock())
+    clock, sleeper = fish_bowl.clock, fish_bowl.sleeper
+    assert clock.can_sleep()
+
+    fish_bowl.start()
+    await asyncio.sleep(0.01)
+
+    for _ in range(5):
+        deadline = clock.time + 0.02
+        await sleeper.sleep_until(deadline)
+        assert deadline <= clock.time < deadline + TOLERANCE
+
+    # A timeline jump re-arms the sleep without waking it up early
+    deadline = clock.time + 0.05
+    task = asyncio.create_task(sleeper.sleep_until(deadline))
+    await asyncio.sleep(0.01)
+    assert clock._sleeps
+    clock._rearm_sleeps()
+    await task
+    assert deadline <= clock.time < deadline + TOLERANCE
+
+    fish_bowl.stop()
+
+
+@pytest.mark.asyncio
+async def test_link_clock_snapshots():
+    fish_bowl = FishBowl(clock=LinkClock(idle_interval=0.05))
+    clock = fish_bowl.clock
+    fish_bowl.start()
+    await asyncio.sleep(0.01)
+
+    # Captures slow down while nothing is sleeping on the clock,
+    # but the time keeps following Link's clock
+    assert clock.get_loop_interval() == clock.idle_interval
+    snapshot = clock.session_snapshot
+    start, start_phase = clock.time, clock.phase
+    await asyncio.sleep(0.01)
+    assert clock.session_snapshot is snapshot
+    elapsed = clock.time - start
+    assert elapsed >= 0.005
+
+    # The phase is extrapolated from the capture to agree with the time
+    advance = (clock.phase - start_phase) % clock.beat_duration
+    assert advance == pytest.approx(elapsed, abs=0.002)
+
+    task = asyncio.create_task(fish_bowl.sleep(0.05))
+    await asyncio.sleep(0.01)
+    assert clock.get_loop_interval() == clock.loop_interval
+    await task
+
+    # Tempo changes are published as a whole new snapshot
+    clock.tempo = 90
+    assert clock.session_snapshot is not snapshot
+    assert clock.session_snapshot.tempo == clock.tempo == 90
+    assert clock.beat_duration == 60 / 90
+    fish_bowl.stop()
+
+
+@pytest.mark.asyncio
+async def test_link_clock_session_changes():
+    fish_bowl = FishBowl(clock=LinkClock())
+    clock = fish_bowl.clock
+    logger = EventLogHandler(whitelist=("tempo_change", "playing_change"))
+    fish_bowl.add_handler(logger)
+    fish_bowl.start()
+    await asyncio.sleep(0.05)
+
+    # Commit straight to the session like a remote peer would
+    session = clock._link.captureSessionState()
+    session.setTempo(100, clock._link_clock.micros())
+    session.setIsPlaying(True, clock._link_clock.micros())
+    clock._link.commitSessionState(session)
+    await asyncio.sleep(0.05)
+
+    assert sorted((e.event, e.args) for e in logger.events) == [
+        ("playing_change", (True,)),
+        ("tempo_change", (120, 100)),
+    ]
+    assert clock.tempo == 100
+    assert clock.playing
+
+    # Local changes are only dispatched once
+    clock.tempo = 110
+    await asyncio.sleep(0.05)
+    assert len(list(logger.filter("tempo_change"))) == 2
+
+    fish_bowl.stop()
+
+
+@pytest.mark.asyncio
+async def test_link_clock_batch_conversions():
+    fish_bowl = FishBowl(clock=LinkClock())
+    clock = fish_bowl.clock
+    fish_bowl.start()
+    await asyncio.sleep(0.05)
+
+    now = clock.time
+    times = [now + i / 10 for i in range(-5, 20)]
+    beats = clock.beats_at_times(times)
+    assert beats == pytest.approx([clock.beat_at_time(t) for t in times], abs=1e-5)
+    assert clock.times_at_beats(beats) == pytest.approx(times, abs=1e-5)
+    fish_bowl.stop()
+
+
+class _FakeMidiIn:
+    def __init__(self):
+        self.listeners = []
+
+    def add_clock_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_clock_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def send(self, type_: str, timestamp: float, **kwargs):
+        for listener in self.listeners:
+            listener(mido.Message(type_, **kwargs), timestamp)
+
+
+@pytest.mark.asyncio
+async def test_midi_clock():
+    midi_in = _FakeMidiIn()
+    fish_bowl = FishBowl(clock=MidiClock(midi_in, tempo=120))
+    clock = fish_bowl.clock
+    logger = EventLogHandler(whitelist=("tempo_change", "playing_change"))
+    fish_bowl.add_handler(logger)
+    fish_bowl.start()
+    await asyncio.sleep(0)
+    assert midi_in.listeners
+
+    # Four bars of 100 BPM with up to 1ms of jitter, ending now
+    period = 60 / (100 * 24)
+    rng = random.Random(0)
+    start = time.perf_counter() - 16 * 24 * period
+    midi_in.send("start", start - period)
+    for i in range(16 * 24):
+        midi_in.send("clock", start + i * period + rng.uniform(-0.0005, 0.0005))
+    await asyncio.sleep(0)
+
+    assert clock.tempo == pytest.approx(100, abs=0.2)
+    assert clock.playing
+    # Start aligns the first tick on a bar, which was four bars ago
+    beat = clock.beat_at_time(clock.time)
+    assert (beat + 0.5) % clock.beats_per_bar == pytest.approx(0.5, abs=0.05)
+    assert clock.beat_at_time(clock.time_at_beat(17.5)) == pytest.approx(17.5)
+    assert [e.event for e in logger.events][:2] == ["playing_change", "tempo_change"]
+    assert logger.events[-1].args[1] == pytest.approx(clock.tempo, abs=0.1)
+
+    # Jitter is filtered out of the tick estimates
+    state = clock._state
+    assert abs(state.time - (start + 383 * period)) < 0.0002
+
+    with pytest.raises(RuntimeError):
+        clock.tempo = 120
+
+    # After a gap, a song position pointer moves beats forward to match
+    now = time.perf_counter()
+    midi_in.send("stop", now - 0.5)
+    midi_in.send("songpos", now - 0.4, pos=6)
+    midi_in.send("continue", now - 0.4)
+    midi_in.send("clock", now)
+    await asyncio.sleep(0)
+
+    # Measured at the last tick, however long the event loop took since
+    new_beat = clock.beat_at_time(clock.time - (time.perf_counter() - now))
+    assert new_beat % clock.beats_per_bar == pytest.approx(1.5, abs=0.01)
+    assert new_beat > beat
+    assert [e.args for e in logger.filter("playing_change")] == [
+        (True,),
+        (False,),
+        (True,),
+    ]
+
+    fish_bowl.stop()
+    await asyncio.sleep(0)
+    assert not midi_in.listeners
@@ -1,3 +1,7 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
 from typing import Any, Optional
 
 import pytest
@@ -87,3 +91,181 @@ def test_handler(fish_bowl: FishBowl, dummy_handler: DummyHandler):
         assert fish_bowl._event_hooks.get(event) is None
 
     assert fish_bowl._hook_events.get(dummy_handler) is None
+
+
+def test_dispatch_table(fish_bowl: FishBowl, dummy_handler: DummyHandler):
+    event = dummy_handler.EVENTS[0]
+    fish_bowl.dispatch(event)
+    assert event not in fish_bowl._dispatch_table
+    assert fish_bowl._dispatch_table[None] == ()
+
+    # Registering a hook replaces the cached hooks of its event
+    fish_bowl.add_handler(dummy_handler)
+    fish_bowl.dispatch(event)
+    assert dummy_handler.event_count == 1
+    assert fish_bowl._dispatch_table[event] == (dummy_handler,)
+
+    # Global hooks apply to every cached event
+    other = DummyHandler()
+    fish_bowl.add_handler(other)
+    other.register(None)
+    fish_bowl.dispatch(event)
+    fish_bowl.dispatch("baz")
+    assert fish_bowl._dispatch_table[event] == (dummy_handler, other)
+    assert fish_bowl._dispatch_table[None] == (other,)
+    assert other.last_event == ("baz", ())
+
+    # Events without local hooks are never cached on their own
+    size = len(fish_bowl._dispatch_table)
+    for i in range(100):
+        fish_bowl.dispatch(f"flood_{i}")
+    assert len(fish_bowl._dispatch_table) == size
+    assert len(fish_bowl._deferred_table) == size
+
+    fish_bowl.remove_handler(other)
+    fish_bowl.remove_handler(dummy_handler)
+    fish_bowl.dispatch(event)
+    assert dummy_handler.event_count == 2
+    assert event not in fish_bowl._dispatch_table
+
+
+class DeferredHandler(DummyHandler):
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.fail = fail
+        self.threads: list[threading.Thread] = []
+
+    def setup(self):
+        self.has_setup = True
+        for event in self.EVENTS:
+            self.register(event, deferred=True)
+
+    def hook(self, event: str, *args):
+        super().hook(event, *args)
+        self.threads.append(threading.current_thread())
+        if self.fail:
+            raise ValueError("deferred hooks should not raise into dispatch")
+
+
+@pytest.mark.asyncio
+async def test_deferred_hooks():
+    fish_bowl = FishBowl(deferred_limit=2)
+    immediate = DummyHandler()
+    deferred = DeferredHandler(fail=True)
+    fish_bowl.add_handler(immediate)
+    fish_bowl.add_handler(deferred)
+
+    fish_bowl.dispatch("foo", 1)
+    assert immediate.last_event == ("foo", (1,))
+    assert deferred.event_count == 0
+
+    await asyncio.sleep(0)
+    assert deferred.last_event == ("foo", (1,))
+    assert deferred.threads == [threading.current_thread()]
+
+    # Only the latest dispatches are kept once the queue is full
+    deferred.reset_event_count()
+    for i in range(3):
+        fish_bowl.dispatch("bar", i)
+    await asyncio.sleep(0)
+    assert deferred.event_count == 2
+    assert deferred.last_event == ("bar", (2,))
+    assert fish_bowl.deferred_dropped == 1
+
+    # Registering again can make a hook immediate
+    deferred.register("foo")
+    deferred.fail = False
+    fish_bowl.dispatch("foo", 2)
+    assert deferred.last_event == ("foo", (2,))
+
+
+def test_deferred_hooks_executor():
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        fish_bowl = FishBowl(deferred_executor=executor)
+        deferred = DeferredHandler()
+        fish_bowl.add_handler(deferred)
+        for i in range(10):
+            fish_bowl.dispatch("foo", i)
+
+    assert deferred.event_count == 10
+    assert deferred.last_event == ("foo", (9,))
+    assert threading.current_thread() not in deferred.threads
+
+
+def test_rate_limit(fish_bowl: FishBowl, dummy_handler: DummyHandler):
+    fish_bowl.add_handler(dummy_handler)
+    fish_bowl.set_rate_limit("foo", 1e-3, burst=2)
+
+    for i in range(5):
+        fish_bowl.dispatch("foo", i)
+        fish_bowl.dispatch("bar", i)
+    assert dummy_handler.event_count == 2 + 5
+    assert fish_bowl.rate_limited == 3
+
+    fish_bowl.set_rate_limit("foo", None)
+    fish_bowl.dispatch("foo", 5)
+    assert dummy_handler.last_event == ("foo", (5,))
+
+    with pytest.raises(ValueError):
+        fish_bowl.set_rate_limit("foo", 0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_coalesce():
+    fish_bowl = FishBowl()
+    handler = DummyHandler()
+    fish_bowl.add_handler(handler)
+    fish_bowl.set_rate_limit("foo", 20, coalesce=True)
+
+    for i in range(100):
+        fish_bowl.dispatch("foo", i)
+    assert handler.last_event == ("foo", (0,))
+    assert fish_bowl.rate_limited == 99
+
+    # Only the latest arguments are dispatched once a token is available
+    await asyncio.sleep(0.1)
+    assert handler.event_count == 2
+    assert handler.last_event == ("foo", (99,))
+
+
+@pytest.mark.asyncio
+async def test_deferred_hooks_from_thread():
+    fish_bowl = FishBowl()
+    deferred = DeferredHandler()
+    fish_bowl.add_handler(deferred)
+    fish_bowl.start()
+
+    # Deferred hooks of a dispatch from another thread run on the event loop
+    await asyncio.to_thread(fish_bowl.dispatch, "foo", 1)
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert deferred.last_event == ("foo", (1,))
+    assert deferred.threads == [threading.current_thread()]
+    fish_bowl.stop()
+
+
+def test_deferred_hooks_executor_order():
+    class SlowHandler(DeferredHandler):
+        def __init__(self):
+            super().__init__()
+            self.running = 0
+            self.overlaps = 0
+            self.args: list[tuple] = []
+
+        def hook(self, event: str, *args):
+            self.running += 1
+            self.overlaps += self.running > 1
+            time.sleep(0.001)
+            self.args.append(args)
+            self.running -= 1
+
+    # Deferred hooks run one at a time and in order, however many workers
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        fish_bowl = FishBowl(deferred_executor=executor)
+        deferred = SlowHandler()
+        fish_bowl.add_handler(deferred)
+        for i in range(20):
+            fish_bowl.dispatch("foo", i)
+
+    assert deferred.args == [(i,) for i in range(20)]
+    assert deferred.overlaps == 0
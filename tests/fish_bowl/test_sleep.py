@@ -1,8 +1,15 @@
+import asyncio
 import time
 
 import pytest
 
-from sardine_core import FishBowl, InternalClock
+from sardine_core import (
+    BaseClock,
+    FishBowl,
+    InternalClock,
+    JitterEstimator,
+    SleepHandler,
+)
 
 from . import Pauser, fish_bowl
 
@@ -27,3 +34,194 @@ async def test_sleep_internal_clock(fish_bowl: FishBowl):
     pauser.assert_equality(tolerance=TOLERANCE)
 
     assert not ALWAYS_FAIL, "ALWAYS_FAIL is enabled"
+
+
+@pytest.mark.asyncio
+async def test_sleep_interrupted_by_pause(fish_bowl: FishBowl):
+    clock = fish_bowl.clock
+    fish_bowl.start()
+
+    deadline = clock.time + 0.05
+    task = asyncio.create_task(fish_bowl.sleeper.sleep_until(deadline))
+    await asyncio.sleep(0.01)
+    fish_bowl.pause()
+    await asyncio.sleep(0.1)
+    assert not task.done()
+
+    fish_bowl.resume()
+    await task
+    assert clock.time >= deadline - 0.005
+
+    task = asyncio.create_task(fish_bowl.sleeper.sleep(1))
+    await asyncio.sleep(0.01)
+    fish_bowl.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_call_at(fish_bowl: FishBowl):
+    clock = fish_bowl.clock
+    calls: list[tuple[str, float]] = []
+
+    def record(name: str):
+        calls.append((name, clock.time))
+
+    with pytest.raises(RuntimeError):
+        fish_bowl.sleeper.call_at(clock.time, record, "too early")
+
+    fish_bowl.start()
+    now = clock.time
+    fish_bowl.sleeper.call_at(now + 0.04, record, "b")
+    fish_bowl.sleeper.call_at(now + 0.02, record, "a")
+    fish_bowl.sleeper.call_at(now + 0.06, record, "c")
+
+    await asyncio.sleep(0.03)
+    fish_bowl.pause()
+    await asyncio.sleep(0.1)
+    assert [name for name, _ in calls] == ["a"]
+
+    fish_bowl.resume()
+    await asyncio.sleep(0.05)
+    assert [name for name, _ in calls] == ["a", "b", "c"]
+    assert calls[1][1] >= now + 0.04 - 0.005
+
+    fish_bowl.sleeper.call_at(clock.time + 0.02, record, "d")
+    fish_bowl.stop()
+    fish_bowl.start()
+    await asyncio.sleep(0.04)
+    fish_bowl.stop()
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_sleep_spin_tail():
+    ITERATIONS = 10
+    SPIN_GUARD = 0.002
+
+    sleeper = SleepHandler(spin_guard=SPIN_GUARD, spin_budget=SPIN_GUARD * 3)
+    fish_bowl = FishBowl(sleeper=sleeper)
+    clock = fish_bowl.clock
+    fish_bowl.start()
+
+    for _ in range(ITERATIONS):
+        deadline = clock.time + 0.01
+        await sleeper.sleep_until(deadline)
+        # Spinning never wakes up early
+        assert clock.time >= deadline
+
+    # Each spin is bounded by the guard band, so the budget is only
+    # overrun by the spin that exhausted it
+    assert sleeper.spin_budget <= sleeper._spin_spent
+    assert sleeper._spin_spent <= sleeper.spin_budget + 2 * SPIN_GUARD
+
+    # Once the budget is exhausted, sleeps only rely on the event loop
+    assert sleeper._get_spin_guard() == 0
+    fish_bowl.stop()
+
+
+class PollingClock(InternalClock):
+    """An internal clock that can only be polled for its time."""
+
+    sleep = BaseClock.sleep
+
+    def uses_loop_time(self) -> bool:
+        return False
+
+
+@pytest.mark.asyncio
+async def test_sleep_adaptive_polling():
+    TOLERANCE = 0.005
+
+    fish_bowl = FishBowl(clock=PollingClock())
+    clock, sleeper = fish_bowl.clock, fish_bowl.sleeper
+    assert not clock.can_sleep()
+
+    polls = 0
+    get_poll_delay = sleeper._get_poll_delay
+
+    def count_polls():
+        nonlocal polls
+        polls += 1
+        return get_poll_delay()
+
+    sleeper._get_poll_delay = count_polls
+    fish_bowl.start()
+
+    # A distant deadline must not stop earlier ones from being polled
+    far = asyncio.create_task(sleeper.sleep(1))
+    await asyncio.sleep(0.01)
+
+    deadline = clock.time + 0.1
+    await sleeper.sleep_until(deadline)
+    assert deadline <= clock.time < deadline + TOLERANCE
+    # Polling every millisecond would take about 100 polls
+    assert polls < 30
+
+    fish_bowl.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await far
+
+
+def test_jitter_estimator():
+    jitter = JitterEstimator(20, lead_percentile=25)
+    for _ in range(19):
+        jitter.record(0.001)
+    # A single pause should not drag the lead along with it
+    jitter.record(0.5)
+    jitter.update()
+
+    assert jitter.count == 20
+    assert jitter.lead == pytest.approx(0.001)
+    assert jitter.maximum == 0.5
+    assert jitter.percentile(100) == 0.5
+
+    # Early wakeups never lead to a negative lead
+    for _ in range(20):
+        jitter.record(-0.002)
+    assert jitter.lead == 0
+    assert jitter.minimum == -0.002
+    assert -0.002 < jitter.mean < 0.5
+
+    jitter.reset()
+    assert jitter.count == 0 and jitter.lead == 0
+
+
+@pytest.mark.asyncio
+async def test_sleep_lead_calibration():
+    TOLERANCE = 0.016
+
+    sleeper = SleepHandler(32, calibration_size=8)
+    fish_bowl = FishBowl(sleeper=sleeper)
+    clock = fish_bowl.clock
+    fish_bowl.start()
+
+    # The calibration burst runs without any sleep being requested
+    await asyncio.sleep(0.05)
+    assert sleeper.jitter.count >= 8
+    assert 0 <= sleeper._get_lead() <= sleeper.jitter.max_lead
+
+    deadline = clock.time + 0.02
+    await sleeper.sleep_until(deadline)
+    assert abs(clock.time - deadline) < TOLERANCE
+
+    # Swapping clocks measures the new clock from scratch
+    fish_bowl.swap_clock(InternalClock())
+    assert sleeper.jitter.count == 0
+    await asyncio.sleep(0.05)
+    assert sleeper.jitter.count >= 8
+    fish_bowl.stop()
+
+
+@pytest.mark.asyncio
+async def test_sleep_lead_disabled():
+    sleeper = SleepHandler(0)
+    fish_bowl = FishBowl(sleeper=sleeper)
+    fish_bowl.start()
+    await sleeper.sleep(0.01)
+
+    # Wakeup errors are measured even when they are not corrected
+    assert not sleeper._is_calibrating()
+    assert sleeper.jitter.count == 1
+    assert sleeper._get_lead() == 0
+    fish_bowl.stop()
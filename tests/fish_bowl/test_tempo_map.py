@@ -0,0 +1,106 @@
+import math
+
+import pytest
+
+from sardine_core import FishBowl, InternalClock
+from sardine_core.clock.tempo_map import TempoMap
+
+
+def test_constant_tempo():
+    tempo_map = TempoMap(120)
+
+    assert tempo_map.beat_at(1.5) == 3
+    assert tempo_map.time_at(3) == 1.5
+    assert tempo_map.tempo_at(10) == 120
+
+
+def test_tempo_step():
+    tempo_map = TempoMap(120)
+    tempo_map.set_tempo(2, 60)
+
+    # Beats are continuous across the change
+    assert tempo_map.beat_at(2) == 4
+    assert tempo_map.beat_at(3) == 5
+    assert tempo_map.time_at(5) == 3
+    assert tempo_map.time_at(2) == 1
+
+
+def test_tempo_step_discards_future_changes():
+    tempo_map = TempoMap(120)
+    tempo_map.set_tempo(4, 60)
+    tempo_map.set_tempo(2, 240)
+
+    assert len(tempo_map.segments) == 2
+    assert tempo_map.beat_at(4) == 12
+
+
+def test_tempo_ramp():
+    tempo_map = TempoMap(60)
+    tempo_map.ramp(1, 180, 2)
+
+    assert tempo_map.tempo_at(2) == 120
+    # Average tempo of 120 BPM over two seconds
+    assert tempo_map.beat_at(3) == pytest.approx(1 + 4)
+    assert tempo_map.tempo_at(5) == 180
+    assert tempo_map.beat_at(4) == pytest.approx(5 + 3)
+
+
+@pytest.mark.parametrize("beat", [0.5, 1, 1.25, 2.5, 4.9, 5, 7.75])
+def test_tempo_ramp_inverse(beat: float):
+    tempo_map = TempoMap(60)
+    tempo_map.ramp(1, 180, 2)
+
+    assert tempo_map.beat_at(tempo_map.time_at(beat)) == pytest.approx(beat)
+
+
+def test_max_segments():
+    tempo_map = TempoMap(120, max_segments=4)
+    for i in range(1, 10):
+        tempo_map.set_tempo(i, 60 + i)
+
+    assert len(tempo_map.segments) == 4
+    assert tempo_map.segments[0].time == 6
+
+
+def test_clock_deadlines_during_ramp():
+    fish_bowl = FishBowl(clock=InternalClock(60))
+    clock = fish_bowl.clock
+    clock.ramp_tempo(180, 8)
+
+    time = 0.0
+    for beat in range(1, 12):
+        time = clock.get_beat_deadline(1, time=time)
+        assert math.isclose(clock.beat_at_time(time), beat, abs_tol=1e-9)
+
+    assert clock.tempo_map.tempo_at(time) == 180
+
+
+def _make_batch_map() -> TempoMap:
+    tempo_map = TempoMap(120)
+    tempo_map.set_tempo(2, 60)
+    tempo_map.ramp(4, 180, 2)
+    return tempo_map
+
+
+def test_batch_conversions():
+    tempo_map = _make_batch_map()
+    times = [-1, 0.5, 1.9, 2, 3.5, 4.25, 5.5, 6, 9, 0.1]
+
+    beats = tempo_map.beats_at(times)
+    assert beats == [tempo_map.beat_at(t) for t in times]
+    assert tempo_map.times_at(beats) == [tempo_map.time_at(b) for b in beats]
+    assert tempo_map.times_at(beats) == pytest.approx(times)
+
+
+def test_batch_conversions_numpy():
+    numpy = pytest.importorskip("numpy")
+    tempo_map = _make_batch_map()
+    times = numpy.linspace(-1, 9, 101)
+
+    beats = tempo_map.beats_at(times)
+    assert isinstance(beats, numpy.ndarray)
+    assert beats == pytest.approx([tempo_map.beat_at(t) for t in times])
+
+    result = tempo_map.times_at(beats)
+    assert isinstance(result, numpy.ndarray)
+    assert result == pytest.approx(times)
@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+
+from sardine_core import FishBowl, MidiClockOutput
+
+
+class _RecordingPort:
+    def __init__(self):
+        self.messages = []
+
+    def send(self, message):
+        self.messages.append((message.type, time.perf_counter(), message))
+
+    def types(self) -> list[str]:
+        return [type_ for type_, *_ in self.messages]
+
+
+@pytest.mark.asyncio
+async def test_midi_clock_output():
+    port = _RecordingPort()
+    bowl = FishBowl()
+    bowl.clock.tempo = 240
+    output = MidiClockOutput(port, nice=None)
+    bowl.add_handler(output)
+
+    bowl.start()
+    await asyncio.sleep(0.5)
+    bowl.pause()
+    await asyncio.sleep(0.05)
+    assert not output.playing
+
+    types = port.types()
+    assert types[0] == "start"
+    assert types[-1] == "stop"
+    clocks = [t for type_, t, _ in port.messages if type_ == "clock"]
+    assert len(clocks) == output.ticks == output.jitter.count
+
+    # 96 ticks per second at 240 BPM
+    assert 40 <= len(clocks) <= 50
+    intervals = [b - a for a, b in zip(clocks, clocks[1:])]
+    assert sum(intervals) / len(intervals) == pytest.approx(1 / 96, rel=0.05)
+    assert output.resyncs == 0
+
+    # Resuming continues from the next sixteenth note
+    port.messages.clear()
+    bowl.resume()
+    await asyncio.sleep(0.1)
+    bowl.stop()
+    await asyncio.sleep(0.05)
+
+    types = port.types()
+    assert types[:3] == ["songpos", "continue", "clock"]
+    assert types[-1] == "stop"
+    position = port.messages[0][2].pos
+    assert position == pytest.approx(len(clocks) / 6, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_midi_clock_output_tempo_changes():
+    port = _RecordingPort()
+    bowl = FishBowl()
+    bowl.clock.tempo = 240
+    output = MidiClockOutput(port, nice=None)
+    bowl.add_handler(output)
+
+    bowl.start()
+    try:
+        # Change the tempo more often than the thread ticks
+        changes = 0
+        end = time.perf_counter() + 0.5
+        while time.perf_counter() < end:
+            if changes % 2:
+                bowl.clock.ramp_tempo(120 + changes % 200, 1)
+            else:
+                bowl.clock.tempo = 120 + changes % 200
+            changes += 1
+            await asyncio.sleep(0.001)
+    finally:
+        bowl.stop()
+    await asyncio.sleep(0.05)
+
+    assert changes > output.ticks > 20
+    assert output.errors == 0
+    assert port.types()[-1] == "stop"
+
+
+class _FailingPort(_RecordingPort):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def send(self, message):
+        if message.type == "clock" and self.failures:
+            self.failures -= 1
+            raise OSError("port disconnected")
+        super().send(message)
+
+
+@pytest.mark.asyncio
+async def test_midi_clock_output_errors(capsys):
+    port = _FailingPort(3)
+    bowl = FishBowl()
+    bowl.clock.tempo = 240
+    output = MidiClockOutput(port, nice=None)
+    bowl.add_handler(output)
+
+    bowl.start()
+    await asyncio.sleep(0.2)
+    bowl.stop()
+    await asyncio.sleep(0.05)
+
+    assert output.errors == 3
+    assert "port disconnected" in capsys.readouterr().err
+    assert output.ticks > 5
+    assert port.types()[-1] == "stop"
@@ -1 +1,53 @@
-# TODO test_osc.py
+import asyncio
+
+import pytest
+from osc4py3 import oscbuildparse
+from osc4py3.as_eventloop import osc_send, osc_udp_client
+
+from sardine_core import BaseHandler, FishBowl
+from sardine_core.handlers import OSCInHandler, OSCLoop
+
+PORT = 11299
+
+
+class RemoteHandler(BaseHandler):
+    def __init__(self, event: str):
+        super().__init__()
+        self.event = event
+        self.calls: list[tuple] = []
+
+    def setup(self):
+        self.register(self.event)
+
+    def hook(self, event: str, *args):
+        self.calls.append(args)
+
+
+@pytest.mark.asyncio
+async def test_osc_remote_rate_limit():
+    fish_bowl = FishBowl()
+    osc_loop = OSCLoop()
+    receiver = OSCInHandler(osc_loop, port=PORT, name="RemoteTest")
+    handler = RemoteHandler("/sardine/remote")
+    fish_bowl.add_handler(osc_loop)
+    fish_bowl.add_handler(handler)
+    fish_bowl.start()
+    await asyncio.sleep(0.05)  # Lets the OSC loop start up
+
+    receiver.remote("/sardine/remote", rate=10)
+    osc_udp_client("127.0.0.1", PORT, "RemoteTestClient")
+
+    # A flood of control messages is dispatched at most at the given rate,
+    # the latest message being dispatched once the flood is over
+    for i in range(50):
+        message = oscbuildparse.OSCMessage("/sardine/remote", ",i", [i])
+        osc_send(message, "RemoteTestClient")
+    await asyncio.sleep(0.3)
+
+    fish_bowl.stop()
+    fish_bowl.remove_handler(osc_loop)
+
+    assert handler.calls[0] == (0,)
+    assert handler.calls[-1] == (49,)
+    assert len(handler.calls) <= 4
+    assert fish_bowl.rate_limited >= 46
@@ -0,0 +1,31 @@
+from sardine_core import FishBowl, Player
+
+
+def test_player_is_lazy():
+    bowl = FishBowl()
+    player = Player("aa", bowl=bowl)
+
+    assert player._runner is None
+    assert player not in bowl.handlers
+
+    # Stopping a player that was never used should not create anything
+    player.stop()
+    assert player._runner is None
+    assert player not in bowl.handlers
+
+    assert player.env is bowl
+    assert player in bowl.handlers
+
+    runner = player.runner
+    assert runner.name == "aa"
+    assert player.runner is runner
+
+
+def test_removed_player_stays_removed():
+    bowl = FishBowl()
+    player = Player("aa", bowl=bowl)
+
+    bowl.add_handler(player)
+    bowl.remove_handler(player)
+    assert player.env is None
+    assert player not in bowl.handlers
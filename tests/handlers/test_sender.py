@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from sardine_core import FishBowl, Sender
+
+
+@pytest.mark.asyncio
+async def test_call_timed_stopped():
+    fish_bowl = FishBowl()
+    sender = Sender()
+    fish_bowl.add_handler(sender)
+    calls = []
+
+    async def async_call():
+        calls.append("async")
+
+    # Nothing can be scheduled before the fish bowl starts
+    sender.call_timed(0, calls.append, "sync")
+    sender.call_timed(0, async_call)
+    assert not sender._timed_tasks
+
+    fish_bowl.start()
+    deadline = fish_bowl.clock.time + 0.01
+    sender.call_timed(deadline, calls.append, "sync")
+    sender.call_timed(deadline, async_call)
+    await asyncio.sleep(0.05)
+    fish_bowl.stop()
+
+    sender.call_timed(fish_bowl.clock.time, calls.append, "sync")
+    await asyncio.sleep(0.01)
+    assert sorted(calls) == ["async", "sync"]
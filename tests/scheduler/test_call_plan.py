@@ -0,0 +1,58 @@
+import pytest
+
+from sardine_core import CallPlan, FunctionState
+from sardine_core.scheduler.async_runner import _extract_new_period
+from sardine_core.scheduler.errors import BadPeriodError
+from sardine_core.utils import MISSING
+
+
+def sync_func(a, b=2, p=0.5): ...
+
+
+async def coro_func(a): ...
+
+
+def test_call_plan_introspection():
+    plan = CallPlan.from_function(sync_func)
+    assert plan.parameters == {"a", "b", "p"}
+    assert plan.default_period == 0.5
+    assert not plan.is_coroutine
+
+    plan = CallPlan.from_function(coro_func)
+    assert plan.default_period is MISSING
+    assert plan.is_coroutine
+
+
+def test_call_plan_filter_kwargs():
+    plan = CallPlan.from_function(sync_func)
+    assert plan.filter_kwargs({"a": 1, "c": 3, "p": 1}) == {"a": 1, "p": 1}
+
+
+@pytest.mark.parametrize(
+    "func,kwargs,expected",
+    [
+        (sync_func, {}, 0.5),
+        (sync_func, {"p": 2}, 2),
+        (sync_func, {"p": lambda: 3}, 3),
+        (coro_func, {}, 1),
+    ],
+)
+def test_call_plan_period(func, kwargs: dict, expected):
+    plan = CallPlan.from_function(func)
+    assert _extract_new_period(plan, kwargs, 1) == expected
+
+
+def test_call_plan_bad_period():
+    plan = CallPlan.from_function(sync_func)
+    with pytest.raises(BadPeriodError):
+        _extract_new_period(plan, {"p": 0}, 1)
+
+
+def test_function_state_plan_invalidation():
+    state = FunctionState(sync_func, (), {})
+    plan = state.plan
+    assert state.plan is plan
+
+    state.func = coro_func
+    assert state.plan is not plan
+    assert state.plan.func is coro_func
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from sardine_core import FishBowl
+
+
+@pytest.mark.asyncio
+async def test_deadline_order():
+    fish_bowl = FishBowl()
+    scheduler = fish_bowl.scheduler
+    fish_bowl.start()
+
+    start = fish_bowl.clock.time
+    woken = []
+
+    async def wait(offset: float):
+        await scheduler._wait_until(start + offset)
+        woken.append(offset)
+
+    # Pushing later deadlines first forces the timer to re-arm
+    await asyncio.gather(*(wait(offset) for offset in (0.06, 0.04, 0.02)))
+    fish_bowl.stop()
+
+    assert woken == [0.02, 0.04, 0.06]
+    assert not scheduler._deadlines
+
+
+@pytest.mark.asyncio
+async def test_deadline_early_resolve():
+    fish_bowl = FishBowl()
+    scheduler = fish_bowl.scheduler
+    fish_bowl.start()
+
+    start = fish_bowl.clock.time
+    reloaded = scheduler._wait_until(start + 10)
+    regular = scheduler._wait_until(start + 0.02)
+    reloaded.set_result(True)
+
+    assert await reloaded is True
+    assert await regular is False
+    fish_bowl.stop()
+
+    assert not scheduler._deadlines
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+from sardine_core import FishBowl, Sender
+from sardine_core.scheduler import AsyncRunner
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("timetags", [False, True])
+async def test_thread_executor(timetags: bool):
+    PERIOD = 0.5
+    TOLERANCE = 0.02
+
+    fish_bowl = FishBowl()
+    sender = Sender()
+    sender.timetags = timetags
+    fish_bowl.add_handler(sender)
+    clock = fish_bowl.clock
+    loop_thread = threading.get_ident()
+
+    heavy_threads: list[int] = []
+    sent: list[tuple[float, float, int, Optional[float]]] = []
+    light_lateness: list[float] = []
+
+    def record(deadline: float, timestamp: Optional[float] = None):
+        sent.append((deadline, clock.time, threading.get_ident(), timestamp))
+
+    def heavy(p=PERIOD):
+        heavy_threads.append(threading.get_ident())
+        deadline = clock.shifted_time
+        time.sleep(0.1)  # Blocks without holding the event loop
+        sender.call_timetagged(deadline, record, deadline)
+        heavy_runner.swim()
+
+    def light(p=PERIOD):
+        light_lateness.append(clock.time - light_runner._expected_time)
+        light_runner.swim()
+
+    heavy_runner = AsyncRunner("heavy")
+    heavy_runner.executor = "thread"
+    heavy_runner.push(heavy)
+
+    light_runner = AsyncRunner("light")
+    light_runner.push(light)
+
+    fish_bowl.start()
+    fish_bowl.scheduler.start_runner(heavy_runner)
+    fish_bowl.scheduler.start_runner(light_runner)
+    await asyncio.sleep(0.8)
+    fish_bowl.stop()
+
+    assert heavy_threads and loop_thread not in heavy_threads
+    assert sent
+    for deadline, sent_at, thread, timestamp in sent:
+        assert thread == loop_thread
+        if timetags:
+            # Sent right away, leaving the receiver to play it on time
+            assert timestamp is not None
+        else:
+            assert sent_at >= deadline - TOLERANCE
+            assert timestamp is None
+
+    assert light_lateness
+    assert max(light_lateness) < TOLERANCE
+
+
+def crunch(n: int = 10_000, p=0.25) -> int:
+    # Defined at the top level so that process pools can pickle it
+    return sum(i * i for i in range(n))
+
+
+@pytest.mark.asyncio
+async def test_process_executor():
+    fish_bowl = FishBowl()
+    runner = AsyncRunner("process")
+    runner.executor = "process"
+    runner.push(crunch)
+
+    fish_bowl.start()
+    fish_bowl.scheduler.start_runner(runner)
+    await asyncio.sleep(1)
+    fish_bowl.stop()
+
+    # The runner keeps swimming although crunch() never calls swim()
+    assert runner.stats.iterations >= 3
+
+
+def test_executor_validation():
+    runner = AsyncRunner("validation")
+    runner.executor = "thread"
+    runner.executor = None
+
+    with pytest.raises(ValueError):
+        runner.executor = "gpu"
@@ -0,0 +1,47 @@
+import asyncio
+import math
+
+import pytest
+
+from sardine_core import FishBowl
+from sardine_core.scheduler import AsyncRunner
+
+
+@pytest.mark.asyncio
+async def test_lookahead_shift():
+    PERIOD = 0.5
+    LOOKAHEAD = 2
+    TOLERANCE = 0.02
+
+    fish_bowl = FishBowl()
+    fish_bowl.scheduler.deferred = False
+    clock = fish_bowl.clock
+    calls: list[tuple[float, float]] = []
+
+    def func(p=PERIOD):
+        # Read from the frozen snapshot so both times come from one reading
+        now = clock.snapshot()
+        calls.append((now.time, now.shifted_time))
+        runner.swim()
+
+    runner = AsyncRunner("lookahead")
+    runner.lookahead = LOOKAHEAD
+    runner.push(func)
+
+    fish_bowl.start()
+    fish_bowl.scheduler.start_runner(runner)
+    await asyncio.sleep(0.6)
+    fish_bowl.stop()
+
+    period = PERIOD * clock.beat_duration
+    lead = LOOKAHEAD * clock.beat_duration
+    assert len(calls) > LOOKAHEAD / PERIOD
+
+    # Iterations are called ahead of time, but messages stay on the grid
+    for (time, shifted), (_, next_shifted) in zip(calls, calls[1:]):
+        assert shifted - time <= lead + TOLERANCE
+        assert math.isclose(next_shifted - shifted, period, abs_tol=1e-3)
+
+    # Once caught up, runners stay the full lookahead ahead of time
+    time, shifted = calls[-1]
+    assert math.isclose(shifted - time, lead, abs_tol=TOLERANCE)
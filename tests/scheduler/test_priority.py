@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from sardine_core import AsyncRunner, FishBowl
+
+
+def test_priority_validation():
+    runner = AsyncRunner("test")
+    assert runner.priority == "normal"
+
+    runner.priority = "critical"
+    assert runner.priority == "critical"
+
+    with pytest.raises(ValueError):
+        runner.priority = "urgent"
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    fish_bowl = FishBowl()
+    scheduler = fish_bowl.scheduler
+    fish_bowl.start()
+
+    deadline = fish_bowl.clock.time + 0.02
+    woken = []
+    futures = [scheduler._wait_until(deadline, priority) for priority in (2, 0, 1)]
+    for priority, future in zip((2, 0, 1), futures):
+        future.add_done_callback(lambda _, priority=priority: woken.append(priority))
+
+    await asyncio.gather(*futures)
+    fish_bowl.stop()
+
+    assert woken == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_best_effort_shedding():
+    fish_bowl = FishBowl()
+    scheduler = fish_bowl.scheduler
+    scheduler.deferred = False
+    # Every wake up counts as late
+    scheduler.shed_threshold = -1
+    fish_bowl.start()
+
+    calls = {"normal": 0, "best-effort": 0}
+    runners = {}
+
+    def make_func(runner: AsyncRunner):
+        def func(p=0.1):
+            calls[runner.priority] += 1
+            runner.swim()
+
+        return func
+
+    for priority in calls:
+        runner = runners[priority] = AsyncRunner(priority)
+        runner.priority = priority
+        runner.push(make_func(runner))
+        scheduler.start_runner(runner)
+
+    await asyncio.sleep(0.2)
+    fish_bowl.stop()
+
+    assert calls["normal"] > 0
+    assert calls["best-effort"] == 0
+    assert runners["best-effort"].stats.shed > 0
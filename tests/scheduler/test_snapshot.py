@@ -0,0 +1,67 @@
+import asyncio
+import contextvars
+import time
+
+import pytest
+
+from sardine_core import ClockSnapshot, FishBowl
+from sardine_core.scheduler import AsyncRunner
+
+
+@pytest.mark.asyncio
+async def test_clock_snapshot():
+    fish_bowl = FishBowl()
+    clock = fish_bowl.clock
+    fish_bowl.start()
+    await asyncio.sleep(0.1)
+
+    now = clock.snapshot()
+    assert isinstance(now, ClockSnapshot)
+    assert now.beat_duration == clock.beat_duration
+    assert now.bar == now.beat // now.beats_per_bar
+    assert 0 <= now.phase < now.beat_duration
+
+    # Without freezing, every snapshot is taken at the current time
+    time.sleep(0.01)
+    assert clock.snapshot().time > now.time
+
+    def frozen():
+        snapshot = clock.freeze()
+        time.sleep(0.01)
+        assert clock.snapshot() is snapshot
+
+        # Virtual sleeps move the frozen time forward
+        fish_bowl.time.shift += clock.beat_duration
+        shifted = clock.snapshot()
+        assert shifted.time == snapshot.time
+        assert shifted.beat == snapshot.beat + 1
+        return shifted
+
+    shifted = contextvars.copy_context().run(frozen)
+    assert clock.snapshot() is not shifted
+    fish_bowl.stop()
+
+
+@pytest.mark.asyncio
+async def test_runner_freezes_clock():
+    fish_bowl = FishBowl()
+    clock = fish_bowl.clock
+    calls: list[tuple[ClockSnapshot, ClockSnapshot]] = []
+
+    def func(p=0.5):
+        before = clock.snapshot()
+        time.sleep(0.005)
+        calls.append((before, clock.snapshot()))
+        runner.swim()
+
+    runner = AsyncRunner("frozen")
+    runner.push(func)
+
+    fish_bowl.start()
+    fish_bowl.scheduler.start_runner(runner)
+    await asyncio.sleep(0.3)
+    fish_bowl.stop()
+
+    assert calls
+    for before, after in calls:
+        assert before is after
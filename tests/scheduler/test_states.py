@@ -0,0 +1,38 @@
+import pytest
+
+from sardine_core import AsyncRunner, FishBowl, FunctionState
+
+
+def func(p=1): ...
+
+
+def test_states_are_capped():
+    runner = AsyncRunner("test")
+    for i in range(AsyncRunner.MAX_FUNCTION_STATES + 2):
+        runner.push(func, i)
+
+    assert len(runner.states) == AsyncRunner.MAX_FUNCTION_STATES
+    assert [state.args for state in runner.states] == [(2,), (3,), (4,)]
+
+
+def test_records_are_slotted():
+    runner = AsyncRunner("test")
+    runner.push(func)
+
+    assert not hasattr(runner, "__dict__")
+    assert not hasattr(runner.states[-1], "__dict__")
+    assert isinstance(runner.states[-1], FunctionState)
+
+
+def test_interval_shift_is_deprecated():
+    fish_bowl = FishBowl()
+    fish_bowl.clock.tempo = 120
+    runner = AsyncRunner("test")
+    runner.scheduler = fish_bowl.scheduler
+
+    with pytest.deprecated_call():
+        runner.interval_shift = 0.25
+    assert runner.beat_shift == 0.5
+
+    with pytest.deprecated_call():
+        assert runner.interval_shift == 0.25
@@ -0,0 +1,57 @@
+import copy
+
+import pytest
+
+from sardine_core.scheduler import Histogram, RunnerStats
+
+
+def test_histogram_buckets():
+    hist = Histogram(bounds=(0.001, 0.01, 0.1))
+    for value in (-0.5, 0.0005, 0.005, 0.005, 0.05, 2.0):
+        hist.record(value)
+
+    assert hist.counts == [2, 2, 1, 1]
+    assert hist.count == 6
+    assert hist.maximum == 2.0
+    assert hist.mean == pytest.approx(1.5605 / 6)
+
+
+@pytest.mark.parametrize(
+    "q,expected",
+    [
+        (0, 0.001),
+        (20, 0.001),
+        (40, 0.01),
+        (90, 0.1),
+        (100, 0.5),
+    ],
+)
+def test_histogram_percentile(q: float, expected: float):
+    hist = Histogram(bounds=(0.001, 0.01, 0.1))
+    for value in (0.0005, 0.0005, 0.005, 0.005, 0.05, 0.05, 0.05, 0.05, 0.05, 0.5):
+        hist.record(value)
+
+    assert hist.percentile(q) == expected
+
+
+def test_histogram_percentile_skips_empty_buckets():
+    hist = Histogram(bounds=(0.001, 0.01, 0.1))
+    for value in (0.005, 0.05):
+        hist.record(value)
+
+    assert hist.percentile(0) == 0.01
+    assert hist.percentile(50) == 0.01
+    assert hist.percentile(100) == 0.05
+
+
+def test_runner_stats_reset():
+    stats = RunnerStats()
+    stats.lateness.record(0.002)
+    stats.iterations += 1
+    snapshot = copy.deepcopy(stats)
+    stats.reset()
+
+    assert stats.iterations == 0
+    assert stats.lateness.count == 0
+    assert snapshot.iterations == 1
+    assert snapshot.lateness.count == 1
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from sardine_core import AsyncRunner, FishBowl
+
+
+def _recorder(bowl: FishBowl, runner: AsyncRunner, calls: list):
+    def func(name: str, p=0.5):
+        calls.append((name, bowl.clock.time))
+        runner.swim()
+
+    return func
+
+
+@pytest.mark.asyncio
+async def test_timeline_arms_one_entry_per_runner():
+    bowl = FishBowl()
+    bowl.scheduler.deferred = False
+    timeline = bowl.scheduler.timeline
+    bowl.start()
+
+    calls = []
+    runner = AsyncRunner("arrangement")
+    func = _recorder(bowl, runner, calls)
+    start = bowl.clock.time
+
+    entries = timeline.extend(
+        (start + offset, runner, func, {"name": name})
+        for offset, name in ((0.15, "c"), (0.05, "a"), (0.1, "b"))
+    )
+    assert len(timeline) == 3
+    assert len(runner.deferred_states) == 1
+    assert timeline.next_deadline(runner) == entries[1].deadline
+
+    await asyncio.sleep(0.25)
+    bowl.stop()
+
+    assert [name for name, _ in calls] == ["a", "b", "c"]
+    for (_, time), offset in zip(calls, (0.05, 0.1, 0.15)):
+        assert time == pytest.approx(start + offset, abs=0.01)
+    assert len(timeline) == 0
+    assert all(entry.arrived for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_timeline_insert_and_cancel():
+    bowl = FishBowl()
+    bowl.scheduler.deferred = False
+    timeline = bowl.scheduler.timeline
+    bowl.start()
+
+    calls = []
+    runner = AsyncRunner("arrangement")
+    func = _recorder(bowl, runner, calls)
+    start = bowl.clock.time
+
+    late = timeline.add(start + 0.1, runner, func, name="late")
+    # An earlier entry replaces the one pushed onto the runner
+    early = timeline.add(start + 0.05, runner, func, name="early")
+    assert runner.deferred_states[0].state.kwargs == {"name": "early"}
+
+    assert timeline.cancel(early)
+    assert not timeline.cancel(early)
+    assert runner.deferred_states[0].state.kwargs == {"name": "late"}
+
+    await asyncio.sleep(0.15)
+    bowl.stop()
+
+    assert [name for name, _ in calls] == ["late"]
+    assert not timeline.cancel(late)
+
+
+@pytest.mark.asyncio
+async def test_timeline_cleared_by_stop_runner():
+    bowl = FishBowl()
+    timeline = bowl.scheduler.timeline
+    bowl.start()
+
+    runner = AsyncRunner("arrangement")
+    start = bowl.clock.time
+    entries = [timeline.add(start + i, runner, lambda: None) for i in range(1, 4)]
+
+    bowl.scheduler.stop_runner(runner)
+    bowl.stop()
+
+    assert len(timeline) == 0
+    assert all(entry.cancelled for entry in entries)
+    assert not runner.deferred_states
+
+
+@pytest.mark.asyncio
+async def test_timeline_ends_when_runner_stops_swimming():
+    bowl = FishBowl()
+    bowl.scheduler.deferred = False
+    timeline = bowl.scheduler.timeline
+    bowl.start()
+
+    calls = []
+    runner = AsyncRunner("arrangement")
+    start = bowl.clock.time
+
+    def once(p=0.5):
+        calls.append("once")
+
+    first = timeline.add(start + 0.05, runner, once)
+    second = timeline.add(start + 0.1, runner, once)
+
+    await asyncio.sleep(0.15)
+    bowl.stop()
+
+    assert calls == ["once"]
+    assert first.arrived and second.cancelled
+    assert len(timeline) == 0
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+from sardine_core import (
+    AsyncRunner,
+    FishBowl,
+    Player,
+    RecordedMessage,
+    RecordingSender,
+    VirtualClock,
+)
+from sardine_core.event_loop import VirtualEventLoop
+
+
+def _run_session(duration: float) -> tuple[list[float], list[RecordedMessage]]:
+    async def session():
+        fish_bowl = FishBowl(clock=VirtualClock(tempo=120))
+        clock = fish_bowl.clock
+        recorder = RecordingSender()
+        fish_bowl.add_handler(recorder)
+        fish_bowl.start()
+
+        runner_times: list[float] = []
+
+        def func(p=0.5):
+            runner_times.append(clock.time)
+            runner.swim()
+
+        runner = AsyncRunner("virtual")
+        runner.push(func)
+        fish_bowl.scheduler.start_runner(runner)
+
+        player = Player("rec", bowl=fish_bowl)
+        player * Player._play_factory(
+            recorder, recorder.send, note=[60, 62, 64], p=0.25
+        )
+
+        await asyncio.sleep(duration)
+        fish_bowl.stop()
+        await asyncio.sleep(1)
+        return runner_times, recorder.messages
+
+    loop = VirtualEventLoop()
+    try:
+        return loop.run_until_complete(session())
+    finally:
+        loop.close()
+
+
+def test_virtual_session():
+    start = time.perf_counter()
+    runner_times, messages = _run_session(600)
+    assert time.perf_counter() - start < 30
+
+    # Runners wake up exactly on their deadlines, every quarter of a second
+    assert len(runner_times) >= 2000
+    for a, b in zip(runner_times, runner_times[1:]):
+        assert abs(b - a - 0.25) < 1e-6
+
+    # Recorded messages are sent exactly on their deadlines, on the beat grid
+    assert len(messages) >= 500
+    assert [m.message["note"] for m in messages[:4]] == [60, 62, 64, 60]
+    for message in messages:
+        assert message.time == message.deadline
+        assert abs(message.beat - round(message.beat * 4) / 4) < 1e-6
+
+    # Runs are reproducible
+    assert _run_session(600) == (runner_times, messages)